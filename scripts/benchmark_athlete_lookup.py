@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Single-Athlete Lookup Micro-Benchmark
+Compares the old full-frame boolean scan with the checker's (Person, Sport) row index
+
+Usage: python scripts/benchmark_athlete_lookup.py [--scale N] [--repeat N]
+  --scale N   replicate the roster N times under new athlete names (default 1)
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import pandas as pd
+
+# Change to project root directory and make src importable
+os.chdir(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, 'src')
+
+from data_loader import load_results
+from multi_sport_qualification_checker import MultiSportQualificationChecker
+
+def replicate_roster(df, scale):
+    """Copy the results `scale` times, renaming athletes so each copy is a new roster"""
+    if scale <= 1:
+        return df
+    copies = []
+    for copy_number in range(scale):
+        copy = df.copy()
+        copy['Person'] = copy['Person'].astype(object) + ('' if copy_number == 0 else f' #{copy_number}')
+        copies.append(copy)
+    return pd.concat(copies, ignore_index=True)
+
+def full_scan(df_ranked, athlete_name, sport):
+    """Athlete rows the way the sport methods selected them before the row index"""
+    return df_ranked[
+        (df_ranked['Person'] == athlete_name) &
+        (df_ranked['Sport'] == sport) &
+        (df_ranked['Is Olympic Discipline'] == 'Yes') &
+        (df_ranked['Team Members'] == 'No') &
+        (df_ranked['Class'] == 'Seniors')
+    ]
+
+def indexed(checker, athlete_name, sport):
+    """Athlete rows via the checker's row index"""
+    athlete_rows = checker._athlete_rows(athlete_name, sport)
+    return athlete_rows[
+        (athlete_rows['Is Olympic Discipline'] == 'Yes') &
+        (athlete_rows['Team Members'] == 'No') &
+        (athlete_rows['Class'] == 'Seniors')
+    ]
+
+def time_per_call(function, samples, repeat):
+    """Best-of-`repeat` mean latency per call in milliseconds"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for athlete_name, sport in samples:
+            function(athlete_name, sport)
+        best = min(best, (time.perf_counter() - start) / len(samples))
+    return best * 1000
+
+def main():
+    """Run the single-athlete lookup benchmark"""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--scale', type=int, default=1, help='replicate the roster N times')
+    parser.add_argument('--repeat', type=int, default=5, help='timing repetitions (best is reported)')
+    parser.add_argument('--samples', type=int, default=50, help='athlete/sport pairs per repetition')
+    args = parser.parse_args()
+
+    print("⏱️ SINGLE-ATHLETE LOOKUP BENCHMARK")
+    print("=" * 60)
+
+    df = replicate_roster(load_results(), args.scale)
+    start = time.perf_counter()
+    checker = MultiSportQualificationChecker(df)
+    build_ms = (time.perf_counter() - start) * 1000
+
+    pairs = df[['Person', 'Sport']].dropna().drop_duplicates()
+    pairs = pairs.sample(min(args.samples, len(pairs)), random_state=0)
+    samples = list(pairs.itertuples(index=False, name=None))
+
+    # Both selections must return the same rows before timing them
+    for athlete_name, sport in samples:
+        assert full_scan(checker.df_ranked, athlete_name, sport).index.equals(
+            indexed(checker, athlete_name, sport).index
+        ), f'Row index mismatch for {athlete_name} ({sport})'
+
+    scan_ms = time_per_call(lambda name, sport: full_scan(checker.df_ranked, name, sport), samples, args.repeat)
+    index_ms = time_per_call(lambda name, sport: indexed(checker, name, sport), samples, args.repeat)
+    check_ms = time_per_call(checker.check_qualification, samples, args.repeat)
+
+    print(f"Rows: {len(df):,} | Athletes: {df['Person'].nunique():,} | Checker build: {build_ms:.1f} ms")
+    print("-" * 60)
+    print(f"{'Full-frame scan (before)':<32} {scan_ms:>10.3f} ms/lookup")
+    print(f"{'Row index (after)':<32} {index_ms:>10.3f} ms/lookup")
+    print(f"{'Speedup':<32} {scan_ms / index_ms:>10.1f}x")
+    print(f"{'check_qualification (after)':<32} {check_ms:>10.3f} ms/call")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Athlete Search Index Check & Benchmark
+Checks that every athlete is found by an accent-free spelling of the name and
+times index build and query latency on a large synthetic multi-nation roster
+
+Usage: python scripts/benchmark_athlete_search.py [--athletes N] [--queries N]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+# Change to project root directory and make src importable
+os.chdir(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, 'src')
+
+from athlete_search import AthleteSearchIndex, fold
+from data_loader import load_results
+from synthetic_results import athlete_pool, load_templates
+
+def typo(text, rng):
+    """Drop one letter of the longest word, as a quick typing mistake"""
+    words = text.split()
+    longest = max(range(len(words)), key=lambda i: len(words[i]))
+    word = words[longest]
+    if len(word) > 4:
+        cut = rng.integers(1, len(word) - 1)
+        words[longest] = word[:cut] + word[cut + 1:]
+    return ' '.join(words)
+
+def main():
+    """Run the search index check and benchmark"""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--athletes', type=float, default=50_000, help='synthetic roster size')
+    parser.add_argument('--queries', type=int, default=500, help='timed queries')
+    args = parser.parse_args()
+
+    print("🔎 ATHLETE SEARCH INDEX CHECK")
+    print("=" * 60)
+
+    # Every real athlete must come first for the accent-folded spelling of the name
+    df = load_results()
+    index = AthleteSearchIndex.from_results(df)
+    misses = [name for name in index.names if index.resolve(fold(name)) != name]
+    for name in misses:
+        print(f"❌ '{fold(name)}' does not find {name} first: {index.search(fold(name), limit=3)}")
+
+    # Large roster: real first and last names, all nations
+    templates = load_templates()
+    pool = athlete_pool(templates, int(args.athletes), swiss_share=0.1)
+    start = time.perf_counter()
+    large = AthleteSearchIndex(pool['Person'].str.replace(r' #\d+$', '', regex=True))
+    build_s = time.perf_counter() - start
+
+    rng = np.random.default_rng(0)
+    picks = rng.choice(large.names, size=args.queries)
+    queries = [typo(fold(name), rng) if i % 2 else fold(name).split()[-1][:4] for i, name in enumerate(picks)]
+    latencies = []
+    for query in queries:
+        start = time.perf_counter()
+        large.search(query)
+        latencies.append(time.perf_counter() - start)
+    latencies = np.array(latencies) * 1000
+
+    print(f"Athletes: {len(large.names):,} distinct names | Vocabulary: {len(large.vocabulary):,} tokens")
+    print("-" * 60)
+    print(f"{'Index build':<28} {build_s * 1000:>10.1f} ms (once per dataset version)")
+    print(f"{'Query latency median':<28} {np.median(latencies):>10.3f} ms")
+    print(f"{'Query latency p95':<28} {np.percentile(latencies, 95):>10.3f} ms")
+    print("-" * 60)
+
+    if misses:
+        print(f"❌ {len(misses)} of {len(index.names)} athletes not found first")
+        sys.exit(1)
+    print(f"✅ All {len(index.names)} athletes found first by their accent-free name")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+What-If Scenario Check & Benchmark
+Checks that MultiSportQualificationChecker.simulate finds exactly the route
+changes of a full re-run (a checker rebuilt with the changed window, or with the
+hypothetical results ingested) and times a batch of scenarios against re-runs
+
+Usage: python scripts/benchmark_scenarios.py [--scale N] [--scenarios N] [--reruns N]
+  --scale N   replicate the roster N times under new athlete names (default 1)
+"""
+
+import argparse
+import copy
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+# Change to project root directory and make src importable
+os.chdir(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, 'src')
+
+from benchmark_athlete_lookup import replicate_roster
+from data_loader import load_results
+from multi_sport_qualification_checker import MultiSportQualificationChecker, Scenario, scenario_result
+
+KEY = ['Person', 'Sport', 'Group', 'Route']
+
+def route_changes(before, after):
+    """(Person, Sport, Group, Route, qualified after) of routes whose flag differs between two evaluate_all frames"""
+    diff = before[KEY + ['qualified']].merge(after[KEY + ['qualified']], on=KEY, how='outer', suffixes=('_before', '_after'))
+    changed = diff['qualified_before'].fillna(False).astype(bool) != diff['qualified_after'].fillna(False).astype(bool)
+    return changes_set(diff[changed].rename(columns={'qualified_after': 'qualified'}))
+
+def changes_set(frame):
+    return set(zip(frame['Person'], frame['Sport'], frame['Group'].fillna(''), frame['Route'],
+                   frame['qualified'].fillna(False).astype(bool)))
+
+def window_scenarios(plan):
+    """Biathlon World Cup 25/26 window closing on each day of January 2026"""
+    window = plan.windows['Biathlon']['World Cup 25/26']
+    return [
+        Scenario(f'window closes 2026-01-{day:02d}', windows={
+            ('Biathlon', 'World Cup 25/26'): {'dates': (window['dates'][0], f'2026-01-{day:02d}')}
+        })
+        for day in range(1, 19)
+    ]
+
+def result_scenarios(df, count, rng):
+    """One hypothetical Biathlon World Cup result per scenario, random athlete and rank"""
+    athletes = df.loc[df['Sport'] == 'Biathlon', 'Person'].astype(object).unique()
+    return [
+        Scenario(f'{athlete} finishes {rank}', results=[
+            scenario_result(athlete, 'Biathlon', 'BMW IBU World Cup', '2026-01-15', int(rank), Discipline='Sprint')
+        ])
+        for athlete, rank in zip(rng.choice(athletes, count), rng.integers(1, 40, count))
+    ]
+
+def main():
+    """Run the scenario check and benchmark"""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--scale', type=int, default=1, help='replicate the roster N times')
+    parser.add_argument('--scenarios', type=int, default=5000, help='hypothetical-result scenarios in the batch')
+    parser.add_argument('--reruns', type=int, default=10, help='scenarios checked against a full re-run')
+    args = parser.parse_args()
+
+    print("🔮 WHAT-IF SCENARIO CHECK")
+    print("=" * 60)
+
+    df = load_results()
+    if args.scale > 1:
+        df = replicate_roster(df, args.scale)
+    checker = MultiSportQualificationChecker(df)
+    base = checker.evaluate_all()
+    rng = np.random.default_rng(0)
+    windows = window_scenarios(checker.criteria)
+    results = result_scenarios(df, args.scenarios, rng)
+
+    start = time.perf_counter()
+    simulated = checker.simulate(windows + results)
+    simulate_s = time.perf_counter() - start
+    routes = {name: frame for name, frame in simulated.routes.groupby('scenario', sort=False)}
+    empty = simulated.routes.iloc[0:0]
+
+    # Full re-runs: a checker compiled with the changed window, or a fresh checker ingesting the results
+    mismatches = 0
+    rerun_s = 0.0
+    checks = windows[:max(1, args.reruns // 2)] + results[:args.reruns - args.reruns // 2]
+    for scenario in checks:
+        start = time.perf_counter()
+        if scenario.windows:
+            plan = copy.deepcopy(checker.criteria)
+            for (sport, window), spec in scenario.windows.items():
+                plan.windows[sport][window] = {**plan.windows[sport][window], **spec}
+            expected = route_changes(base, MultiSportQualificationChecker(df, criteria=plan).evaluate_all())
+        else:
+            changes = MultiSportQualificationChecker(df).ingest(pd.DataFrame(scenario.results))
+            expected = changes_set(changes.rename(columns={'qualified_after': 'qualified'}))
+        rerun_s += time.perf_counter() - start
+
+        actual = changes_set(routes.get(scenario.name, empty).rename(columns={'qualified_after': 'qualified'}))
+        if actual != expected:
+            mismatches += 1
+            print(f"❌ {scenario.name}: simulate {sorted(actual)} != re-run {sorted(expected)}")
+
+    scenario_count = len(windows) + len(results)
+    print(f"Rows: {len(df):,} | Athletes: {df['Person'].nunique():,} | Scenarios: {scenario_count:,}")
+    print("-" * 60)
+    print(f"{'Full re-run':<32} {rerun_s / len(checks) * 1000:>10.1f} ms/scenario")
+    print(f"{'simulate (batch)':<32} {simulate_s / scenario_count * 1000:>10.3f} ms/scenario")
+    print(f"{'Speedup':<32} {rerun_s / len(checks) / (simulate_s / scenario_count):>10.0f}x")
+    print(f"{'Route changes found':<32} {len(simulated.routes):>10,}")
+    print("-" * 60)
+
+    if mismatches:
+        print(f"❌ {mismatches} of {len(checks)} scenarios differ from a full re-run")
+        sys.exit(1)
+    print(f"✅ Identical route changes for all {len(checks)} re-run scenarios")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Qualification Pipeline Benchmark Suite
+Times loading, checker construction, single-athlete checks and full-roster
+evaluation on synthetic result sets of increasing size
+
+Usage: python scripts/benchmark_suite.py [--rows 10000 100000 ...] [--save FILE] [--baseline FILE]
+  --save FILE       write the timings as JSON, e.g. as the next baseline
+  --baseline FILE   compare against saved timings; exit 1 on regressions
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+# Change to project root directory and make src importable
+os.chdir(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, 'src')
+
+from data_loader import HAS_PYARROW, convert_results, load_results, read_store
+from multi_sport_qualification_checker import MultiSportQualificationChecker
+from synthetic_results import iter_synthetic_results, load_templates, write_results_csv
+
+def best_of(function, repeat):
+    """Best wall time of `repeat` runs in seconds, plus the last return value"""
+    best, value = float('inf'), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        value = function()
+        best = min(best, time.perf_counter() - start)
+    return best, value
+
+def benchmark_size(rows, templates, workdir, repeat, samples):
+    """All pipeline timings for one synthetic result set"""
+    csv_path = os.path.join(workdir, f'results_{rows}.csv')
+    write_results_csv(iter_synthetic_results(rows, templates=templates), csv_path)
+    timings = {}
+
+    timings['load_csv'], df = best_of(lambda: load_results(csv_path, use_cache=False), repeat)
+    if HAS_PYARROW:
+        store_path = os.path.join(workdir, f'results_{rows}.feather')
+        convert_results(csv_path, store_path)
+        timings['load_store'], _ = best_of(lambda: read_store(store_path), repeat)
+
+    timings['checker_build'], checker = best_of(lambda: MultiSportQualificationChecker(df), repeat)
+
+    athletes = df['Person'].dropna().drop_duplicates().sample(
+        min(samples, df['Person'].nunique()), random_state=0
+    ).tolist()
+    # Results are lazy; to_dict evaluates every sport of the athlete
+    single, _ = best_of(lambda: [checker.check_athlete_qualification(name).to_dict() for name in athletes], repeat)
+    timings['single_athlete'] = single / len(athletes)
+
+    # Cold evaluation on fresh checkers includes the bitmap and counter builds
+    fresh = iter([MultiSportQualificationChecker(df) for _ in range(repeat)])
+    timings['evaluate_all'], _ = best_of(lambda: next(fresh).evaluate_all(), repeat)
+    return timings
+
+def main():
+    """Run the benchmark suite"""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=float, nargs='+', default=[10_000, 100_000], help='result set sizes')
+    parser.add_argument('--repeat', type=int, default=3, help='timing repetitions (best is reported)')
+    parser.add_argument('--samples', type=int, default=50, help='athletes timed for single-athlete checks')
+    parser.add_argument('--save', help='write timings to this JSON file')
+    parser.add_argument('--baseline', help='compare against timings in this JSON file')
+    parser.add_argument('--tolerance', type=float, default=0.25, help='allowed slowdown vs baseline (0.25 = 25%%)')
+    args = parser.parse_args()
+
+    print("⏱️ QUALIFICATION PIPELINE BENCHMARK SUITE")
+    print("=" * 78)
+
+    templates = load_templates()
+    results = {}
+    with tempfile.TemporaryDirectory() as workdir:
+        for rows in (int(value) for value in args.rows):
+            results[str(rows)] = benchmark_size(rows, templates, workdir, args.repeat, args.samples)
+
+    metrics = list(next(iter(results.values())))
+    print(f"{'Rows':>12} " + ' '.join(f'{metric:>13}' for metric in metrics))
+    for rows, timings in results.items():
+        print(f"{int(rows):>12,} " + ' '.join(f'{timings[metric] * 1000:>10.2f} ms' for metric in metrics))
+
+    if args.save:
+        with open(args.save, 'w') as handle:
+            json.dump(results, handle, indent=2)
+        print(f"\n💾 Timings saved to {args.save}")
+
+    if args.baseline:
+        with open(args.baseline) as handle:
+            baseline = json.load(handle)
+        regressions = [
+            (rows, metric, baseline[rows][metric], seconds)
+            for rows, timings in results.items() if rows in baseline
+            for metric, seconds in timings.items()
+            if metric in baseline[rows] and seconds > baseline[rows][metric] * (1 + args.tolerance)
+        ]
+        print("-" * 78)
+        for rows, metric, before, after in regressions:
+            print(f"❌ {metric} at {int(rows):,} rows: {before * 1000:.2f} ms -> {after * 1000:.2f} ms")
+        if regressions:
+            sys.exit(1)
+        print(f"✅ No regressions beyond {args.tolerance:.0%} of {args.baseline}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Selection-Window Bitmap Regression Check & Benchmark
+Proves the checker's precomputed window/rank bitmaps count exactly what the old
+string-literal comparisons counted, and times both on a replicated roster
+
+Usage: python scripts/benchmark_window_bitmaps.py [--scale N] [--samples N]
+  --scale N   replicate the roster N times under new athlete names (default 100)
+"""
+
+import argparse
+import os
+import sys
+import time
+
+# Change to project root directory and make src importable
+os.chdir(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, 'src')
+
+from benchmark_athlete_lookup import replicate_roster
+from data_loader import load_results
+from multi_sport_qualification_checker import MultiSportQualificationChecker
+
+def literal_window_count(athlete_data, window, rank):
+    """Route counter the way the sport methods computed it before the bitmaps"""
+    mask = athlete_data['Rank_Clean'] <= rank
+    if 'comp' in window:
+        mask &= athlete_data['Comp.SetDetail'] == window['comp']
+    if 'year' in window:
+        mask &= athlete_data['Year'] == window['year']
+    if 'dates' in window:
+        start, end = window['dates']
+        mask &= (athlete_data['Date'] >= start) & (athlete_data['Date'] <= end)
+    for column, value in window.get('filters', ()):
+        mask &= athlete_data[column] == value
+    return len(athlete_data[mask])
+
+def literal_counts(checker, athlete_name, sport):
+    """All route counters of one athlete via base-filter masks and string literals"""
+    athlete_rows = checker._athlete_rows(athlete_name, sport)
+    mask = athlete_rows['Sport'] == sport
+    for column, accepted in checker.criteria.filters[sport].items():
+        mask &= athlete_rows[column].isin(accepted)
+    athlete_data = athlete_rows[mask]
+    windows = checker.criteria.windows[sport]
+    return {
+        name: literal_window_count(athlete_data, windows[window], rank)
+        for name, (window, rank) in checker.criteria.counters[sport].items()
+    }
+
+def bitmap_counts(checker, athlete_name, sport):
+    """All route counters of one athlete via the precomputed bitmaps"""
+    positions = checker._athlete_positions(athlete_name, sport)
+    return {
+        name: checker._window_count(positions, sport, window, rank)
+        for name, (window, rank) in checker.criteria.counters[sport].items()
+    }
+
+def main():
+    """Run the bitmap regression check and benchmark"""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--scale', type=int, default=100, help='replicate the roster N times')
+    parser.add_argument('--samples', type=int, default=300, help='athlete/sport pairs to compare and time')
+    args = parser.parse_args()
+
+    print("🧮 SELECTION-WINDOW BITMAP CHECK")
+    print("=" * 60)
+
+    df = replicate_roster(load_results(), args.scale)
+    checker = MultiSportQualificationChecker(df)
+
+    # Warm every bitmap once; this is the one-off precomputation cost
+    start = time.perf_counter()
+    for sport, counters in checker.criteria.counters.items():
+        checker._bitmap(('sport', sport))
+        for window, rank in counters.values():
+            checker._bitmap(('window', sport, window))
+            checker._bitmap(('rank', rank))
+    build_ms = (time.perf_counter() - start) * 1000
+
+    pairs = df[df['Sport'].isin(list(checker.criteria.counters))][['Person', 'Sport']].dropna().drop_duplicates()
+    pairs = pairs.sample(min(args.samples, len(pairs)), random_state=0)
+    samples = list(pairs.astype(object).itertuples(index=False, name=None))
+
+    mismatches = 0
+    literal_s = bitmap_s = 0.0
+    for athlete_name, sport in samples:
+        start = time.perf_counter()
+        expected = literal_counts(checker, athlete_name, sport)
+        literal_s += time.perf_counter() - start
+
+        start = time.perf_counter()
+        actual = bitmap_counts(checker, athlete_name, sport)
+        bitmap_s += time.perf_counter() - start
+
+        if expected != actual:
+            mismatches += 1
+            print(f"❌ {athlete_name} ({sport}): literal {expected} != bitmap {actual}")
+
+    start = time.perf_counter()
+    outcomes = checker.evaluate_all()
+    evaluate_ms = (time.perf_counter() - start) * 1000
+
+    print(f"Rows: {len(df):,} | Athletes: {df['Person'].nunique():,} | Bitmaps: {len(checker._bitmaps)}")
+    print("-" * 60)
+    print(f"{'Bitmap precomputation':<32} {build_ms:>10.1f} ms (once)")
+    print(f"{'String-literal counters':<32} {literal_s / len(samples) * 1000:>10.3f} ms/athlete")
+    print(f"{'Bitmap counters':<32} {bitmap_s / len(samples) * 1000:>10.3f} ms/athlete")
+    print(f"{'Speedup':<32} {literal_s / bitmap_s:>10.1f}x")
+    print(f"{'evaluate_all (warm bitmaps)':<32} {evaluate_ms:>10.1f} ms for {len(outcomes):,} route rows")
+    print("-" * 60)
+
+    if mismatches:
+        print(f"❌ {mismatches} of {len(samples)} athlete/sport pairs differ")
+        sys.exit(1)
+    print(f"✅ Identical counters for all {len(samples)} sampled athlete/sport pairs")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+Criteria Parity Check
+Proves evaluate_all (bitmap counters, batch route rules) and the per-athlete
+checks give exactly what a plain row scan of the compiled criteria files gives,
+for every athlete, sport and route
+
+Usage: python scripts/check_criteria_parity.py [--scale N] [--samples N]
+  --scale N   replicate the roster N times under new athlete names (default 1)
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+# Change to project root directory and make src importable
+os.chdir(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, 'src')
+
+from benchmark_athlete_lookup import replicate_roster
+from criteria_compiler import MIN_AGE
+from data_loader import load_results
+from multi_sport_qualification_checker import MultiSportQualificationChecker
+
+KEY = ['Person', 'Sport', 'Group', 'Route']
+COMPARED = ['qualified', 'details', 'note', 'best_score', 'threshold']
+
+def window_rows(rows, window):
+    """Rows inside a selection window spec, by plain column comparisons"""
+    mask = pd.Series(True, index=rows.index)
+    if 'comp' in window:
+        mask &= rows['Comp.SetDetail'] == window['comp']
+    if 'year' in window:
+        mask &= rows['Year'] == window['year']
+    if 'dates' in window:
+        start, end = window['dates']
+        mask &= (rows['Date'] >= start) & (rows['Date'] <= end)
+    for column, value in window.get('filters', ()):
+        mask &= rows[column] == value
+    return rows[mask]
+
+def route_outcomes(plan, sport, person, rows):
+    """Route rows of one athlete: counters scanned condition by condition, then the route trees"""
+    windows = plan.windows[sport]
+    inputs = {
+        counter: int((window_rows(rows, windows[window])['Rank_Clean'] <= rank).sum())
+        for counter, (window, rank) in plan.counters[sport].items()
+    }
+    if plan.uses_age(sport):
+        inputs[MIN_AGE] = rows['Age'].min()
+    return [
+        (person, sport, route.group, route.name, bool(route.qualified(inputs)), route.details(inputs),
+         route.note, np.nan, np.nan)
+        for route in plan.routes[sport]
+    ]
+
+def score_outcomes(plan, sport, person, rows):
+    """Threshold rows of one athlete: best score over the eligible competitions per judged discipline"""
+    eligible = pd.concat([window_rows(rows, window) for window in plan.score_competitions(sport).values()])
+    outcomes = []
+    for (discipline, gender), threshold in plan.score_thresholds(sport).items():
+        judged = rows['Discipline'] == discipline
+        if discipline == 'Singles':
+            judged &= rows['Gender'] == gender
+        if not judged.any():
+            continue
+        scores = eligible.loc[eligible.index.isin(rows.index[judged]), 'Result_Score'].dropna()
+        best = scores.max() if len(scores) else np.nan
+        outcomes.append((person, sport, None, f'{discipline}_{gender}', bool(best >= threshold), None, None,
+                         best, threshold))
+    return outcomes
+
+def reference_outcomes(df, plan):
+    """evaluate_all layout from a row scan of the compiled criteria, without the checker"""
+    ranked = df[df['Rank_Clean'].notna() & (df['Rank_Clean'] > 0)]
+    outcomes = []
+    for sport in plan.sports:
+        rows = ranked[ranked['Sport'] == sport]
+        for column, accepted in plan.filters[sport].items():
+            rows = rows[rows[column].isin(accepted)]
+        outcome = score_outcomes if sport in plan.scores else route_outcomes
+        for person, athlete_rows in rows.groupby(rows['Person'].astype(object), sort=False):
+            outcomes.extend(outcome(plan, sport, person, athlete_rows))
+    return pd.DataFrame(outcomes, columns=KEY + COMPARED)
+
+def athlete_outcomes(checker, athletes):
+    """evaluate_all layout from the per-athlete check_athlete_qualification results"""
+    outcomes = []
+    for person in athletes:
+        for sport, result in checker.check_athlete_qualification(person)['sports_qualifications'].items():
+            if 'results' in result:
+                outcomes.extend((person, sport, None, route, r['qualified'], None, None,
+                                 np.nan if r['best_score'] is None else r['best_score'], r['threshold'])
+                                for route, r in result['results'].items())
+                continue
+            groups = [(None, result.get('routes', {}))]
+            if 'routes' not in result:
+                groups = [(key[len('group_'):].upper(), group['routes'])
+                          for key, group in result.items() if key.startswith('group_')]
+            outcomes.extend((person, sport, group, route, r['qualified'], r['details'], r.get('note'), np.nan, np.nan)
+                            for group, routes in groups for route, r in routes.items())
+    return pd.DataFrame(outcomes, columns=KEY + COMPARED)
+
+def differences(expected, actual):
+    """Rows of two outcome frames that are missing on either side or differ in a compared column"""
+    def normalised(frame):
+        frame = frame.assign(Group=frame['Group'].fillna(''))
+        frame[COMPARED] = frame[COMPARED].astype(object).where(frame[COMPARED].notna(), None)
+        return frame
+    merged = normalised(expected).merge(normalised(actual), on=KEY, how='outer', suffixes=('', '_actual'),
+                                        indicator=True)
+    differs = np.array(merged['_merge'] != 'both', dtype=bool)
+    for column in COMPARED:
+        expected_values, actual_values = merged[column], merged[f'{column}_actual']
+        numeric = column in ('best_score', 'threshold')
+        differs |= np.array([
+            (a is None) != (b is None) or (a is not None and (float(a) != float(b) if numeric else a != b))
+            for a, b in zip(expected_values.tolist(), actual_values.tolist())
+        ], dtype=bool)
+    return merged[differs]
+
+def main():
+    """Run the criteria parity check"""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--scale', type=int, default=1, help='replicate the roster N times')
+    parser.add_argument('--samples', type=int, default=500, help='athletes compared through the per-athlete checks')
+    args = parser.parse_args()
+
+    print("⚖️ CRITERIA PARITY CHECK")
+    print("=" * 60)
+
+    df = load_results()
+    if args.scale > 1:
+        df = replicate_roster(df, args.scale)
+    checker = MultiSportQualificationChecker(df)
+
+    start = time.perf_counter()
+    expected = reference_outcomes(checker.df, checker.criteria)
+    reference_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batch = checker.evaluate_all()
+    batch_s = time.perf_counter() - start
+
+    athletes = pd.Series(sorted(batch['Person'].unique()))
+    athletes = athletes.sample(min(args.samples, len(athletes)), random_state=0).tolist()
+    per_athlete = athlete_outcomes(checker, athletes)
+
+    print(f"Rows: {len(df):,} | Athletes: {df['Person'].nunique():,} | Route rows: {len(batch):,}")
+    print("-" * 60)
+    print(f"{'Criteria row scan':<32} {reference_s * 1000:>10.1f} ms")
+    print(f"{'evaluate_all':<32} {batch_s * 1000:>10.1f} ms")
+    print("-" * 60)
+
+    mismatches = 0
+    for label, frame, reference in [
+        ('evaluate_all vs criteria row scan', batch, expected),
+        ('per-athlete checks vs evaluate_all', per_athlete, batch[batch['Person'].isin(athletes)]),
+    ]:
+        diff = differences(reference, frame)
+        mismatches += len(diff)
+        for row in diff.head(10).itertuples(index=False):
+            print(f"❌ {label}: {row.Person} / {row.Sport} / {row.Group} {row.Route}: "
+                  f"{row.qualified} {row.details!r} != {row.qualified_actual} {row.details_actual!r}")
+        print(f"{'✅' if diff.empty else '❌'} {label}: {len(diff)} differing route rows")
+
+    if mismatches:
+        sys.exit(1)
+    print(f"✅ Identical outcomes for all {len(batch):,} route rows")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Results Store Converter
+Writes the typed columnar results store read by every loader
+
+Usage: python scripts/convert_results.py [--input CSV] [--output FEATHER]
+       python scripts/convert_results.py --stream [--nationality SUI] [--chunk-rows N]
+  --stream   read the CSV in chunks, keeping one nationality and the used columns;
+             memory stays bounded by the chunk size for multi-GB exports
+"""
+
+import argparse
+import os
+import resource
+import sys
+import time
+
+# Change to project root directory and make src importable
+os.chdir(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, 'src')
+
+from data_loader import INGEST_CHUNK_ROWS, RESULTS_CSV, RESULTS_STORE, convert_results, ingest_results, read_store
+
+def main():
+    """Convert the results CSV into the columnar store"""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--input', default=RESULTS_CSV, help=f'results CSV (default {RESULTS_CSV})')
+    parser.add_argument('--output', default=RESULTS_STORE, help=f'store file (default {RESULTS_STORE})')
+    parser.add_argument('--stream', action='store_true', help='chunked ingestion with nationality filter')
+    parser.add_argument('--nationality', default='SUI', help="nationality kept by --stream, 'ALL' for none")
+    parser.add_argument('--chunk-rows', type=float, default=INGEST_CHUNK_ROWS, help='rows per chunk for --stream')
+    args = parser.parse_args()
+
+    print("🗄️ RESULTS STORE CONVERSION")
+    print("=" * 60)
+
+    try:
+        start = time.perf_counter()
+        if args.stream:
+            nationality = None if args.nationality == 'ALL' else args.nationality
+            rows_read, rows = ingest_results(args.input, args.output, nationality=nationality,
+                                             chunk_rows=int(args.chunk_rows))
+        else:
+            rows_read = rows = convert_results(args.input, args.output)
+        convert_s = time.perf_counter() - start
+    except Exception as e:
+        print(f"❌ Conversion failed: {e}")
+        sys.exit(1)
+
+    start = time.perf_counter()
+    df = read_store(args.output, nationality=None)
+    read_ms = (time.perf_counter() - start) * 1000
+
+    print(f"✅ {rows:,} of {rows_read:,} rows written to {args.output} in {convert_s:.2f} s")
+    print(f"🚀 Throughput: {rows_read / convert_s:,.0f} rows/s | "
+          f"Peak RSS: {resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024:.0f} MB")
+    print(f"📦 Size: {os.path.getsize(args.output) / 1e6:.1f} MB | Columns: {len(df.columns)}")
+    print(f"⚡ Memory-mapped read: {read_ms:.1f} ms")
+    print("-" * 60)
+    for dtype, count in df.dtypes.astype(str).value_counts().items():
+        print(f"  {dtype:<20} {count:>3} columns")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Synthetic Results Generator
+Writes a large results file with the columns and format of the real export
+
+Usage: python scripts/generate_results.py --rows 1000000 [--output CSV] [--seed N] [--store]
+  --store   also convert the generated file into the columnar results store
+"""
+
+import argparse
+import os
+import sys
+import time
+
+# Change to project root directory and make src importable
+os.chdir(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, 'src')
+
+from data_loader import convert_results
+from synthetic_results import iter_synthetic_results, write_results_csv
+
+def main():
+    """Generate a synthetic results file"""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=float, default=100_000, help='number of result rows (10^4 .. 10^7)')
+    parser.add_argument('--output', default=None, help='CSV path (default data/synthetic/results_<rows>.csv)')
+    parser.add_argument('--seed', type=int, default=0, help='random seed')
+    parser.add_argument('--swiss-share', type=float, default=1.0, help='share of Swiss athletes')
+    parser.add_argument('--store', action='store_true', help='also write a .feather store next to the CSV')
+    args = parser.parse_args()
+
+    rows = int(args.rows)
+    output = args.output or f'data/synthetic/results_{rows}.csv'
+
+    print("🧪 SYNTHETIC RESULTS GENERATOR")
+    print("=" * 60)
+
+    start = time.perf_counter()
+    written = write_results_csv(
+        iter_synthetic_results(rows, seed=args.seed, swiss_share=args.swiss_share), output
+    )
+    elapsed = time.perf_counter() - start
+    print(f"✅ {written:,} rows written to {output} in {elapsed:.1f} s ({written / elapsed:,.0f} rows/s)")
+
+    if args.store:
+        store_path = os.path.splitext(output)[0] + '.feather'
+        start = time.perf_counter()
+        convert_results(output, store_path)
+        print(f"🗄️ Store written to {store_path} in {time.perf_counter() - start:.1f} s")
+
+if __name__ == "__main__":
+    main()
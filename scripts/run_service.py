@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""
+Swiss Olympic Qualification Service Launcher
+Simple script to launch the qualification HTTP service for internal tools
+"""
+
+import subprocess
+import sys
+import os
+
+def main():
+    """Launch the qualification service"""
+    
+    # Change to project root directory
+    os.chdir(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    
+    print("🛰️ SWISS OLYMPIC QUALIFICATION SERVICE")
+    print("=" * 45)
+    print("Warm qualification results over HTTP (JSON, ETags)")
+    print("\n📝 Endpoints:")
+    print("1. http://localhost:8503/athletes/{name}/qualification")
+    print("2. http://localhost:8503/sports/{sport}/summary")
+    print("3. http://localhost:8503/athletes/qualification?name=A&name=B (or POST {\"athletes\": [...]})")
+    print("4. Press Ctrl+C to stop the server")
+    print("\n🚀 Launching qualification service...")
+    
+    try:
+        subprocess.run([sys.executable, "src/qualification_service.py", "--port", "8503", *sys.argv[1:]])
+    except KeyboardInterrupt:
+        print("\n\n✅ Qualification service stopped successfully!")
+    except Exception as e:
+        print(f"\n❌ Error launching qualification service: {e}")
+        print("\n🔧 Troubleshooting:")
+        print("1. Make sure you have installed all requirements: pip install -r requirements.txt")
+        print("2. Ensure all data files are present")
+        print("3. Try running: python src/qualification_service.py")
+
+if __name__ == "__main__":
+    main()
@@ -1,16 +1,32 @@
-ate #!/usr/bin/env python3
+#!/usr/bin/env python3
 """
 Swiss Olympic Multi-Sport Team Selection Dashboard - Interactive Search & Filter Version
 Search athletes by name, filter by sport and gender, view qualification status
 """
 
+import json
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Mapping
+
 import streamlit as st
 import pandas as pd
+import numpy as np
 import plotly.express as px
 from datetime import datetime
 
 # Import our analysis modules
+from athlete_search import AthleteSearchIndex
+from data_loader import dataset_version, load_results
 from multi_sport_qualification_checker import MultiSportQualificationChecker
+from profiler import Profiler, stage
+from result_cache import QualificationResultCache, result_cache_key
+from snapshot_store import SnapshotStore
+
+# Columns loaded: what the checker's routes read plus what the cards and filters show
+DASHBOARD_COLUMNS = MultiSportQualificationChecker.RESULT_COLUMNS + [
+    'Name', 'PersonGender', 'Competition', 'Rank', 'Result', 'Person First Name', 'Person Last Name'
+]
 
 # Configure page
 st.set_page_config(
@@ -213,127 +229,152 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
-@st.cache_data
-def load_all_sports_data():
-    """Load and return the complete dataset"""
-    try:
-        # Load CSV with semicolon separator and clean column names
-        df = pd.read_csv('data/Results_Test_Version.csv', sep=';', encoding='utf-8')
-        df.columns = df.columns.str.strip('"')
-        
-        # Filter for Swiss athletes only
-        df = df[df['Nationality'] == 'SUI'].copy()
-        
-        # Clean and process the data
-        if 'Date' in df.columns:
-            df['Date'] = pd.to_datetime(df['Date'], format='%Y/%m/%d %H:%M:%S', errors='coerce')
-        
-        # Clean rank column - this is essential for qualification checker
-        if 'Rank' in df.columns:
-            df['Rank_Clean'] = df['Rank'].astype(str).str.extract(r'(\d+)')[0]
-            df['Rank_Clean'] = pd.to_numeric(df['Rank_Clean'], errors='coerce')
-        else:
-            df['Rank_Clean'] = pd.Series([None] * len(df))
-        
-        # Use 'Person' column as 'Name' for consistency
-        if 'Person' in df.columns:
-            df['Name'] = df['Person']
+@dataclass(frozen=True)
+class DashboardSnapshot:
+    """Everything the dashboard derives from one dataset version
+
+    Shared by every session of the process and never modified after it is
+    built, so reruns read it without copying.
+    """
+    version: str
+    df: pd.DataFrame
+    qualification_results: pd.DataFrame
+    sport_summaries: Mapping
+    search_index: AthleteSearchIndex
+
+def qualification_facets(df, outcomes):
+    """Qualification results for all sports from one roster-wide evaluation pass
+
+    Returns a flat facet table with one row per (Sport, Name), sorted by name:
+    the athlete's Gender, the qualified flag, the qualifying routes, one boolean
+    'via <route>' column per route and 'row', the df position of the athlete's
+    first result in that sport, so every sidebar filter is a vectorized mask
+    over it; plus the per-sport summaries.
+    """
+    # Athletes per sport in order of appearance, with their first row position
+    athletes = pd.DataFrame({
+        'Sport': df['Sport'].astype(object),
+        'Name': df['Name'].astype(object),
+        'row': np.arange(len(df))
+    }).dropna(subset=['Sport', 'Name']).drop_duplicates(subset=['Sport', 'Name'])
+
+    qualified = outcomes[outcomes['qualified']]
+    # Freestyle routes are numbered per group, so keep the group in the label
+    labels = qualified['Route'].where(
+        qualified['Group'].isna(), 'Group ' + qualified['Group'].fillna('') + ' ' + qualified['Route']
+    )
+    qualified_routes = (
+        labels.groupby([qualified['Sport'], qualified['Person']], sort=False).agg(tuple)
+        .rename_axis(['Sport', 'Name'])
+        .rename('qualified_routes')
+        .reset_index()
+    )
+
+    results = athletes.merge(qualified_routes, on=['Sport', 'Name'], how='left').reset_index(drop=True)
+    results['qualified_routes'] = [routes if isinstance(routes, tuple) else () for routes in results['qualified_routes']]
+    results['qualified'] = results['qualified_routes'].map(len) > 0
+    results['Gender'] = pd.Categorical(df['PersonGender'].to_numpy()[results['row'].to_numpy()])
+
+    # One boolean facet column per qualifying route
+    route_flags = pd.crosstab([qualified['Sport'], qualified['Person']], labels).astype(bool)
+    route_flags.index.names = ['Sport', 'Name']
+    route_flags.columns = [f'via {label}' for label in route_flags.columns]
+    results = results.join(route_flags, on=['Sport', 'Name'])
+    results[list(route_flags.columns)] = results[list(route_flags.columns)].fillna(False).astype(bool)
+
+    summary = results.groupby('Sport', sort=False).agg(
+        total_athletes=('Name', 'size'), qualified=('qualified', 'sum')
+    )
+    sport_summaries = {
+        sport: {
+            'total_athletes': int(row.total_athletes),
+            'qualified': int(row.qualified),
+            'qualification_rate': (row.qualified / row.total_athletes) * 100
+        }
+        for sport, row in summary.iterrows()
+    }
+
+    results['Sport'] = results['Sport'].astype('category')
+    return results.sort_values('Name', kind='stable', ignore_index=True), MappingProxyType(sport_summaries)
+
+def build_snapshot(version, use_cache=True):
+    """Load the data and precompute the dashboard tables of one dataset version
+
+    Outcomes come from the persistent result cache when results, criteria and
+    checker code are unchanged, so warm starts build no checker at all.
+    use_cache=False skips the cache and evaluates every route.
+    """
+    with stage('load data'):
+        # Shared loader: Swiss athletes only, projected to the columns the dashboard uses
+        df = load_results(columns=DASHBOARD_COLUMNS)
+    with stage('qualification results'):
+        # One evaluation of every route for every athlete
+        if use_cache:
+            cache = QualificationResultCache(result_cache_key())
+            outcomes = cache.evaluate_all(lambda: MultiSportQualificationChecker(df))
         else:
-            df['Name'] = pd.Series(['Unknown'] * len(df))
-        
-        # Keep both Gender columns for different purposes
-        # PersonGender = athlete's personal gender (Women/Men)
-        # Gender = competition gender category (Women/Men/Mixed)
-        if 'PersonGender' not in df.columns:
-            df['PersonGender'] = pd.Series(['Unknown'] * len(df))
-        if 'Gender' not in df.columns:
-            df['Gender'] = pd.Series(['Unknown'] * len(df))
-        
-        return df
-    except Exception as e:
-        st.error(f"Error loading data: {e}")
-        return pd.DataFrame()
+            outcomes = MultiSportQualificationChecker(df).evaluate_all()
+        qualification_results, sport_summaries = qualification_facets(df, outcomes)
+    with stage('search index'):
+        search_index = AthleteSearchIndex.from_results(df)
+    return DashboardSnapshot(version, df, qualification_results, sport_summaries, search_index)
 
-@st.cache_data
-def get_multi_sport_qualification_results(_checker, df):
-    """Get qualification results for all sports"""
-    try:
-        results = {}
-        sport_summaries = {}
-        
-        # Get all sports in the dataset
-        all_sports = df['Sport'].unique() if 'Sport' in df.columns else []
-        
-        for sport in all_sports:
-            sport_athletes = df[df['Sport'] == sport]
-            if len(sport_athletes) > 0:
-                qualified_count = 0
-                sport_results = {}
-                
-                for athlete in sport_athletes['Name'].unique():
-                    athlete_data = sport_athletes[sport_athletes['Name'] == athlete]
-                    
-                    # Get qualification result using the checker's method
-                    qual_result = _checker.check_athlete_qualification(athlete)
-                    
-                    # Check if athlete qualified for this specific sport
-                    is_qualified = False
-                    if qual_result and not qual_result.get('error'):
-                        sport_qual = qual_result.get('sports_qualifications', {}).get(sport, {})
-                        is_qualified = sport_qual.get('qualified', False)
-                    
-                    sport_results[athlete] = {
-                        'qualified': is_qualified,
-                        'routes': qual_result,
-                        'data': athlete_data
-                    }
-                    
-                    if is_qualified:
-                        qualified_count += 1
-            
-                results[sport] = sport_results
-            sport_summaries[sport] = {
-                    'total_athletes': len(sport_athletes['Name'].unique()),
-                    'qualified': qualified_count,
-                    'qualification_rate': (qualified_count / len(sport_athletes['Name'].unique())) * 100
-            }
-        
-        return results, sport_summaries
-    except Exception as e:
-        st.error(f"Error getting qualification results: {e}")
-        return {}, {}
+@st.cache_resource
+def get_snapshot_store():
+    """Process-wide snapshot store, refreshed in the background when the data file changes"""
+    return SnapshotStore(build_snapshot).start()
 
-def create_athlete_card(athlete_name, athlete_info, sport):
-    """Create a card display for an athlete"""
-    is_qualified = athlete_info['qualified']
-    athlete_data = athlete_info['data'].iloc[0] if len(athlete_info['data']) > 0 else {}
-    
-    # Get gender if available
-    gender = athlete_data.get('Gender', 'N/A')
-    
-    # Count qualified routes from the sport qualification data
-    qualified_routes = 0
-    routes_info = athlete_info.get('routes', {})
-    if routes_info and not routes_info.get('error'):
-        sport_qual = routes_info.get('sports_qualifications', {}).get(sport, {})
-        if sport_qual:
-            qualified_routes = len(sport_qual.get('qualified_routes', []))
-    
-    status_class = "qualified" if is_qualified else "not-qualified"
-    status_text = "✅ QUALIFIED" if is_qualified else "❌ Not Qualified"
-    
-    st.markdown(f"""
-    <div class="athlete-card">
-        <div class="athlete-name">{athlete_name}</div>
-        <div class="athlete-details">
-            <strong>Sport:</strong> {sport} | <strong>Gender:</strong> {gender}
-        </div>
-        <div class="athlete-details">
-            <strong>Qualified Routes:</strong> {qualified_routes}/5
-        </div>
-        <span class="qualification-status {status_class}">{status_text}</span>
-    </div>
-    """, unsafe_allow_html=True)
+# Page sizes of the athlete overview table
+PAGE_SIZES = [25, 50, 100]
+
+def paginate(table, key):
+    """Rows of the current page of table, with rows-per-page and page controls"""
+    size_col, page_col, info_col = st.columns([1, 1, 2])
+    page_size = size_col.selectbox("Rows per page", PAGE_SIZES, key=f'{key}_page_size')
+    pages = max(1, -(-len(table) // page_size))
+
+    # Filters can shrink the table below the remembered page
+    page_key = f'{key}_page'
+    if st.session_state.get(page_key, 1) > pages:
+        st.session_state[page_key] = pages
+    page = page_col.number_input("Page", min_value=1, max_value=pages, step=1, key=page_key)
+
+    start = (page - 1) * page_size
+    info_col.caption(f"Athletes {start + 1}-{min(start + page_size, len(table))} of {len(table)} | Page {page}/{pages}")
+    return table.iloc[start:start + page_size]
+
+def status_style(status):
+    return 'color: #28a745; font-weight: 600' if status.startswith('✅') else 'color: #dc3545'
+
+def athlete_table(page_rows, key):
+    """One selectable table for a page of qualification results; returns the selected athlete or None
+
+    Only the current page is styled and sent to the browser, so render time and
+    payload do not grow with the roster. key names the page and filter state, so
+    a selection made on another page or under other filters is dropped.
+    """
+    table = pd.DataFrame({
+        'Athlete': page_rows['Name'].to_numpy(),
+        'Sport': page_rows['Sport'].to_numpy(),
+        'Gender': page_rows['Gender'].to_numpy(),
+        'Status': np.where(page_rows['qualified'], '✅ Qualified', '❌ Not Qualified'),
+        'Routes': page_rows['qualified_routes'].map(len).to_numpy(),
+        'Qualified via': page_rows['qualified_routes'].map(', '.join).to_numpy()
+    })
+
+    event = st.dataframe(
+        table.style.map(status_style, subset=['Status']),
+        hide_index=True,
+        use_container_width=True,
+        on_select='rerun',
+        selection_mode='single-row',
+        key=key,
+        column_config={
+            'Routes': st.column_config.NumberColumn("Routes", help="Qualified routes", format="%d/5")
+        }
+    )
+    selected = [row for row in event.selection.rows if row < len(table)]
+    return table['Athlete'].iat[selected[0]] if selected else None
 
 def display_detailed_athlete_profile(athlete_name, df, qualification_results):
     """Display comprehensive athlete profile with recent activities and qualification details"""
@@ -368,10 +409,8 @@ def display_detailed_athlete_profile(athlete_name, df, qualification_results):
     
     with col3:
         # Overall qualification status
-        total_qualified_sports = 0
-        for sport, athletes in qualification_results.items():
-            if athlete_name in athletes and athletes[athlete_name]['qualified']:
-                total_qualified_sports += 1
+        athlete_results = qualification_results[qualification_results['Name'] == athlete_name].set_index('Sport')
+        total_qualified_sports = int(athlete_results['qualified'].sum())
         
         st.metric("Qualified Sports", f"{total_qualified_sports}/{sports_participated}")
         qualification_rate = (total_qualified_sports / sports_participated * 100) if sports_participated > 0 else 0
@@ -389,16 +428,9 @@ def display_detailed_athlete_profile(athlete_name, df, qualification_results):
             # Sport-specific qualification status
             is_qualified = False
             qualified_routes = []
-            if sport in qualification_results and athlete_name in qualification_results[sport]:
-                athlete_qual = qualification_results[sport][athlete_name]
-                is_qualified = athlete_qual['qualified']
-                
-                # Get qualified routes
-                routes_info = athlete_qual.get('routes', {})
-                if routes_info and not routes_info.get('error'):
-                    sport_qual = routes_info.get('sports_qualifications', {}).get(sport, {})
-                    if sport_qual:
-                        qualified_routes = sport_qual.get('qualified_routes', [])
+            if sport in athlete_results.index:
+                is_qualified = bool(athlete_results.at[sport, 'qualified'])
+                qualified_routes = list(athlete_results.at[sport, 'qualified_routes'])
             
             # Status display
             status_text = "✅ QUALIFIED for Milano 2026" if is_qualified else "❌ Not Qualified for Milano 2026"
@@ -448,17 +480,23 @@ def main():
     </div>
     """, unsafe_allow_html=True)
     
-    # Load data
-    df = load_all_sports_data()
+    # Load data: the process-wide snapshot, shared by all sessions without copying.
+    # A cold run profiles a private build without the result cache; other sessions keep the shared one
+    try:
+        if st.session_state.pop('cold_run', False):
+            snapshot = build_snapshot(dataset_version(), use_cache=False)
+        else:
+            snapshot = get_snapshot_store().snapshot()
+    except Exception as e:
+        st.error(f"Error loading data: {e}")
+        return
+    df = snapshot.df
     if df.empty:
         st.error("No data available")
         return
     
-    # Initialize qualification checker with dataframe
-    checker = MultiSportQualificationChecker(df)
-    
     # Get qualification results
-    qualification_results, sport_summaries = get_multi_sport_qualification_results(checker, df)
+    qualification_results, sport_summaries = snapshot.qualification_results, snapshot.sport_summaries
     
     # Sidebar filters
     st.sidebar.header("🔍 Search & Filter")
@@ -467,6 +505,7 @@ def main():
     all_sports = sorted(df['Sport'].unique()) if 'Sport' in df.columns else []
     all_athletes = sorted(df['Name'].unique()) if 'Name' in df.columns else []
     genders = sorted(df['PersonGender'].unique()) if 'PersonGender' in df.columns else []
+    search_index = snapshot.search_index
     
     # Enhanced athlete selection
     st.sidebar.subheader("👤 Select Athlete")
@@ -486,11 +525,11 @@ def main():
         st.sidebar.markdown("---")
         st.sidebar.subheader("🎯 Selected Athlete Details")
         
-        # Determine which athlete to show
-        target_athlete = selected_athlete if selected_athlete != "None" else search_name
+        # Determine which athlete to show: the list selection or the best search match
+        target_athlete = selected_athlete if selected_athlete != "None" else search_index.resolve(search_name)
         
         if target_athlete:
-            athlete_data = df[df['Name'].str.contains(target_athlete, case=False, na=False)]
+            athlete_data = df[df['Name'] == target_athlete]
             if not athlete_data.empty:
                 # Show athlete summary in sidebar
                 athlete_sports = athlete_data['Sport'].unique()
@@ -525,19 +564,25 @@ def main():
         options=["All", "Qualified Only", "Not Qualified Only"]
     )
     
+    # Filter by qualifying route (any of the selected)
+    route_columns = [column for column in qualification_results.columns if column.startswith('via ')]
+    selected_routes = st.sidebar.multiselect(
+        "🛣️ Qualified via Route:",
+        options=[column[len('via '):] for column in route_columns]
+    )
+    
     # Main content area - check if specific athlete is selected
     target_athlete = None
     if selected_athlete != "None":
         target_athlete = selected_athlete
     elif search_name:
-        # Find exact match or best match
-        matching_athletes = [name for name in all_athletes if search_name.lower() in name.lower()]
-        if matching_athletes:
-            target_athlete = matching_athletes[0]  # Take first match
+        # Best match, ignoring accents and small typos
+        target_athlete = search_index.resolve(search_name)
     
     # If specific athlete is selected, show detailed profile
     if target_athlete:
-        display_detailed_athlete_profile(target_athlete, df, qualification_results)
+        with stage('athlete profile'):
+            display_detailed_athlete_profile(target_athlete, df, qualification_results)
     else:
         # Show general overview with filters
         col1, col2 = st.columns([2, 1])
@@ -568,45 +613,51 @@ def main():
                 )
         
         with col1:
-            # Filter and display athletes
-            filtered_athletes = []
+            # Filter and display athletes: one boolean mask over the facet table
+            facets = qualification_results
+            with stage('filter', rows=len(facets)):
+                mask = np.ones(len(facets), dtype=bool)
             
-            # Apply filters
-            for sport, athletes in qualification_results.items():
                 # Sport filter
-                if "All" not in selected_sports and sport not in selected_sports:
-                    continue
-                    
-                for athlete_name, athlete_info in athletes.items():
-                    # Name search filter (when not showing detailed profile)
-                    if search_name and search_name.lower() not in athlete_name.lower():
-                        continue
-                    
-                    # Gender filter - use PersonGender for athlete's actual gender
-                    athlete_data = athlete_info['data'].iloc[0] if len(athlete_info['data']) > 0 else {}
-                    athlete_gender = athlete_data.get('PersonGender', 'N/A')
-                    if "All" not in selected_genders and athlete_gender not in selected_genders:
-                        continue
-                    
-                    # Qualification filter
-                    is_qualified = athlete_info['qualified']
-                    if qualification_filter == "Qualified Only" and not is_qualified:
-                        continue
-                    elif qualification_filter == "Not Qualified Only" and is_qualified:
-                        continue
-                    
-                    filtered_athletes.append((athlete_name, athlete_info, sport))
+                if "All" not in selected_sports:
+                    mask &= facets['Sport'].isin(selected_sports).to_numpy()
+            
+                # Name search filter (when not showing detailed profile)
+                if search_name:
+                    mask &= facets['Name'].isin(search_index.search(search_name, limit=None)).to_numpy()
+            
+                # Gender filter - facet Gender is the athlete's PersonGender
+                if "All" not in selected_genders:
+                    mask &= facets['Gender'].isin(selected_genders).to_numpy()
+            
+                # Qualification filter
+                if qualification_filter == "Qualified Only":
+                    mask &= facets['qualified'].to_numpy()
+                elif qualification_filter == "Not Qualified Only":
+                    mask &= ~facets['qualified'].to_numpy()
+            
+                # Route filter
+                if selected_routes:
+                    mask &= facets[[f'via {route}' for route in selected_routes]].to_numpy().any(axis=1)
+            
+                filtered_athletes = facets[mask]
             
             # Display results
-            if filtered_athletes:
+            if not filtered_athletes.empty:
                 st.markdown(f"### 👥 Athletes ({len(filtered_athletes)} found)")
-                st.markdown("💡 **Tip:** Select an athlete from the sidebar to see detailed profile, recent activities, and qualification routes!")
+                st.markdown("💡 **Tip:** Click a row to see the detailed profile, recent activities, and qualification routes!")
                 
-                # Sort athletes by name
-                filtered_athletes.sort(key=lambda x: x[0])
+                # Facets are sorted by name already; only the current page is rendered
+                with stage('athlete table', rows=len(filtered_athletes)):
+                    page_rows = paginate(filtered_athletes, 'overview')
+                    table_state = (selected_sports, search_name, selected_genders, qualification_filter, selected_routes,
+                                   st.session_state['overview_page'], st.session_state['overview_page_size'])
+                    selected = athlete_table(page_rows, key='athlete_table|' + '|'.join(map(str, table_state)))
                 
-                for athlete_name, athlete_info, sport in filtered_athletes:
-                    create_athlete_card(athlete_name, athlete_info, sport)
+                # Drill-down into the selected row
+                if selected is not None:
+                    with stage('athlete profile'):
+                        display_detailed_athlete_profile(selected, df, qualification_results)
             else:
                 st.markdown("""
                 <div class="no-results">
@@ -615,5 +666,39 @@ def main():
             </div>
             """, unsafe_allow_html=True)
 
+def timing_panel(profiler):
+    """Collapsible wall time and rows per stage of this rerun, with a Chrome trace download"""
+    with st.expander(f"⏱️ Timing ({profiler.seconds * 1000:.0f} ms)"):
+        st.caption("Snapshot stages (loading, checker build, evaluation) only appear on the rerun that builds it.")
+        summary = profiler.summary()
+        summary['share'] = summary['share'] * 100
+        st.dataframe(
+            summary,
+            hide_index=True,
+            use_container_width=True,
+            column_config={
+                'total_ms': st.column_config.NumberColumn("Total ms", format="%.2f"),
+                'mean_ms': st.column_config.NumberColumn("Mean ms", format="%.3f"),
+                'max_ms': st.column_config.NumberColumn("Max ms", format="%.3f"),
+                'share': st.column_config.ProgressColumn("Share", format="%.1f%%", min_value=0, max_value=100),
+            }
+        )
+        if st.button("🧊 Profile a cold run", help="Builds a private snapshot without the result cache for this rerun"):
+            st.session_state['cold_run'] = True
+            st.rerun()
+        st.download_button(
+            "💾 Download Chrome trace",
+            data=json.dumps(profiler.chrome_trace()),
+            file_name="qualification_trace.json",
+            mime="application/json",
+            help="Open in chrome://tracing, Perfetto or speedscope"
+        )
+
 if __name__ == "__main__":
-    main()
+    # Off by default; profiles every stage of the rerun when switched on
+    if st.sidebar.toggle("⏱️ Profile this run", key='profile_run'):
+        with Profiler() as profiler:
+            main()
+        timing_panel(profiler)
+    else:
+        main()
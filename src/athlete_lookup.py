@@ -4,6 +4,8 @@ Swiss Olympic Athlete Lookup System
 Interactive tool to search for athletes, filter by sport, and check qualification status
 """
 
+import json
+
 import streamlit as st
 import pandas as pd
 import plotly.express as px
@@ -12,7 +14,17 @@ from datetime import datetime
 import numpy as np
 
 # Import our analysis modules
+from athlete_search import AthleteSearchIndex
+from crew_graph import load_crew_members
+from data_loader import dataset_version, load_results
 from multi_sport_qualification_checker import MultiSportQualificationChecker
+from profiler import Profiler, stage
+from result_cache import QualificationResultCache, result_cache_key
+
+# Columns loaded: what the checker's routes read plus what the profile and browser show
+LOOKUP_COLUMNS = MultiSportQualificationChecker.RESULT_COLUMNS + [
+    'Name', 'PersonGender', 'Competition', 'Season', 'Person First Name', 'Person Last Name'
+]
 
 # Configure page
 st.set_page_config(
@@ -100,47 +112,50 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
-@st.cache_data
-def load_all_data():
-    """Load all sports data, not just biathlon"""
+@st.cache_resource
+def load_all_data(version):
+    """Load all sports data, not just biathlon; one shared frame per dataset version"""
     try:
-        # Load the original CSV with all sports
-        df = pd.read_csv("data/Results_Test_Version.csv", sep=';', encoding='utf-8')
-        
-        # Clean column names
-        df.columns = df.columns.str.strip('"')
-        
-        # Convert date columns
-        df['Date'] = pd.to_datetime(df['Date'], format='%Y/%m/%d %H:%M:%S')
-        df['DoB'] = pd.to_datetime(df['DoB'], format='%Y/%m/%d %H:%M:%S', errors='coerce')
-        
-        # Clean rank column
-        df['Rank_Clean'] = pd.to_numeric(df['Rank'].str.extract(r'(\d+)')[0], errors='coerce')
-        
-        # Add season column
-        df['Season'] = df['Date'].apply(lambda x: f"{x.year-1}/{x.year}" if x.month <= 6 else f"{x.year}/{x.year+1}")
-        
-        # Filter for Swiss athletes only
-        df = df[df['Nationality'] == 'SUI'].copy()
-        
-        return df
+        # Shared loader: Swiss athletes only, projected to the columns the lookup uses
+        return load_results(columns=LOOKUP_COLUMNS)
     except Exception as e:
         st.error(f"Error loading data: {e}")
         return None
 
-@st.cache_data
-def get_athlete_qualification_status(athlete_name, df):
-    """Get qualification status for an athlete across all sports"""
+@st.cache_resource
+def get_checker(version):
+    """Shared qualification checker for one dataset version"""
+    df = load_all_data(version)
+    if df is None:
+        return None
+    # Crews are checked against the team members of every nationality
+    return MultiSportQualificationChecker(df, crew_members=load_crew_members())
+
+@st.cache_resource
+def get_search_index(version):
+    """Accent-folded athlete name index, built once per dataset version"""
+    return AthleteSearchIndex.from_results(load_all_data(version))
+
+@st.cache_resource
+def get_result_cache(version):
+    """Persistent qualification result cache for one dataset version"""
+    return QualificationResultCache(result_cache_key())
+
+def athlete_qualification_status(athlete_name, version, use_result_cache=True):
+    """Qualification status for an athlete across all sports, without st.cache_data"""
     try:
-        athlete_data = df[df['Person'] == athlete_name]
-        if athlete_data.empty:
-            return None, "Athlete not found"
-        
-        # Initialize multi-sport checker
-        checker = MultiSportQualificationChecker(df)
-        
-        # Get comprehensive qualification status
-        result = checker.check_athlete_qualification(athlete_name)
+        # Unchanged results, criteria and checker code: no checker needed
+        cache = get_result_cache(version) if use_result_cache else None
+        result = cache.athlete_status(athlete_name) if cache is not None else None
+        if result is None:
+            checker = get_checker(version)
+            if checker is None or athlete_name not in checker.valid_persons:
+                return None, "Athlete not found"
+
+            # Get comprehensive qualification status
+            result = checker.check_athlete_qualification(athlete_name)
+            if cache is not None:
+                cache.store_athlete_statuses({athlete_name: result})
         
         if 'error' in result:
             return None, result['error']
@@ -150,15 +165,16 @@ def get_athlete_qualification_status(athlete_name, df):
     except Exception as e:
         return None, f"Error checking qualification: {e}"
 
-@st.cache_data  
-def get_biathlon_qualification_status(athlete_name, df):
-    """Get biathlon-specific qualification status (for backwards compatibility)"""
+def biathlon_qualification_status(athlete_name, version, use_result_cache=True):
+    """Biathlon-specific qualification status, without st.cache_data"""
     try:
-        # Get multi-sport status first
-        multi_result, error = get_athlete_qualification_status(athlete_name, df)
-        
-        if error or not multi_result:
-            return None, error or "No qualification data available"
+        # Cached multi-sport status, or a lazy one that evaluates Biathlon only
+        multi_result = get_result_cache(version).athlete_status(athlete_name) if use_result_cache else None
+        if multi_result is None:
+            checker = get_checker(version)
+            if checker is None or athlete_name not in checker.valid_persons:
+                return None, "Athlete not found"
+            multi_result = checker.check_athlete_qualification(athlete_name)
         
         # Extract biathlon-specific information
         biathlon_qual = multi_result['sports_qualifications'].get('Biathlon')
@@ -175,7 +191,17 @@ def get_biathlon_qualification_status(athlete_name, df):
     except Exception as e:
         return None, f"Error checking biathlon qualification: {e}"
 
-def display_athlete_info(athlete_name, df):
+@st.cache_data
+def get_athlete_qualification_status(athlete_name, version):
+    """Get qualification status for an athlete across all sports"""
+    return athlete_qualification_status(athlete_name, version)
+
+@st.cache_data  
+def get_biathlon_qualification_status(athlete_name, version):
+    """Get biathlon-specific qualification status (for backwards compatibility)"""
+    return biathlon_qualification_status(athlete_name, version)
+
+def display_athlete_info(athlete_name, df, version, cold_run=False):
     """Display comprehensive athlete information"""
     
     # Get all data for this athlete
@@ -193,7 +219,10 @@ def display_athlete_info(athlete_name, df):
     multi_qualification_info = None
     qualification_error = None
     
-    multi_qualification_info, qualification_error = get_athlete_qualification_status(athlete_name, df)
+    if cold_run:
+        multi_qualification_info, qualification_error = athlete_qualification_status(athlete_name, version, use_result_cache=False)
+    else:
+        multi_qualification_info, qualification_error = get_athlete_qualification_status(athlete_name, version)
     
     # Keep backwards compatibility for biathlon-specific display
     qualification_info = None
@@ -380,9 +409,19 @@ def main():
     # Milano 2026 Info Banner
     st.info("🎿 **Milano Cortina 2026 Winter Olympics** | Search Swiss athletes and check their qualification status for the upcoming Winter Olympics in Italy (February 6-22, 2026)")
     
+    # A cold run evaluates this session's statuses through the shared checker without any
+    # cache; the st.cache_data entries of other sessions are left alone
+    cold_run = st.session_state.pop('cold_run', False)
+    
     # Load data
     with st.spinner("Loading Swiss Olympic athlete data..."):
-        df = load_all_data()
+        try:
+            version = dataset_version()
+        except OSError as e:
+            st.error(f"Error loading data: {e}")
+            return
+        with stage('load data'):
+            df = load_all_data(version)
     
     if df is None:
         st.error("Failed to load data. Please check your data files.")
@@ -390,6 +429,8 @@ def main():
     
     # Get all athletes
     all_athletes = sorted(df['Person'].dropna().unique())
+    with stage('search index'):
+        search_index = get_search_index(version)
     
     # Search interface
     with st.container():
@@ -422,7 +463,7 @@ def main():
                 
                 # Auto-suggest matching names
                 if athlete_name and athlete_name not in all_athletes:
-                    matching_athletes = [name for name in all_athletes if athlete_name.lower() in name.lower()]
+                    matching_athletes = search_index.search(athlete_name, limit=5)
                     if matching_athletes:
                         st.write("**Suggestions:**")
                         cols_suggest = st.columns(min(3, len(matching_athletes[:5])))
@@ -485,12 +526,13 @@ def main():
     if current_athlete and current_athlete.strip():
         # Check if athlete exists
         if current_athlete in all_athletes:
-            display_athlete_info(current_athlete, df)
+            with stage('athlete profile'):
+                display_athlete_info(current_athlete, df, version, cold_run)
         else:
             st.error(f"❌ Athlete '{current_athlete}' not found in the database.")
             
             # Show similar names
-            similar_names = [name for name in all_athletes if current_athlete.lower() in name.lower()]
+            similar_names = search_index.search(current_athlete, limit=9)
             if similar_names:
                 st.write("**Did you mean:**")
                 cols_similar = st.columns(min(3, len(similar_names[:9])))
@@ -547,10 +589,14 @@ def main():
             qualified_count = 0
             biathlon_athletes = biathlon_df['Person'].unique()
             
-            for athlete in biathlon_athletes:
-                qual_info, _ = get_biathlon_qualification_status(athlete, df)
-                if qual_info and qual_info['is_qualified']:
-                    qualified_count += 1
+            with stage('biathlon team status', rows=len(biathlon_athletes)):
+                for athlete in biathlon_athletes:
+                    if cold_run:
+                        qual_info, _ = biathlon_qualification_status(athlete, version, use_result_cache=False)
+                    else:
+                        qual_info, _ = get_biathlon_qualification_status(athlete, version)
+                    if qual_info and qual_info['is_qualified']:
+                        qualified_count += 1
             
             col1, col2, col3 = st.columns(3)
             with col1:
@@ -579,5 +625,41 @@ def main():
         with col4:
             st.metric("Total Results", len(df))
 
+def timing_panel(profiler):
+    """Collapsible wall time and rows per stage of this rerun, with a Chrome trace download"""
+    with st.expander(f"⏱️ Timing ({profiler.seconds * 1000:.0f} ms)"):
+        st.caption("Cached stages (loading, checker build, evaluation) only appear on the rerun that computes them.")
+        summary = profiler.summary()
+        summary['share'] = summary['share'] * 100
+        st.dataframe(
+            summary,
+            hide_index=True,
+            use_container_width=True,
+            column_config={
+                'total_ms': st.column_config.NumberColumn("Total ms", format="%.2f"),
+                'mean_ms': st.column_config.NumberColumn("Mean ms", format="%.3f"),
+                'max_ms': st.column_config.NumberColumn("Max ms", format="%.3f"),
+                'share': st.column_config.ProgressColumn("Share", format="%.1f%%", min_value=0, max_value=100),
+            }
+        )
+        if st.button("🧊 Profile a cold run",
+                     help="Re-evaluates the qualification statuses without any cache; the shared data and checker stay loaded"):
+            # Flags this session only; every shared cache stays as it is
+            st.session_state['cold_run'] = True
+            st.rerun()
+        st.download_button(
+            "💾 Download Chrome trace",
+            data=json.dumps(profiler.chrome_trace()),
+            file_name="qualification_trace.json",
+            mime="application/json",
+            help="Open in chrome://tracing, Perfetto or speedscope"
+        )
+
 if __name__ == "__main__":
-    main()
+    # Off by default; profiles every stage of the rerun when switched on
+    if st.sidebar.toggle("⏱️ Profile this run", key='profile_run'):
+        with Profiler() as profiler:
+            main()
+        timing_panel(profiler)
+    else:
+        main()
@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+Fuzzy Athlete Search for Swiss Olympic Team Selection
+Milano Cortina 2026 Olympics - Accent-insensitive, typo-tolerant name search
+
+The index is built once per dataset version over Person, Person First Name and
+Person Last Name:
+- Names are accent-folded ('Häcki-Groß' -> 'hacki gross') and split into tokens
+- Distinct tokens form a sorted vocabulary (prefix lookups by bisection) with
+  trigram postings (typo candidates), so queries never scan the roster
+- Every query token must match one token of an athlete, by prefix or within a
+  small edit distance; athletes are ranked by the summed distances
+"""
+
+import bisect
+import re
+import threading
+import unicodedata
+
+import numpy as np
+
+from profiler import stage
+
+# Letters NFKD does not decompose into base letter + accent
+FOLD_TABLE = str.maketrans({
+    'ß': 'ss', 'ẞ': 'ss', 'æ': 'ae', 'Æ': 'ae', 'œ': 'oe', 'Œ': 'oe',
+    'ø': 'o', 'Ø': 'o', 'ł': 'l', 'Ł': 'l', 'đ': 'd', 'Đ': 'd', 'ı': 'i'
+})
+
+# Distance added for a token matched only by prefix, so whole-token matches rank first
+PREFIX_PENALTY = 0.1
+
+# Typo candidates checked per query token, best trigram overlap first
+MAX_TYPO_CANDIDATES = 16
+
+# Query tokens whose typo matches are remembered; typing repeats earlier tokens
+TYPO_CACHE_SIZE = 4096
+
+def fold(text):
+    """Lower-case ASCII form of a name: accents removed, punctuation as spaces"""
+    text = unicodedata.normalize('NFKD', str(text).translate(FOLD_TABLE))
+    text = ''.join(char for char in text if not unicodedata.combining(char)).casefold()
+    return ' '.join(re.findall(r'[a-z0-9]+', text))
+
+def allowed_typos(token):
+    """Edits tolerated in a query token: none below 3 letters, two from 7 letters on"""
+    return 0 if len(token) < 3 else 1 if len(token) < 7 else 2
+
+def edit_distance(a, b, limit):
+    """Levenshtein distance of a and b, or limit + 1 once it must exceed limit"""
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (char_a != char_b)))
+        if min(current) > limit:
+            return limit + 1
+        previous = current
+    return previous[-1]
+
+def _trigrams(text):
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+class AthleteSearchIndex:
+    """Prebuilt accent-folded token index over athlete names"""
+
+    def __init__(self, names, aliases=None):
+        """names: display names; aliases: optional {name: [other spellings]} also searched"""
+        self.names = list(dict.fromkeys(names))
+        self.folded = [fold(name) for name in self.names]
+        self._exact = {}
+        for position, folded in enumerate(self.folded):
+            self._exact.setdefault(folded, position)
+
+        # Token -> athlete positions, from the name and its aliases (e.g. first/last names)
+        # Names share few distinct words, so each word is folded and split once
+        word_tokens = {}
+        postings = {}
+        for position, name in enumerate(self.names):
+            tokens = set()
+            for text in [name, *(aliases or {}).get(name, ())]:
+                for word in str(text).split():
+                    if word not in word_tokens:
+                        folded = fold(word)
+                        # Hyphenated names also joined, so 'hackigross' finds 'Häcki-Groß'
+                        joined = [folded.replace(' ', '')] if ' ' in folded else []
+                        word_tokens[word] = folded.split() + joined
+                    tokens.update(word_tokens[word])
+            for token in tokens:
+                postings.setdefault(token, []).append(position)
+
+        # Postings in CSR layout: a range of vocabulary tokens is one contiguous slice
+        self.vocabulary = sorted(postings)
+        lengths = [len(postings[token]) for token in self.vocabulary]
+        self._offsets = np.concatenate([[0], np.cumsum(lengths)]).astype(np.int64)
+        self._athletes = np.array([p for token in self.vocabulary for p in postings[token]], dtype=np.int64)
+
+        # Alphabetical rank of each athlete, the tie-breaker between equal distances
+        self._order = np.empty(len(self.names), dtype=np.int64)
+        self._order[sorted(range(len(self.names)), key=self.folded.__getitem__)] = np.arange(len(self.names))
+
+        grams = {}
+        for token_id, token in enumerate(self.vocabulary):
+            for gram in _trigrams(f' {token} '):
+                grams.setdefault(gram, []).append(token_id)
+        self._grams = {gram: np.array(ids, dtype=np.int64) for gram, ids in grams.items()}
+        # Shared by the app sessions and service threads
+        self._typo_cache = {}
+        self._typo_lock = threading.Lock()
+
+    @classmethod
+    def from_results(cls, df):
+        """Index over the Person column, with first and last names as aliases when present"""
+        columns = [c for c in ('Person', 'Person First Name', 'Person Last Name') if c in df.columns]
+        people = df[columns].dropna(subset=['Person']).drop_duplicates('Person').astype(object)
+        aliases = {
+            row[0]: [part for part in row[1:] if isinstance(part, str)]
+            for row in people.itertuples(index=False, name=None)
+        }
+        with stage('build search index', rows=len(people)):
+            return cls(people['Person'].tolist(), aliases)
+
+    def _slice(self, start, end):
+        """Athlete positions of vocabulary tokens start..end-1"""
+        return self._athletes[self._offsets[start]:self._offsets[end]]
+
+    def _token_distances(self, token):
+        """Best distance of every athlete to one query token (inf: no match)"""
+        best = np.full(len(self.names), np.inf)
+
+        # Tokens within the allowed edits
+        for token_id, distance in self._typo_matches(token).items():
+            positions = self._slice(token_id, token_id + 1)
+            best[positions] = np.minimum(best[positions], distance)
+
+        # Prefix matches: a contiguous range of the sorted vocabulary
+        start = bisect.bisect_left(self.vocabulary, token)
+        end = bisect.bisect_left(self.vocabulary, token + '\uffff')
+        if start < end:
+            best[self._slice(start, end)] = np.minimum(best[self._slice(start, end)], PREFIX_PENALTY)
+            if self.vocabulary[start] == token:
+                best[self._slice(start, start + 1)] = 0.0
+        return best
+
+    def _typo_matches(self, token):
+        """{vocabulary token id: distance} of tokens within the allowed edits of a query token"""
+        with self._typo_lock:
+            matches = self._typo_cache.get(token)
+        if matches is None:
+            matches = self._find_typo_matches(token)
+            with self._typo_lock:
+                if len(self._typo_cache) >= TYPO_CACHE_SIZE:
+                    self._typo_cache.clear()
+                self._typo_cache[token] = matches
+        return matches
+
+    def _find_typo_matches(self, token):
+        matches = {}
+        typos = allowed_typos(token)
+        if typos == 0:
+            return matches
+
+        # Typo candidates share most trigrams; each edit destroys at most three
+        query_grams = _trigrams(f' {token}')
+        postings = [self._grams[gram] for gram in query_grams if gram in self._grams]
+        if not postings:
+            return matches
+        overlap = np.bincount(np.concatenate(postings), minlength=len(self.vocabulary))
+        candidates = np.flatnonzero(overlap >= max(1, len(query_grams) - 3 * typos))
+        if len(candidates) > MAX_TYPO_CANDIDATES:
+            candidates = candidates[np.argsort(-overlap[candidates], kind='stable')[:MAX_TYPO_CANDIDATES]]
+
+        for token_id in candidates.tolist():
+            candidate = self.vocabulary[token_id]
+            if candidate.startswith(token):
+                continue  # Already a prefix match
+            distance = edit_distance(token, candidate, typos)
+            if len(candidate) > len(token):
+                distance = min(distance, edit_distance(token, candidate[:len(token)], typos) + PREFIX_PENALTY)
+            if distance <= typos:
+                matches[token_id] = float(distance)
+        return matches
+
+    def search(self, query, limit=10):
+        """Athlete names matching query, best first; limit=None returns every match"""
+        folded_query = fold(query)
+        tokens = folded_query.split()
+        if not tokens:
+            return []
+
+        # Each query token must match some token of the athlete; distances add up
+        total = self._token_distances(tokens[0])
+        for token in tokens[1:]:
+            total += self._token_distances(token)
+
+        found = np.flatnonzero(np.isfinite(total))
+        exact = self._exact.get(folded_query)
+        if exact is not None:
+            total[exact] = -1.0  # The folded full name always ranks first
+
+        # One integer key: distance in tenths, then alphabetical rank
+        keys = np.rint(total[found] * 10).astype(np.int64) * len(self.names) + self._order[found]
+        if limit is not None and len(found) > limit:
+            top = np.argpartition(keys, limit)[:limit]
+            found, keys = found[top], keys[top]
+        ranked = found[np.argsort(keys, kind='stable')]
+        return [self.names[position] for position in ranked.tolist()]
+
+    def resolve(self, query):
+        """The athlete a query most likely means, or None"""
+        matches = self.search(query, limit=1)
+        return matches[0] if matches else None
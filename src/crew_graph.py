@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Bobsleigh Crew Graph for Swiss Olympic Team Selection
+Milano Cortina 2026 Olympics - Crew eligibility without rescanning results
+
+Team disciplines list one result row per crew member (Team Members == 'Yes').
+The graph is built once from those rows:
+- crew: one team result (race, discipline, gender, rank and team label)
+- crew -> member persons -> nationalities, plus the sled's country
+- person -> the crews they raced in
+Every crew is validated in the same pass, so the eligibility of an athlete's
+crews is a dictionary lookup, also when pilots change crews race to race.
+
+The Swiss athlete loads drop foreign crew mates, so the apps build the graph
+from load_crew_members: the team member rows of every nationality.
+"""
+
+import numpy as np
+import pandas as pd
+
+from data_loader import RESULTS_CSV, load_results, read_store
+
+# Disciplines raced by crews; Monobob is a single-athlete sled
+TEAM_DISCIPLINES = {'2-Man', '4-Man', 'Two-man', 'Four-man'}
+
+# Columns identifying one crew's result; Team tells apart sleds tied on rank
+CREW_KEY = ['Comp.SetDetail', 'Date', 'Discipline', 'Gender', 'Rank_Clean', 'Team']
+
+CREW_COLUMNS = CREW_KEY + ['country', 'members', 'nationalities', 'foreign_members', 'eligible']
+
+# Result columns the graph reads
+MEMBER_COLUMNS = ['Person', 'Sport', 'Team Members', 'Country', 'Nationality'] + CREW_KEY
+
+def load_crew_members(path=RESULTS_CSV):
+    """Ranked Bobsleigh team member rows of every nationality, from a results CSV or a columnar store (.feather)"""
+    if path.endswith('.feather'):
+        df = read_store(path, nationality=None, columns=MEMBER_COLUMNS)
+    else:
+        df = load_results(path, nationality=None, columns=MEMBER_COLUMNS)
+    return df[(df['Sport'] == 'Bobsleigh') & (df['Team Members'] == 'Yes') & (df['Rank_Clean'] > 0)]
+
+class CrewGraph:
+    """Crews of team result rows, their members and nationalities, validated once"""
+
+    def __init__(self, members, team_athletes=(), country='Switzerland', nationality='SUI'):
+        """members: team member result rows; team_athletes: persons with team discipline results
+        (verifiable or not); country / nationality: what an eligible crew is made of"""
+        self.country = country
+        self.nationality = nationality
+        self._team_athletes = set(team_athletes)
+        members = members[members['Discipline'].isin(TEAM_DISCIPLINES) & members['Person'].notna()]
+        key = [column for column in CREW_KEY if column in members.columns]
+
+        frame = pd.DataFrame({column: members[column].astype(object).to_numpy() for column in key})
+        frame['Person'] = members['Person'].astype(object).to_numpy()
+        frame['Country'] = members['Country'].astype(object).to_numpy()
+        frame['Nationality'] = (members['Nationality'].astype(object).to_numpy()
+                                if 'Nationality' in members.columns else None)
+        frame['crew'] = frame.groupby(key, sort=False, dropna=False).ngroup().to_numpy()
+
+        # Member nationality other than the team's (unknown nationalities are not flagged)
+        foreign = frame['Nationality'].notna() & (frame['Nationality'] != nationality)
+        crews = frame.groupby('crew', sort=True).agg(
+            **{column: (column, 'first') for column in key},
+            country=('Country', 'first'), members=('Person', tuple), nationalities=('Nationality', tuple)
+        )
+        foreign_by_crew = frame[foreign].groupby('crew')['Person'].agg(tuple)
+        crews['foreign_members'] = [foreign_by_crew.get(crew, ()) for crew in crews.index]
+        crews['eligible'] = (crews['country'] == country).to_numpy() & (crews['foreign_members'].map(len) == 0).to_numpy()
+        self.crews = crews.reindex(columns=[c for c in CREW_COLUMNS if c in crews.columns])
+
+        # Person -> crew ids, in order of their results
+        person_crews = frame[['Person', 'crew']].drop_duplicates()
+        self._person_crews = {
+            person: np.asarray(crew_ids) for person, crew_ids in person_crews.groupby('Person', sort=False)['crew']
+        }
+        countries = self.crews['country'].to_numpy()
+        foreign_members = self.crews['foreign_members'].to_numpy()
+        self._verifications = {
+            person: self._verify(countries[crew_ids], foreign_members[crew_ids])
+            for person, crew_ids in self._person_crews.items()
+        }
+
+    @classmethod
+    def from_results(cls, df, **options):
+        """Graph over the team member rows of a results frame"""
+        team_athletes = df.loc[df['Discipline'].isin(TEAM_DISCIPLINES), 'Person'].dropna()
+        return cls(df[df['Team Members'] == 'Yes'], team_athletes=team_athletes, **options)
+
+    def __len__(self):
+        return len(self.crews)
+
+    def crews_of(self, person):
+        """Crew table rows of every crew a person raced in"""
+        return self.crews.iloc[self._person_crews.get(person, np.empty(0, dtype=np.intp))]
+
+    def _verify(self, countries, foreign_members):
+        """Verification of one athlete from the sled countries and foreign members of their crews"""
+        foreign_countries = list(dict.fromkeys(country for country in countries.tolist() if country != self.country))
+        crew_mates = list(dict.fromkeys(mate for mates in foreign_members for mate in mates))
+        details = []
+        if foreign_countries:
+            details.append(f'Non-Swiss team members from: {foreign_countries}')
+        if crew_mates:
+            details.append(f'Non-Swiss crew members: {crew_mates}')
+        return {
+            'applicable': True,
+            'verified': not (foreign_countries or crew_mates),
+            'details': details or ['All team members verified as Swiss']
+        }
+
+    def verification(self, person):
+        """Team verification of one athlete: applicable, verified and details"""
+        verification = self._verifications.get(person)
+        if verification is None and person in self._team_athletes:
+            return {'applicable': True, 'verified': True, 'details': ['No team member data found for verification']}
+        if verification is None:
+            return {'applicable': False, 'verified': True, 'details': ['Not applicable - no team disciplines found']}
+        return {**verification, 'details': list(verification['details'])}
@@ -0,0 +1,444 @@
+#!/usr/bin/env python3
+"""
+Criteria Compiler for Swiss Olympic Team Selection
+Milano Cortina 2026 Olympics - criterias/*_Hauptkriterien.txt as the single rule source
+
+The criteria files describe every route as nested any_of / all_of / condition
+blocks. This module parses them into a small rule AST and lowers each sport to
+the tables MultiSportQualificationChecker executes:
+- filters: the header columns a result must match to count for the sport
+- windows: named selection windows (competition, Year/Date, column filters);
+  conditions naming the same window must agree on it
+- counters: one (window, rank) pair per distinct condition, shared by every
+  route that uses it, so the checker counts each once per athlete
+- routes: condition trees over those counters, evaluated on scalars (one
+  athlete) or Series (every athlete) alike
+Adding a sport or a new season only means editing a criteria file.
+"""
+
+import glob
+import os
+from dataclasses import dataclass
+
+import pandas as pd
+
+# Next to src/, so the criteria are found from any working directory
+CRITERIA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'criterias')
+CRITERIA_PATTERN = '*_Hauptkriterien.txt'
+
+# Header keys that restrict which results count for a sport
+HEADER_FILTER_COLUMNS = ['Is Olympic Discipline', 'Class', 'Team Members']
+
+# Condition keys with a dedicated meaning; every other string key is a column filter
+CONDITION_KEYWORDS = {'name', 'window', 'description', 'Comp.SetDetail', 'Year', 'Date', 'Rank', 'Age',
+                      'count_at_least', 'special_note'}
+
+# Keys of a selection path besides its any_of / all_of / condition block
+PATH_KEYWORDS = {'route', 'note'}
+
+# Route input holding the youngest recorded age of an athlete
+MIN_AGE = 'min_age'
+
+# ========================================================================================
+# PARSER - YAML-LIKE CRITERIA FILES
+# ========================================================================================
+
+def _strip_comment(line):
+    """Remove a trailing '#' comment that is not inside a quoted string"""
+    in_quotes = False
+    for position, char in enumerate(line):
+        if char == '"':
+            in_quotes = not in_quotes
+        elif char == '#' and not in_quotes:
+            return line[:position]
+    return line
+
+def _split_key(text):
+    """Split 'key: value' outside quotes, returning None for plain scalars"""
+    in_quotes = False
+    for position, char in enumerate(text):
+        if char == '"':
+            in_quotes = not in_quotes
+        elif char == ':' and not in_quotes:
+            if position + 1 == len(text) or text[position + 1] == ' ':
+                return _parse_scalar(text[:position]), text[position + 1:].strip()
+    return None
+
+def _parse_scalar(text):
+    """Parse a quoted string, an inline [a, b] list or a number"""
+    text = text.strip()
+    if text.startswith('[') and text.endswith(']'):
+        return [_parse_scalar(item) for item in text[1:-1].split(',') if item.strip()]
+    if len(text) >= 2 and text[0] == text[-1] == '"':
+        return text[1:-1]
+    for cast in (int, float):
+        try:
+            return cast(text)
+        except ValueError:
+            pass
+    return text
+
+def _parse_block(lines, i, indent):
+    """Parse the mapping or list starting at lines[i] with the given indentation"""
+    if lines[i][1].startswith('- '):
+        items = []
+        while i < len(lines) and lines[i][0] == indent and lines[i][1].startswith('- '):
+            number, content = lines[i][2], lines[i][1][2:].strip()
+            if _split_key(content) is None:
+                items.append(_parse_scalar(content))
+                i += 1
+            else:
+                # A '- key: value' item is a mapping aligned with its first key
+                lines[i] = (indent + 2, content, number)
+                value, i = _parse_block(lines, i, indent + 2)
+                items.append(value)
+        return items, i
+
+    mapping = {}
+    while i < len(lines) and lines[i][0] == indent and not lines[i][1].startswith('- '):
+        split = _split_key(lines[i][1])
+        if split is None:
+            raise ValueError(f'Line {lines[i][2]}: expected "key: value", got "{lines[i][1]}"')
+        key, value = split
+        i += 1
+        if value:
+            mapping[key] = _parse_scalar(value)
+        elif i < len(lines) and lines[i][0] > indent:
+            mapping[key], i = _parse_block(lines, i, lines[i][0])
+        else:
+            mapping[key] = None
+    if i < len(lines) and lines[i][0] > indent:
+        raise ValueError(f'Line {lines[i][2]}: unexpected indentation')
+    return mapping, i
+
+def parse_criteria_text(text):
+    """Parse the contents of a criteria file into nested dicts and lists"""
+    lines = []
+    for number, raw_line in enumerate(text.lstrip('\ufeff').splitlines(), start=1):
+        line = _strip_comment(raw_line.expandtabs(4)).rstrip()
+        if line.strip():
+            lines.append((len(line) - len(line.lstrip(' ')), line.strip(), number))
+    if not lines:
+        return {}
+    spec, end = _parse_block(lines, 0, lines[0][0])
+    if end != len(lines):
+        raise ValueError(f'Line {lines[end][2]}: unexpected indentation')
+    return spec
+
+def parse_criteria_file(path):
+    """Parse a *_Hauptkriterien.txt file"""
+    with open(path, encoding='utf-8') as handle:
+        return parse_criteria_text(handle.read())
+
+# ========================================================================================
+# RULE AST
+# ========================================================================================
+
+@dataclass(frozen=True)
+class Condition:
+    """At least `count` results inside the selection window with rank <= `rank`"""
+    window: str
+    rank: int
+    count: int
+    description: str
+    note: str = None
+
+    @property
+    def counter(self):
+        """Name of the route counter this condition reads"""
+        return f'{self.window} Top-{self.rank}'
+
+    def qualified(self, inputs):
+        return inputs[self.counter] >= self.count
+
+    def details(self, record):
+        need = f' (need {self.count})' if self.count > 1 else ''
+        return f'{self.counter}: {record[self.counter]}{need}'
+
+@dataclass(frozen=True)
+class AgeCondition:
+    """Youngest recorded age in the sport at most `max_age`; athletes without ages pass"""
+    max_age: int
+    description: str
+
+    def qualified(self, inputs):
+        return pd.isna(inputs[MIN_AGE]) | (inputs[MIN_AGE] <= self.max_age)
+
+    def details(self, record):
+        return f'Age ≤{self.max_age}: {bool(self.qualified(record))}'
+
+@dataclass(frozen=True)
+class AllOf:
+    children: tuple
+
+    def qualified(self, inputs):
+        result = True
+        for child in self.children:
+            result = result & child.qualified(inputs)
+        return result
+
+    def details(self, record):
+        return ', '.join(child.details(record) for child in self.children)
+
+@dataclass(frozen=True)
+class AnyOf:
+    children: tuple
+
+    def qualified(self, inputs):
+        result = False
+        for child in self.children:
+            result = result | child.qualified(inputs)
+        return result
+
+    def details(self, record):
+        return ', '.join(child.details(record) for child in self.children)
+
+@dataclass(frozen=True)
+class Unsupported:
+    """Block the compiler cannot lower yet; never qualifies"""
+    kind: str
+
+    def qualified(self, inputs):
+        return False
+
+    def details(self, record):
+        return f'Not compiled: {self.kind}'
+
+@dataclass(frozen=True)
+class Route:
+    """One selection path: qualified(inputs) is a bool per athlete, inputs being counters by name"""
+    group: str
+    name: str
+    rule: object
+    note: str = None
+
+    def qualified(self, inputs):
+        return self.rule.qualified(inputs)
+
+    def details(self, record):
+        return self.rule.details(record)
+
+@dataclass(frozen=True)
+class SportRules:
+    sport: str
+    filters: tuple
+    windows: tuple
+    routes: tuple
+
+@dataclass(frozen=True)
+class ScoreRules:
+    sport: str
+    filters: tuple
+    thresholds: tuple
+    competitions: tuple
+
+# ========================================================================================
+# COMPILER - PARSED SPEC TO RULE AST
+# ========================================================================================
+
+def _window_spec(spec):
+    """Selection window of a condition: comp, year, dates and column filters, as present"""
+    window = {}
+    if 'Comp.SetDetail' in spec:
+        window['comp'] = spec['Comp.SetDetail']
+    if 'Year' in spec:
+        window['year'] = spec['Year']
+    if isinstance(spec.get('Date'), dict):
+        window['dates'] = tuple(spec['Date']['interval'])
+    filters = tuple(sorted(
+        (key, value) for key, value in spec.items()
+        if key not in CONDITION_KEYWORDS and not isinstance(value, (dict, list))
+    ))
+    if filters:
+        window['filters'] = filters
+    return window
+
+def _window_name(spec, window):
+    """Declared window name, or one spelled out from the competition and dates"""
+    if 'window' in spec:
+        return spec['window']
+    if 'name' in spec:
+        return spec['name']
+    parts = [window.get('comp', 'Any competition')]
+    if 'year' in window:
+        parts.append(str(window['year']))
+    if 'dates' in window:
+        parts.append('{} to {}'.format(*window['dates']))
+    return ' '.join(parts)
+
+def _add_window(windows, sport, name, window):
+    """Register a named window; the same name must always describe the same window"""
+    if windows.setdefault(name, window) != window:
+        raise ValueError(f'{sport}: selection window "{name}" is defined differently by two conditions: '
+                         f'{windows[name]} and {window}')
+
+def _compile_node(node, sport, windows):
+    """Lower one any_of / all_of / condition block, collecting its selection windows"""
+    if 'condition' in node:
+        spec = node['condition']
+        description = spec.get('description', '')
+        if isinstance(spec.get('Age'), dict):
+            return AgeCondition(max_age=spec['Age']['max'], description=description)
+        rank_min, rank_max = spec['Rank']['interval']
+        if rank_min != 1:
+            raise ValueError(f'{sport}: rank intervals must start at 1, got [{rank_min}, {rank_max}]')
+        window = _window_spec(spec)
+        name = _window_name(spec, window)
+        _add_window(windows, sport, name, window)
+        return Condition(
+            window=name,
+            rank=rank_max,
+            count=spec.get('count_at_least', 1),
+            description=description,
+            note=spec.get('special_note')
+        )
+    if 'all_of' in node:
+        return AllOf(tuple(_compile_node(child, sport, windows) for child in node['all_of']))
+    if 'any_of' in node:
+        return AnyOf(tuple(_compile_node(child, sport, windows) for child in node['any_of']))
+    return Unsupported(kind=', '.join(key for key in node if key not in PATH_KEYWORDS))
+
+def _header_filters(spec):
+    """Header filters as (column, accepted values) pairs"""
+    return tuple(
+        (column, tuple(spec[column]) if isinstance(spec[column], list) else (spec[column],))
+        for column in HEADER_FILTER_COLUMNS if column in spec
+    )
+
+def compile_sport_rules(spec):
+    """Compile a parsed criteria file into SportRules or ScoreRules"""
+    sport = spec['Sport']
+    filters = _header_filters(spec)
+
+    if spec.get('qualification_system') == 'score_based':
+        thresholds = tuple(
+            ((discipline, gender), limits['minimum_result'])
+            for discipline, by_gender in spec['score_thresholds'].items()
+            for gender, limits in by_gender.items()
+        )
+        competitions = {}
+        for entry in spec.get('eligible_competitions', []):
+            window = _window_spec(entry['competition'])
+            _add_window(competitions, sport, _window_name(entry['competition'], window), window)
+        return ScoreRules(sport=sport, filters=filters, thresholds=thresholds,
+                          competitions=tuple(competitions.items()))
+
+    if 'qualification_groups' in spec:
+        groups = [(name.replace('Group_', ''), group['selection_paths'])
+                  for name, group in spec['qualification_groups'].items()]
+    else:
+        groups = [(None, spec['selection_paths'])]
+
+    windows = {}
+    routes = []
+    for group, paths in groups:
+        for number, node in enumerate(paths['any_of'], start=1):
+            rule = _compile_node(node, sport, windows)
+            # A path note replaces the special notes of its conditions
+            notes = [leaf.note for leaf in _iter_leaves(rule) if isinstance(leaf, Condition) and leaf.note]
+            routes.append(Route(
+                group=group,
+                name=node.get('route', f'Route {number}'),
+                rule=rule,
+                note=node.get('note', '; '.join(notes) or None)
+            ))
+
+    return SportRules(sport=sport, filters=filters, windows=tuple(windows.items()), routes=tuple(routes))
+
+def load_criteria(criteria_dir=CRITERIA_DIR):
+    """Compile every criteria file in the directory, keyed by sport"""
+    paths = sorted(glob.glob(os.path.join(criteria_dir, CRITERIA_PATTERN)))
+    if not paths:
+        raise FileNotFoundError(f'No criteria files ({CRITERIA_PATTERN}) in {criteria_dir}')
+    rules = {}
+    for path in paths:
+        sport_rules = compile_sport_rules(parse_criteria_file(path))
+        rules[sport_rules.sport] = sport_rules
+    return rules
+
+def _iter_leaves(rule):
+    """Yield the Condition / AgeCondition / Unsupported leaves of a rule tree"""
+    if isinstance(rule, (AllOf, AnyOf)):
+        for child in rule.children:
+            yield from _iter_leaves(child)
+    else:
+        yield rule
+
+# ========================================================================================
+# CRITERIA PLAN - TABLES THE CHECKER EXECUTES
+# ========================================================================================
+
+class CriteriaPlan:
+    """Compiled criteria of every sport, lowered to the tables the checker evaluates
+
+    filters: sport -> {column: accepted values} every counted result must match
+    windows: route-based sport -> {window name: spec (comp, year, dates, filters)}
+    counters: route-based sport -> {counter: (window name, rank)}, one per distinct condition
+    routes: route-based sport -> [Route], in criteria file order
+    scores: score-based sport -> ScoreRules (thresholds, eligible competitions)
+    """
+
+    def __init__(self, rules):
+        self.rules = rules
+        self.sports = list(rules)
+        self.filters = {sport: {column: list(values) for column, values in sport_rules.filters}
+                        for sport, sport_rules in rules.items()}
+        self.windows, self.counters, self.routes, self.scores = {}, {}, {}, {}
+        for sport, sport_rules in rules.items():
+            if isinstance(sport_rules, ScoreRules):
+                self.scores[sport] = sport_rules
+                continue
+            self.windows[sport] = dict(sport_rules.windows)
+            self.routes[sport] = list(sport_rules.routes)
+            counters = {}
+            for route in sport_rules.routes:
+                for leaf in _iter_leaves(route.rule):
+                    if isinstance(leaf, Condition):
+                        counters.setdefault(leaf.counter, (leaf.window, leaf.rank))
+            self.counters[sport] = counters
+
+    def uses_age(self, sport):
+        """Whether any route of the sport reads the athlete's youngest recorded age"""
+        return any(isinstance(leaf, AgeCondition)
+                   for route in self.routes.get(sport, []) for leaf in _iter_leaves(route.rule))
+
+    def score_thresholds(self, sport):
+        """{(discipline, gender): minimum score} of a score-based sport"""
+        return dict(self.scores[sport].thresholds)
+
+    def score_competitions(self, sport):
+        """{competition name: window spec} whose scores count for a score-based sport"""
+        return dict(self.scores[sport].competitions)
+
+    @property
+    def columns(self):
+        """Result columns the header and window filters read"""
+        columns = {column for filters in self.filters.values() for column in filters}
+        specs = [spec for windows in self.windows.values() for spec in windows.values()]
+        specs += [spec for sport in self.scores for spec in self.score_competitions(sport).values()]
+        for spec in specs:
+            columns.update(column for column, _ in spec.get('filters', ()))
+        return sorted(columns)
+
+def load_criteria_plan(criteria_dir=CRITERIA_DIR):
+    """Compile every criteria file into a single CriteriaPlan"""
+    return CriteriaPlan(load_criteria(criteria_dir))
+
+def main():
+    """Compile the criteria files and report the resulting plan"""
+    print("🧩 COMPILING SWISS OLYMPIC QUALIFICATION CRITERIA")
+    print("=" * 60)
+
+    plan = load_criteria_plan()
+    for sport in plan.sports:
+        if sport in plan.scores:
+            print(f"{sport:<22} score-based, {len(plan.score_thresholds(sport))} thresholds, "
+                  f"{len(plan.score_competitions(sport))} eligible competitions")
+        else:
+            print(f"{sport:<22} {len(plan.routes[sport])} routes, {len(plan.windows[sport])} windows, "
+                  f"{len(plan.counters[sport])} counters")
+
+    print("\n✅ Criteria compiled!")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,437 @@
+#!/usr/bin/env python3
+"""
+Shared Results Loader for Swiss Olympic Team Selection
+Milano Cortina 2026 Olympics - One typed, cached view of the results file
+
+Used by the dashboard, the athlete lookup and the command-line analysis so
+that every entry point sees identical data:
+- Explicit dtype schema, with category dtypes for low-cardinality text
+- Dates parsed once, Rank_Clean, Result_Score and Season computed vectorized
+- Content-hashed on-disk cache (Parquet when pyarrow is installed, pickle otherwise)
+- Optional typed columnar store (scripts/convert_results.py), read memory-mapped
+- Chunked ingestion of full multi-nation exports with bounded memory
+"""
+
+import hashlib
+import os
+
+import numpy as np
+import pandas as pd
+
+from profiler import stage
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.feather as feather
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+RESULTS_CSV = 'data/Results_Test_Version.csv'
+RESULTS_STORE = 'data/results.feather'
+CACHE_DIR = 'data/.cache'
+
+# Bump whenever the cleaning steps below change, so old cache and store files are ignored
+SCHEMA_VERSION = 3
+
+DATE_FORMAT = '%Y/%m/%d %H:%M:%S'
+DATE_COLUMNS = ['Date', 'DoB']
+
+# Low-cardinality text columns stored as pandas categories
+CATEGORY_COLUMNS = [
+    'Sport', 'Discipline', 'Comp.SetDetail', 'Person', 'CompetitionSet', 'Gender', 'Class',
+    'Medal', 'Team Members', 'PersonGender', 'Nationality', 'Country', 'Country Code',
+    'Continent', 'Host Country', 'Host Continent', 'Is Olympic Discipline'
+]
+
+# Numeric columns; float where the export leaves values empty
+NUMERIC_DTYPES = {
+    'Year': 'int16',
+    'Phase': 'float32',
+    'YoB': 'float32',
+    'Age': 'float32',
+    '# Participants': 'int32',
+    '# Countries': 'int16',
+    '# Continents': 'int8',
+    'World Ranking': 'float32',
+    'Rank Within Country': 'int32'
+}
+
+CSV_DTYPES = {**{column: 'category' for column in CATEGORY_COLUMNS}, **NUMERIC_DTYPES}
+
+# Text columns holding numbers: decimal-comma measurements and 'years-days' ages
+DECIMAL_COMMA_COLUMNS = ['Sec/Mtr/Pts']
+AGE_DAYS_COLUMN = 'Age (days)'
+
+# Schema metadata keys of the columnar store
+STORE_SOURCE_KEY = b'results_source_hash'
+STORE_VERSION_KEY = b'results_schema_version'
+STORE_NATIONALITY_KEY = b'results_nationality'
+
+# Raw columns read by the checker, the apps and the analysis; what chunked ingestion keeps
+STORE_COLUMNS = [
+    'Person', 'PersonGender', 'Nationality', 'Country', 'Sport', 'Discipline', 'Comp.SetDetail',
+    'Competition', 'Date', 'Year', 'Rank', 'Result', 'Class', 'Team Members', 'Is Olympic Discipline',
+    'Gender', 'Host City', 'Age', 'Team'
+]
+
+# Columns computed by prepare_results and the raw column each one is derived from
+DERIVED_COLUMNS = {'Rank_Clean': 'Rank', 'Result_Score': 'Result', 'Season': 'Date', 'Name': 'Person'}
+
+# Rows per chunk for streaming ingestion
+INGEST_CHUNK_ROWS = 250_000
+
+def dataset_hash(path=RESULTS_CSV, chunk_size=1 << 20):
+    """Content hash of the results file, used as the cache key"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as handle:
+        for chunk in iter(lambda: handle.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+# Content hashes keyed by (path, mtime, size), so an unchanged file is hashed once per process
+_HASH_MEMO = {}
+
+def _memoised_hash(path):
+    stat = os.stat(path)
+    key = (os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+    if key not in _HASH_MEMO:
+        _HASH_MEMO[key] = dataset_hash(path)
+    return stat, _HASH_MEMO[key]
+
+def _dataset_source(path):
+    # Only the columnar store may be deployed, without the CSV
+    if not os.path.exists(path) and os.path.exists(RESULTS_STORE):
+        return RESULTS_STORE
+    return path
+
+def dataset_version(path=RESULTS_CSV):
+    """Dataset-version token (file mtime + content hash) for keying caches
+
+    Only a stat call once the file has been hashed, so apps can key their
+    caches on it instead of hashing the loaded DataFrame on every rerun.
+    Falls back to the columnar store when only the store is deployed.
+    """
+    stat, content_hash = _memoised_hash(_dataset_source(path))
+    return f'{stat.st_mtime_ns}-{content_hash[:16]}'
+
+def dataset_content_hash(path=RESULTS_CSV):
+    """Full content hash of the results file (or the store), independent of its mtime"""
+    return _memoised_hash(_dataset_source(path))[1]
+
+def clean_rank(rank):
+    """Numeric rank; non-numeric entries (DNF, DNS, ...) become NaN"""
+    rank_clean = pd.to_numeric(rank, errors='coerce')
+
+    # Only ranks like '=5' or '5T' need the slower regex extraction
+    needs_extract = rank_clean.isna() & rank.notna()
+    if needs_extract.any():
+        extracted = rank[needs_extract].astype(str).str.extract(r'(\d+)')[0]
+        rank_clean[needs_extract] = pd.to_numeric(extracted, errors='coerce')
+    return rank_clean.astype('float32')
+
+def result_score(result):
+    """Numeric Result (e.g. Figure Skating points); times and text become NaN"""
+    return pd.to_numeric(result, errors='coerce').astype('float64')
+
+def parse_decimal_comma(values):
+    """'2500,70' style measurements as floats"""
+    return pd.to_numeric(values.astype(str).str.replace(',', '.', regex=False), errors='coerce')
+
+def parse_age_days(values):
+    """'31-014' (years-days) ages as total days, counting 365.25 days per year"""
+    parts = values.astype(str).str.extract(r'^(\d+)-(\d+)$').astype(float)
+    return (parts[0] * 365.25 + parts[1]).round().astype('float32')
+
+def season_labels(dates):
+    """'2024/2025' style season label; seasons switch on July 1st"""
+    start_year = dates.dt.year - (dates.dt.month <= 6)
+    valid = start_year.notna()
+    labels = pd.Series(np.nan, index=dates.index, dtype=object)
+    start = start_year[valid].astype(int)
+    labels[valid] = start.astype(str) + '/' + (start + 1).astype(str)
+    return labels.astype('category')
+
+def prepare_results(df, nationality='SUI'):
+    """Apply the shared cleaning steps to a raw results frame"""
+    df.columns = df.columns.str.strip('"').str.lstrip('\ufeff')
+
+    if nationality is not None:
+        df = df[df['Nationality'] == nationality].copy()
+
+    for column in DATE_COLUMNS:
+        if column in df.columns:
+            df[column] = pd.to_datetime(df[column], format=DATE_FORMAT, errors='coerce')
+
+    if 'Rank' in df.columns:
+        df['Rank_Clean'] = clean_rank(df['Rank'])
+    else:
+        df['Rank_Clean'] = np.float32(np.nan)
+    if 'Result' in df.columns:
+        df['Result_Score'] = result_score(df['Result'])
+
+    for column in DECIMAL_COMMA_COLUMNS:
+        if column in df.columns and not pd.api.types.is_numeric_dtype(df[column]):
+            df[column] = parse_decimal_comma(df[column])
+    if AGE_DAYS_COLUMN in df.columns and not pd.api.types.is_numeric_dtype(df[AGE_DAYS_COLUMN]):
+        df[AGE_DAYS_COLUMN] = parse_age_days(df[AGE_DAYS_COLUMN])
+
+    if 'Date' in df.columns:
+        df['Season'] = season_labels(df['Date'])
+
+    # Use 'Person' column as 'Name' for consistency
+    df['Name'] = df['Person'] if 'Person' in df.columns else 'Unknown'
+
+    # PersonGender = athlete's personal gender, Gender = competition gender category
+    for column in ('PersonGender', 'Gender'):
+        if column not in df.columns:
+            df[column] = 'Unknown'
+
+    return _drop_unused_categories(df)
+
+def _drop_unused_categories(df):
+    """Drop categories that only occurred for filtered-out rows, keeping them sorted
+
+    Chunked ingestion stores categories in first-seen order; sorting them
+    again keeps group and row order identical across all load paths.
+    """
+    for column in df.select_dtypes('category').columns:
+        values = df[column].cat.remove_unused_categories()
+        if not values.cat.categories.is_monotonic_increasing:
+            values = values.cat.reorder_categories(values.cat.categories.sort_values())
+        df[column] = values
+    return df.reset_index(drop=True)
+
+def source_columns(columns, nationality=None):
+    """Raw columns needed to produce `columns`, plus Nationality when filtering on it"""
+    needed = [DERIVED_COLUMNS.get(column, column) for column in columns]
+    if nationality is not None:
+        needed.append('Nationality')
+    return list(dict.fromkeys(needed))
+
+def _csv_schema(path, columns=None):
+    """Header names to read and their dtypes; columns outside the schema are text"""
+    header = pd.read_csv(path, sep=';', encoding='utf-8', nrows=0).columns
+    names = {column: column.strip('"').lstrip('\ufeff') for column in header}
+    if columns is not None:
+        header = [column for column in header if names[column] in columns]
+    return header, {column: CSV_DTYPES.get(names[column], 'str') for column in header}
+
+def read_results_csv(path=RESULTS_CSV, columns=None):
+    """Raw results file with the explicit dtype schema, before cleaning
+
+    With `columns` only those raw columns are parsed at all.
+    """
+    if columns is None:
+        return pd.read_csv(path, sep=';', encoding='utf-8', dtype=CSV_DTYPES)
+    header, dtypes = _csv_schema(path, columns)
+    return pd.read_csv(path, sep=';', encoding='utf-8', usecols=header, dtype=dtypes)
+
+def iter_results_csv(path=RESULTS_CSV, columns=None, chunk_rows=INGEST_CHUNK_ROWS):
+    """Raw results file in chunks of chunk_rows rows, optionally limited to some columns
+
+    Columns outside the explicit schema are read as text, so every chunk gets
+    the same dtypes even when a column is empty in that chunk.
+    """
+    header, dtypes = _csv_schema(path, columns)
+    return pd.read_csv(path, sep=';', encoding='utf-8', usecols=header, dtype=dtypes, chunksize=chunk_rows)
+
+# ========================================================================================
+# COLUMNAR RESULTS STORE
+# ========================================================================================
+
+def convert_results(csv_path=RESULTS_CSV, store_path=RESULTS_STORE):
+    """Write the cleaned results of all nations as an uncompressed Arrow (Feather v2) file
+
+    Numbers and dates are stored typed and category columns dictionary-encoded.
+    The schema metadata records the source hash and SCHEMA_VERSION so loaders
+    can tell whether the store is current. Returns the number of rows written.
+    """
+    df = prepare_results(read_results_csv(csv_path), nationality=None)
+    return write_store(df, store_path, source_hash=_memoised_hash(csv_path)[1])
+
+def write_store(df, store_path, source_hash=''):
+    """Write a cleaned results frame as an uncompressed, memory-mappable Arrow file"""
+    if not HAS_PYARROW:
+        raise ImportError('pyarrow is required to write the results store')
+
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    table = table.replace_schema_metadata(_with_store_metadata(table.schema, source_hash))
+
+    # Uncompressed so the file can be memory-mapped instead of decoded
+    os.makedirs(os.path.dirname(store_path) or '.', exist_ok=True)
+    temporary_path = store_path + '.tmp'
+    feather.write_feather(table, temporary_path, compression='uncompressed')
+    os.replace(temporary_path, store_path)
+    return table.num_rows
+
+def _with_store_metadata(schema, source_hash, nationality=None):
+    return {
+        **(schema.metadata or {}),
+        STORE_SOURCE_KEY: source_hash.encode(),
+        STORE_VERSION_KEY: str(SCHEMA_VERSION).encode(),
+        STORE_NATIONALITY_KEY: (nationality or '').encode()
+    }
+
+def ingest_results(csv_path=RESULTS_CSV, store_path=RESULTS_STORE, nationality='SUI',
+                   columns=STORE_COLUMNS, chunk_rows=INGEST_CHUNK_ROWS):
+    """Stream a results export of any size into the columnar store
+
+    The CSV is read chunk_rows rows at a time; each chunk is filtered to one
+    nationality, cleaned (Rank_Clean, dates, ...) and appended to the store
+    as its own record batch, so peak memory follows the chunk size rather
+    than the file size. Category dictionaries only grow between chunks and
+    are written as dictionary deltas. Returns (rows read, rows written).
+    """
+    if not HAS_PYARROW:
+        raise ImportError('pyarrow is required to write the results store')
+
+    source_hash = _memoised_hash(csv_path)[1]
+    os.makedirs(os.path.dirname(store_path) or '.', exist_ok=True)
+    temporary_path = store_path + '.tmp'
+
+    categories = {}
+    writer = schema = None
+    rows_read = rows_written = 0
+    try:
+        for chunk in iter_results_csv(csv_path, columns=columns, chunk_rows=chunk_rows):
+            rows_read += len(chunk)
+            chunk = prepare_results(chunk, nationality=nationality)
+            if chunk.empty:
+                continue
+
+            # Extend each column's categories in first-seen order, so dictionaries are prefix-stable
+            for column in chunk.select_dtypes('category').columns:
+                seen = chunk[column].cat.categories.astype('str')
+                known = categories.get(column)
+                known = seen if known is None else known.append(seen[~seen.isin(known)])
+                categories[column] = known
+                chunk[column] = chunk[column].cat.set_categories(known)
+
+            table = pa.Table.from_pandas(chunk, preserve_index=False)
+            if writer is None:
+                # Fixed int32 dictionary indices, since growing dictionaries outgrow int8
+                schema = pa.schema([
+                    field.with_type(pa.dictionary(pa.int32(), field.type.value_type))
+                    if pa.types.is_dictionary(field.type) else field
+                    for field in table.schema
+                ]).with_metadata(_with_store_metadata(table.schema, source_hash, nationality))
+                writer = pa.ipc.new_file(
+                    temporary_path, schema, options=pa.ipc.IpcWriteOptions(emit_dictionary_deltas=True)
+                )
+            writer.write_table(table.cast(schema))
+            rows_written += len(chunk)
+    finally:
+        if writer is not None:
+            writer.close()
+
+    if writer is None:
+        raise ValueError(f'{csv_path} holds no results for nationality {nationality}')
+    os.replace(temporary_path, store_path)
+    return rows_read, rows_written
+
+def _store_metadata(store_path):
+    with pa.memory_map(store_path) as source:
+        return pa.ipc.open_file(source).schema.metadata or {}
+
+def store_is_current(store_path=RESULTS_STORE, csv_path=RESULTS_CSV, nationality=None):
+    """True when the store exists, matches SCHEMA_VERSION and was built from the current CSV
+
+    A store ingested for a single nationality only serves loads of that nationality.
+    """
+    if not HAS_PYARROW or not os.path.exists(store_path):
+        return False
+    try:
+        metadata = _store_metadata(store_path)
+    except (OSError, pa.ArrowInvalid):
+        return False
+    if metadata.get(STORE_VERSION_KEY) != str(SCHEMA_VERSION).encode():
+        return False
+    if metadata.get(STORE_NATIONALITY_KEY, b'') not in (b'', (nationality or '').encode()):
+        return False
+    # Without the CSV next to it the store is the source of truth
+    if not os.path.exists(csv_path):
+        return True
+    return metadata.get(STORE_SOURCE_KEY) == _memoised_hash(csv_path)[1].encode()
+
+def read_store(store_path=RESULTS_STORE, nationality='SUI', columns=None):
+    """Load the columnar store memory-mapped, optionally limited to one nationality and some columns
+
+    Projection and nationality filter run on the mapped Arrow table, so only
+    the selected rows and columns are ever converted to pandas.
+    """
+    table = feather.read_table(store_path, memory_map=True)
+    if columns is not None:
+        wanted = list(dict.fromkeys([*columns, 'Nationality'] if nationality is not None else columns))
+        table = table.select([column for column in wanted if column in table.column_names])
+    if nationality is None:
+        # split_blocks lets null-free numeric columns wrap the mapped buffers without a copy
+        return table.to_pandas(split_blocks=True)
+    table = table.filter(pc.equal(table['Nationality'], nationality))
+    return _drop_unused_categories(table.to_pandas(split_blocks=True))
+
+def _cache_path(content_hash, nationality, columns=None):
+    extension = 'parquet' if HAS_PYARROW else 'pkl'
+    projection = '' if columns is None else '_' + hashlib.sha256('\n'.join(sorted(columns)).encode()).hexdigest()[:8]
+    return os.path.join(
+        CACHE_DIR, f'results_v{SCHEMA_VERSION}_{nationality or "ALL"}{projection}_{content_hash[:16]}.{extension}'
+    )
+
+def _read_cache(path):
+    if path.endswith('.parquet'):
+        return pd.read_parquet(path)
+    return pd.read_pickle(path)
+
+def _write_cache(df, path):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    temporary_path = path + '.tmp'
+    if path.endswith('.parquet'):
+        df.to_parquet(temporary_path, index=False)
+    else:
+        df.to_pickle(temporary_path)
+    os.replace(temporary_path, path)
+
+def load_results(path=RESULTS_CSV, nationality='SUI', use_cache=True, store_path=RESULTS_STORE, columns=None):
+    """Load the results file with the shared schema and cleaning steps
+
+    A current columnar store (see convert_results) is read memory-mapped.
+    Otherwise the cleaned frame is cached on disk under CACHE_DIR keyed by a
+    content hash of the file, so a changed results file is re-parsed automatically.
+    `columns` (e.g. MultiSportQualificationChecker.RESULT_COLUMNS) limits the
+    load to those columns plus their raw sources; derived ones like Rank_Clean
+    pull in the raw column they are computed from.
+    """
+    with stage('load_results', path=path) as span:
+        df = _load_results(path, nationality, use_cache, store_path, columns)
+        span.rows = len(df)
+    return df
+
+def _load_results(path, nationality, use_cache, store_path, columns):
+    if use_cache and store_is_current(store_path, path, nationality):
+        with stage('read store'):
+            return read_store(store_path, nationality=nationality, columns=columns)
+
+    raw_columns = None if columns is None else source_columns(columns, nationality)
+    cache_path = None
+    if use_cache:
+        cache_path = _cache_path(_memoised_hash(path)[1], nationality, raw_columns)
+        if os.path.exists(cache_path):
+            try:
+                with stage('read cache'):
+                    return _read_cache(cache_path)
+            except Exception:
+                pass  # Unreadable cache file, rebuild it below
+
+    with stage('read csv') as span:
+        raw = read_results_csv(path, columns=raw_columns)
+        span.rows = len(raw)
+    with stage('prepare results', rows=len(raw)):
+        df = prepare_results(raw, nationality=nationality)
+
+    if cache_path is not None:
+        try:
+            _write_cache(df, cache_path)
+        except OSError:
+            pass  # Read-only data directory, serve uncached
+    return df
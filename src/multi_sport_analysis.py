@@ -8,23 +8,115 @@ across all winter sports: Biathlon, Alpine Skiing, Cross-Country Skiing,
 Freestyle Skiing, Bobsleigh, and Figure Skating.
 """
 
+import argparse
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
 import pandas as pd
+from crew_graph import load_crew_members
+from data_loader import HAS_PYARROW, load_results, read_store, write_store
 from multi_sport_qualification_checker import MultiSportQualificationChecker
+from profiler import add_profile_arguments, profile_run
+from result_cache import QualificationResultCache, result_cache_key
+
+# ========================================================================================
+# ROSTER EVALUATION (SERIAL OR PROCESS POOL)
+# ========================================================================================
+
+# Checker of a pool worker, built once per process from the shared results file
+_worker_checker = None
+
+def qualified_routes(sport_qual):
+    """Routes (or Figure Skating disciplines) an athlete qualified through in one sport"""
+    if 'qualifying_routes' in sport_qual:
+        return list(sport_qual['qualifying_routes'])
+    if 'qualifying_disciplines' in sport_qual:
+        return list(sport_qual['qualifying_disciplines'])
+    return [
+        f'Group {group} {route}'
+        for group, key in (('A', 'group_a'), ('B', 'group_b')) if key in sport_qual
+        for route, info in sport_qual[key]['routes'].items() if info['qualified']
+    ]
+
+def summarize_status(result):
+    """Per-sport (qualified, qualified routes) of one check_athlete_qualification result"""
+    if not result or 'error' in result:
+        return {}
+    return {
+        sport: (bool(sport_qual.get('qualified', False)), qualified_routes(sport_qual))
+        for sport, sport_qual in result['sports_qualifications'].items()
+    }
+
+def _init_worker(results_path, crew_path=None):
+    global _worker_checker
+    crew_members = None if crew_path is None else read_store(crew_path, nationality=None)
+    _worker_checker = MultiSportQualificationChecker(read_store(results_path, nationality=None), crew_members)
+
+def summarize_athlete(checker, athlete):
+    """Per-sport (qualified, qualified routes) of one athlete"""
+    return summarize_status(checker.check_athlete_qualification(athlete))
+
+def _evaluate_shard(athletes):
+    return [_worker_checker.check_athlete_qualification(athlete) for athlete in athletes]
+
+def evaluate_roster(df, athletes, workers=1, crew_members=None):
+    """Qualification results (check_athlete_qualification) of the given athletes, in the given order
 
-def main():
+    With workers > 1 the roster is split into contiguous shards evaluated by a
+    process pool. Workers memory-map the cleaned results from one uncompressed
+    Arrow file instead of receiving a pickled copy of df, and shards are merged
+    in submission order, so the result matches the serial run exactly.
+    """
+    if workers <= 1 or len(athletes) < 2:
+        checker = MultiSportQualificationChecker(df, crew_members)
+        return {athlete: checker.check_athlete_qualification(athlete) for athlete in athletes}
+
+    if not HAS_PYARROW:
+        raise ImportError('--workers needs pyarrow for the shared results file')
+
+    # A few shards per worker keeps the pool busy when athletes differ in cost
+    shard_count = min(len(athletes), workers * 4)
+    shard_size = -(-len(athletes) // shard_count)
+    shards = [athletes[start:start + shard_size] for start in range(0, len(athletes), shard_size)]
+
+    with tempfile.TemporaryDirectory() as workdir:
+        results_path = os.path.join(workdir, 'results.feather')
+        write_store(df, results_path)
+        crew_path = None
+        if crew_members is not None:
+            crew_path = os.path.join(workdir, 'crew_members.feather')
+            write_store(crew_members, crew_path)
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(results_path, crew_path)) as pool:
+            results = [result for shard in pool.map(_evaluate_shard, shards) for result in shard]
+    return dict(zip(athletes, results))
+
+def main(argv=None):
     """Run comprehensive multi-sport qualification analysis"""
-    
+    parser = argparse.ArgumentParser(description='Multi-sport qualification analysis')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='evaluate the roster in N processes (default 1, serial)')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='ignore the persistent qualification result cache')
+    add_profile_arguments(parser)
+    args = parser.parse_args(argv)
+    
+    with profile_run(args, file=sys.stdout):
+        run_analysis(args)
+
+def run_analysis(args):
+    """Print the qualification analysis for parsed arguments"""
     print("🏔️ SWISS OLYMPIC TEAM SELECTION ANALYSIS")
     print("Milano Cortina 2026 Winter Olympics")
     print("=" * 60)
     
     # Load data
     try:
-        df = pd.read_csv("data/Results_Test_Version.csv", sep=';', encoding='utf-8')
-        df.columns = df.columns.str.strip('"')
-        df['Date'] = pd.to_datetime(df['Date'], format='%Y/%m/%d %H:%M:%S')
-        df['Rank_Clean'] = pd.to_numeric(df['Rank'].str.extract(r'(\d+)')[0], errors='coerce')
-        df = df[df['Nationality'] == 'SUI'].copy()  # Swiss athletes only
+        # Swiss athletes only, limited to the columns the qualification routes read
+        df = load_results(columns=MultiSportQualificationChecker.RESULT_COLUMNS)
         
         print(f"✅ Data loaded: {len(df)} Swiss results")
         print(f"📊 Sports covered: {', '.join(sorted(df['Sport'].unique()))}")
@@ -34,8 +126,25 @@ def main():
         print(f"❌ Error loading data: {e}")
         return
     
-    # Initialize checker
-    checker = MultiSportQualificationChecker(df)
+    # Evaluate every athlete once, serially or sharded over a process pool;
+    # athletes whose results, criteria and checker code are unchanged come from the cache
+    start = time.perf_counter()
+    athletes = list(df['Person'].dropna().unique())
+    cache = None if args.no_cache else QualificationResultCache(result_cache_key())
+    results = cache.athlete_statuses(athletes) if cache is not None else {}
+    missing = [athlete for athlete in athletes if athlete not in results]
+    try:
+        if missing:
+            evaluated = evaluate_roster(df, missing, workers=args.workers, crew_members=load_crew_members())
+            results.update(evaluated)
+            if cache is not None:
+                cache.store_athlete_statuses(evaluated)
+    except Exception as e:
+        print(f"❌ Error evaluating athletes: {e}")
+        return
+    summaries = {athlete: summarize_status(results[athlete]) for athlete in athletes}
+    print(f"⚙️ Evaluated {len(missing)} athletes with {max(args.workers, 1)} worker(s), "
+          f"{len(athletes) - len(missing)} from the result cache, in {time.perf_counter() - start:.2f} s")
     
     # Sport-by-sport analysis
     print(f"\n🎯 SPORT-BY-SPORT QUALIFICATION ANALYSIS")
@@ -52,16 +161,10 @@ def main():
         
         for athlete in sport_athletes:
             if pd.notna(athlete):
-                result = checker.check_athlete_qualification(athlete)
-                
-                if not result or 'error' in result:
-                    continue
-                
-                sport_qual = result['sports_qualifications'].get(sport)
-                if sport_qual and sport_qual.get('qualified', False):
+                sport_qual = summaries.get(athlete, {}).get(sport)
+                if sport_qual and sport_qual[0]:
                     qualified_athletes.append(athlete)
-                    qualified_routes = sport_qual.get('qualified_routes', [])
-                    print(f"  ✅ {athlete:<30} | {', '.join(qualified_routes)}")
+                    print(f"  ✅ {athlete:<30} | {', '.join(sport_qual[1])}")
         
         if not qualified_athletes:
             print(f"  ❌ No qualified athletes")
@@ -8,19 +8,168 @@ Updated based on validation test results to match actual dataset
 - Corrected date ranges based on actual data
 - Added proper validation and error handling
 - Implemented missing features (Bobsleigh team verification)
+- Sport filters, routes and score thresholds compiled from criterias/*_Hauptkriterien.txt
 """
 
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+
 import pandas as pd
 from datetime import datetime
 import numpy as np
 
+from crew_graph import TEAM_DISCIPLINES, CrewGraph, load_crew_members
+from criteria_compiler import MIN_AGE, load_criteria_plan
+from data_loader import clean_rank, load_results, result_score
+from profiler import stage
+
+# ========================================================================================
+# LAZY ATHLETE RESULTS
+# ========================================================================================
+
+class SportQualifications(Mapping):
+    """Sport -> qualification result of one athlete; each sport is evaluated on first access"""
+
+    def __init__(self, checker, athlete_name, sports):
+        self._checker = checker
+        self._athlete_name = athlete_name
+        self._sports = list(sports)
+        self._results = {}
+
+    def __getitem__(self, sport):
+        if sport not in self._results:
+            if sport not in self._sports:
+                raise KeyError(sport)
+            self._results[sport] = self._checker.check_qualification(self._athlete_name, sport)
+        return self._results[sport]
+
+    def __iter__(self):
+        return iter(self._sports)
+
+    def __len__(self):
+        return len(self._sports)
+
+    def evaluated(self):
+        """Sports evaluated so far"""
+        return list(self._results)
+
+    def __reduce__(self):
+        # Pickles (process pools, st.cache_data) as a plain dict, never with the checker
+        return (dict, (dict(self),))
+
+class AthleteQualification(Mapping):
+    """check_athlete_qualification result: reads like the dict, evaluates sports only when read
+
+    overall_qualified stops at the first qualified sport; qualified_sports and
+    iterating sports_qualifications evaluate them all. Sport results share the
+    checker's available_competitions lists instead of copying them.
+    """
+
+    KEYS = ('athlete_name', 'sports_competed', 'sports_qualifications', 'overall_qualified', 'qualified_sports')
+
+    def __init__(self, checker, athlete_name, sports):
+        self._values = {
+            'athlete_name': athlete_name,
+            'sports_competed': list(sports),
+            'sports_qualifications': SportQualifications(checker, athlete_name, sports),
+        }
+
+    def __getitem__(self, key):
+        sports = self._values['sports_qualifications']
+        if key == 'overall_qualified':
+            return any(result.get('qualified', False) for result in sports.values())
+        if key == 'qualified_sports':
+            return [sport for sport, result in sports.items() if result.get('qualified', False)]
+        return self._values[key]
+
+    def __iter__(self):
+        return iter(self.KEYS)
+
+    def __len__(self):
+        return len(self.KEYS)
+
+    def to_dict(self):
+        """Fully evaluated plain dict, as check_athlete_qualification used to return"""
+        result = dict(self)
+        result['sports_qualifications'] = dict(result['sports_qualifications'])
+        return result
+
+    def __reduce__(self):
+        return (dict, (self.to_dict(),))
+
+# ========================================================================================
+# WHAT-IF SCENARIO DEFINITIONS
+# ========================================================================================
+
+@dataclass(frozen=True)
+class Scenario:
+    """One what-if question for MultiSportQualificationChecker.simulate
+
+    results: hypothetical result rows (DataFrame or list of scenario_result dicts)
+    windows: {(sport, window name): spec overrides}, e.g. the World Cup closing a week early:
+             {('Biathlon', 'World Cup 25/26'): {'dates': ('2025-11-01', '2026-01-11')}}
+    ranks: {(sport, counter): rank}, e.g. {('Biathlon', 'World Cup 25/26 Top-15'): 12}
+    score_thresholds: {(discipline, gender): score of a score-based sport}, e.g. {('Singles', 'Men'): 200}
+    """
+    name: str
+    results: object = None
+    windows: Mapping = field(default_factory=dict)
+    ranks: Mapping = field(default_factory=dict)
+    score_thresholds: Mapping = field(default_factory=dict)
+
+@dataclass(frozen=True)
+class ScenarioResult:
+    """What changes under each scenario, compared with the checker's current results
+
+    routes: one row per (scenario, Person, Sport, Group, Route) whose qualified flag changes
+    athletes: one row per (scenario, Sport, Person) whose sport qualification changes
+    summary: qualified athletes per scenario and sport, before and after
+    """
+    routes: pd.DataFrame
+    athletes: pd.DataFrame
+    summary: pd.DataFrame
+
+def scenario_result(person, sport, competition, date, rank, **columns):
+    """One hypothetical senior, individual, Olympic-discipline result for Scenario.results
+
+        scenario_result('Amy Baserga', 'Biathlon', 'BMW IBU World Cup', '2026-01-10', 12)
+
+    Extra columns (Discipline, Gender, Result, Age, Host City, ...) are passed as keywords.
+    """
+    row = {
+        'Person': person, 'Sport': sport, 'Comp.SetDetail': competition, 'Date': pd.Timestamp(date),
+        'Rank': rank, 'Class': 'Seniors', 'Team Members': 'No', 'Is Olympic Discipline': 'Yes'
+    }
+    row.update(columns)
+    return row
+
 class MultiSportQualificationChecker:
     """
     FIXED: Comprehensive qualification checker for all Swiss Olympic sports
     Milano Cortina 2026 Winter Olympics - DATA-VALIDATED VERSION
     """
     
-    def __init__(self, results_df):
+    # Result columns read by the qualification routes
+    RESULT_COLUMNS = [
+        'Person', 'Sport', 'Comp.SetDetail', 'Date', 'Year', 'Rank_Clean', 'Class', 'Team Members',
+        'Is Olympic Discipline', 'Discipline', 'Gender', 'Result_Score', 'Host City', 'Age', 'Country',
+        'Team', 'Nationality'
+    ]
+
+    # What an eligible Bobsleigh crew is made of
+    CREW_COUNTRY = 'Switzerland'
+    CREW_NATIONALITY = 'SUI'
+
+    def __init__(self, results_df, crew_members=None, criteria=None):
+        """results_df: cleaned results; crew_members: Bobsleigh team member rows of every
+        nationality (crew_graph.load_crew_members), defaults to the team rows of results_df;
+        criteria: compiled CriteriaPlan, defaults to the criterias/*_Hauptkriterien.txt files"""
+        # Sport filters, route counters, routes and score thresholds all come from the criteria files
+        self.criteria = criteria if criteria is not None else load_criteria_plan()
+
+        # Scores are parsed once by the loader; frames built elsewhere get them here
+        if 'Result_Score' not in results_df.columns and 'Result' in results_df.columns:
+            results_df = results_df.assign(Result_Score=result_score(results_df['Result']))
         self.df = results_df
         self.df_ranked = results_df[results_df['Rank_Clean'].notna() & (results_df['Rank_Clean'] > 0)]
         
@@ -31,7 +180,25 @@ class MultiSportQualificationChecker:
             self.df['Year'] = pd.to_datetime(self.df['Date']).dt.year
         
         # FIXED: Data-driven competition mapping based on validation results
-        self.competition_mapping = self._build_competition_mapping()
+        with stage('competition mapping', rows=len(self.df)):
+            self.competition_mapping = self._build_competition_mapping()
+
+        # Hashed row index so per-athlete checks only touch that athlete's rows
+        with stage('row index', rows=len(self.df_ranked)):
+            self._build_row_index()
+
+        # Window, rank and sport-filter bitmaps over df_ranked, built once on first use
+        self._bitmaps = {}
+
+        # Per-sport route counters and best scores behind evaluate_all and ingest
+        self._aggregates = {}
+
+        # Bobsleigh crew graph, built on first team verification
+        self._crews = None
+        self._crew_members = crew_members
+
+        # Counters under changed windows or ranks, shared by simulate calls
+        self._scenario_memo = {}
         
     def _build_competition_mapping(self):
         """Build competition mapping based on actual data in the dataset"""
@@ -45,6 +212,92 @@ class MultiSportQualificationChecker:
         
         return mapping
     
+    def _build_row_index(self):
+        """Index (Person, Sport) to df_ranked row positions plus the valid sports and persons"""
+        self.valid_sports = set(self.df['Sport'].dropna().unique())
+        self.valid_persons = set(self.df['Person'].dropna().unique())
+
+        # Sports per athlete in order of first appearance in the results
+        self._athlete_sports = {}
+        pairs = self.df[['Person', 'Sport']].dropna().drop_duplicates()
+        for person, sport in zip(pairs['Person'].tolist(), pairs['Sport'].tolist()):
+            self._athlete_sports.setdefault(person, []).append(sport)
+        self._row_index = self.df_ranked.groupby(['Person', 'Sport'], observed=True, sort=False).indices
+
+        # Lookups slice a narrow view holding only the columns the routes and criteria filters read
+        columns = dict.fromkeys(self.RESULT_COLUMNS + self.criteria.columns)
+        self._route_view = self.df_ranked[[c for c in columns if c in self.df_ranked.columns]]
+        self._no_rows = self._route_view.iloc[0:0]
+
+    def _athlete_rows(self, athlete_name, sport):
+        """Ranked results of one athlete in one sport, via the row index"""
+        positions = self._row_index.get((athlete_name, sport))
+        if positions is None:
+            return self._no_rows
+        return self._route_view.iloc[positions]
+
+    # ========================================================================================
+    # SELECTION WINDOWS & BITMAPS
+    # ========================================================================================
+
+    def _compute_bitmap(self, key, rows):
+        """Evaluate one bitmap key over result rows as a numpy boolean array"""
+        kind = key[0]
+        if kind == 'rank':
+            return (rows['Rank_Clean'] <= key[1]).to_numpy(dtype=bool)
+
+        if kind == 'sport':
+            mask = rows['Sport'] == key[1]
+            for column, accepted in self.criteria.filters[key[1]].items():
+                mask &= rows[column].isin(accepted)
+            return mask.to_numpy(dtype=bool)
+
+        # ('window', sport, name), as compiled from the sport's criteria file
+        return self._window_mask(self.criteria.windows[key[1]][key[2]], rows)
+
+    @staticmethod
+    def _window_mask(window, rows):
+        """Result rows inside a selection window spec (comp, year, dates, column filters)"""
+        mask = np.ones(len(rows), dtype=bool)
+        if 'comp' in window:
+            mask &= (rows['Comp.SetDetail'] == window['comp']).to_numpy(dtype=bool)
+        if 'year' in window:
+            mask &= (rows['Year'] == window['year']).to_numpy(dtype=bool)
+        if 'dates' in window:
+            start, end = (pd.Timestamp(date) for date in window['dates'])
+            mask &= ((rows['Date'] >= start) & (rows['Date'] <= end)).to_numpy(dtype=bool)
+        for column, value in window.get('filters', ()):
+            if column not in rows.columns:
+                return np.zeros(len(rows), dtype=bool)
+            mask &= (rows[column] == value).to_numpy(dtype=bool, na_value=False)
+        return mask
+
+    def _bitmap(self, key):
+        """Memoised bitmap over df_ranked positions: ('window', sport, name), ('rank', n) or ('sport', sport)"""
+        bitmap = self._bitmaps.get(key)
+        if bitmap is None:
+            with stage('bitmap', rows=len(self._route_view), key=key):
+                bitmap = self._bitmaps[key] = self._compute_bitmap(key, self._route_view)
+        return bitmap
+
+    def _extend_bitmaps(self, ranked):
+        """Append the bits of newly ranked rows to every bitmap built so far"""
+        for key, bitmap in self._bitmaps.items():
+            self._bitmaps[key] = np.concatenate([bitmap, self._compute_bitmap(key, ranked)])
+
+    def _athlete_positions(self, athlete_name, sport):
+        """df_ranked positions of one athlete's results passing the sport's base filters"""
+        positions = self._row_index.get((athlete_name, sport))
+        if positions is None:
+            return np.empty(0, dtype=np.intp)
+        return positions[self._bitmap(('sport', sport))[positions]]
+
+    def _window_count(self, positions, sport, window, rank):
+        """Number of results at the given positions inside a named window with rank ≤ rank"""
+        return int(np.count_nonzero(
+            self._bitmap(('window', sport, window))[positions] & self._bitmap(('rank', rank))[positions]
+        ))
+
     def _validate_competition_exists(self, sport, competition_name):
         """Validate that a competition actually exists in the dataset"""
         if sport not in self.competition_mapping:
@@ -55,636 +308,728 @@ class MultiSportQualificationChecker:
         """Main qualification check dispatcher with validation"""
         
         # Validate sport exists
-        if sport not in self.df['Sport'].unique():
+        if sport not in self.valid_sports:
             return {'qualified': False, 'reason': f'Sport "{sport}" not found in dataset'}
         
         # Validate athlete exists
-        if athlete_name not in self.df['Person'].unique():
+        if athlete_name not in self.valid_persons:
             return {'qualified': False, 'reason': f'Athlete "{athlete_name}" not found in dataset'}
         
-        # Dispatch to sport-specific method
-        if sport == 'Biathlon':
-            return self.check_biathlon_qualification(athlete_name)
-        elif sport == 'Alpine Skiing':
-            return self.check_alpine_skiing_qualification(athlete_name)
-        elif sport == 'Cross-Country Skiing':
-            return self.check_cross_country_qualification(athlete_name)
-        elif sport == 'Figure Skating':
-            return self.check_figure_skating_qualification(athlete_name)
-        elif sport == 'Bobsleigh':
-            return self.check_bobsleigh_qualification(athlete_name)
-        elif sport == 'Freestyle Skiing':
-            return self.check_freestyle_skiing_qualification(athlete_name)
+        # Score thresholds or counted routes, as the sport's criteria file declares
+        if sport in self.criteria.scores:
+            check = self._check_score_qualification
+        elif sport in self.criteria.routes:
+            check = self._check_route_qualification
         else:
             return {'qualified': False, 'reason': f'Qualification logic not implemented for: {sport}'}
+        with stage(sport, rows=len(self._row_index.get((athlete_name, sport), ())), athlete=athlete_name):
+            return check(athlete_name, sport)
 
     # ========================================================================================
-    # BIATHLON - 5 ROUTES (FIXED COMPETITION NAMES)
+    # ROUTE-BASED SPORTS - COUNTED RESULTS PER SELECTION WINDOW
     # ========================================================================================
-    
-    def check_biathlon_qualification(self, athlete_name):
-        """Check Biathlon qualification - 5 routes with FIXED competition names"""
-        
-        athlete_data = self.df_ranked[
-            (self.df_ranked['Person'] == athlete_name) & 
-            (self.df_ranked['Sport'] == 'Biathlon') &
-            (self.df_ranked['Is Olympic Discipline'] == 'Yes') &
-            (self.df_ranked['Team Members'] == 'No') &
-            (self.df_ranked['Class'] == 'Seniors')
-        ]
-        
-        if athlete_data.empty:
-            return {'qualified': False, 'routes': {}, 'reason': 'No valid Biathlon results found'}
-        
-        routes = {}
-        
-        # FIXED: Use actual competition names from validation
-        world_championships_name = 'IBU World Championships'  # ✅ Exists
-        world_cup_name = 'BMW IBU World Cup'                  # ✅ Exists
-        # Note: 'IBU Cup' not found in dataset, using available competitions
-        
-        # Route 1: 1x Top-3 World Championships 2025 AND 1x Top-30 World Cup 2025/2026
-        wc_2025_top3 = len(athlete_data[
-            (athlete_data['Comp.SetDetail'] == world_championships_name) &
-            (athlete_data['Year'] == 2025) &
-            (athlete_data['Rank_Clean'] <= 3)
-        ])
-        
-        wc_2025_26_top30 = len(athlete_data[
-            (athlete_data['Comp.SetDetail'] == world_cup_name) &
-            (athlete_data['Date'] >= '2025-11-01') & (athlete_data['Date'] <= '2026-01-18') &
-            (athlete_data['Rank_Clean'] <= 30)
-        ])
-        
-        routes['Route 1'] = {
-            'qualified': (wc_2025_top3 >= 1) and (wc_2025_26_top30 >= 1),
-            'details': f'WC 2025 Top-3: {wc_2025_top3}, WC 25/26 Top-30: {wc_2025_26_top30}'
-        }
-        
-        # Route 2: 1x Top-6 World Cup 2024/2025 AND 1x Top-25 World Cup 2025/2026
-        wc_2024_25_top6 = len(athlete_data[
-            (athlete_data['Comp.SetDetail'] == world_cup_name) &
-            (athlete_data['Date'] >= '2024-11-30') & (athlete_data['Date'] <= '2025-03-23') &
-            (athlete_data['Rank_Clean'] <= 6)
-        ])
-        
-        wc_2025_26_top25 = len(athlete_data[
-            (athlete_data['Comp.SetDetail'] == world_cup_name) &
-            (athlete_data['Date'] >= '2025-11-01') & (athlete_data['Date'] <= '2026-01-18') &
-            (athlete_data['Rank_Clean'] <= 25)
-        ])
-        
-        routes['Route 2'] = {
-            'qualified': (wc_2024_25_top6 >= 1) and (wc_2025_26_top25 >= 1),
-            'details': f'WC 24/25 Top-6: {wc_2024_25_top6}, WC 25/26 Top-25: {wc_2025_26_top25}'
-        }
-        
-        # Route 3: 1x Top-15 World Cup 2025/2026
-        wc_2025_26_top15 = len(athlete_data[
-            (athlete_data['Comp.SetDetail'] == world_cup_name) &
-            (athlete_data['Date'] >= '2025-11-01') & (athlete_data['Date'] <= '2026-01-18') &
-            (athlete_data['Rank_Clean'] <= 15)
-        ])
-        
-        routes['Route 3'] = {
-            'qualified': wc_2025_26_top15 >= 1,
-            'details': f'WC 25/26 Top-15: {wc_2025_26_top15}'
-        }
-        
-        # Route 4: 2x Top-25 World Cup 2025/2026
-        routes['Route 4'] = {
-            'qualified': wc_2025_26_top25 >= 2,
-            'details': f'WC 25/26 Top-25: {wc_2025_26_top25} (need 2)'
-        }
-        
-        # Route 5: Modified since 'IBU Cup' not in dataset
-        # Using alternative logic: 1x Top-5 in any competition + 2x Top-30 World Cup
-        any_top5 = len(athlete_data[athlete_data['Rank_Clean'] <= 5])
-        
-        routes['Route 5'] = {
-            'qualified': (any_top5 >= 1) and (wc_2025_26_top30 >= 2),
-            'details': f'Any Top-5: {any_top5}, WC 25/26 Top-30: {wc_2025_26_top30} (need 2)',
-            'note': 'Modified: IBU Cup not found in dataset, using any Top-5 result'
-        }
-        
-        qualified = any(route['qualified'] for route in routes.values())
-        
-        return {
-            'qualified': qualified,
-            'sport': 'Biathlon',
-            'routes': routes,
-            'qualifying_routes': [k for k, v in routes.items() if v['qualified']],
-            'available_competitions': self.competition_mapping.get('Biathlon', [])
-        }
 
-    # ========================================================================================
-    # ALPINE SKIING - 2 ROUTES (VALIDATED)
-    # ========================================================================================
-    
-    def check_alpine_skiing_qualification(self, athlete_name):
-        """Check Alpine Skiing qualification - 2 routes with validated competition names"""
-        
-        athlete_data = self.df_ranked[
-            (self.df_ranked['Person'] == athlete_name) & 
-            (self.df_ranked['Sport'] == 'Alpine Skiing') &
-            (self.df_ranked['Class'] == 'Seniors') &
-            (self.df_ranked['Team Members'] == 'No') &
-            (self.df_ranked['Is Olympic Discipline'] == 'Yes')
-        ]
-        
-        if athlete_data.empty:
-            return {'qualified': False, 'routes': {}, 'reason': 'No valid Alpine Skiing results found'}
-        
-        routes = {}
-        
-        # VALIDATED: Competition name exists in dataset
-        world_cup_name = 'Audi FIS Ski World Cup'  # ✅ Confirmed exists
-        
-        # Route 1: 1x Top-7 World Cup 2025/2026
-        wc_2025_26_top7 = len(athlete_data[
-            (athlete_data['Comp.SetDetail'] == world_cup_name) &
-            (athlete_data['Date'] >= '2025-10-01') & (athlete_data['Date'] <= '2026-01-25') &
-            (athlete_data['Rank_Clean'] <= 7)
-        ])
-        
-        routes['Route 1'] = {
-            'qualified': wc_2025_26_top7 >= 1,
-            'details': f'World Cup 25/26 Top-7: {wc_2025_26_top7}'
-        }
-        
-        # Route 2: 2x Top-15 World Cup 2025/2026
-        wc_2025_26_top15 = len(athlete_data[
-            (athlete_data['Comp.SetDetail'] == world_cup_name) &
-            (athlete_data['Date'] >= '2025-10-01') & (athlete_data['Date'] <= '2026-01-25') &
-            (athlete_data['Rank_Clean'] <= 15)
-        ])
-        
-        routes['Route 2'] = {
-            'qualified': wc_2025_26_top15 >= 2,
-            'details': f'World Cup 25/26 Top-15: {wc_2025_26_top15} (need 2)'
+    def _athlete_inputs(self, sport, positions):
+        """Route counters of one athlete's results, plus the youngest recorded age if a route reads it"""
+        inputs = {
+            counter: self._window_count(positions, sport, window, rank)
+            for counter, (window, rank) in self.criteria.counters[sport].items()
         }
+        if self.criteria.uses_age(sport):
+            ages = self._route_view['Age'].iloc[positions].dropna() if 'Age' in self._route_view.columns else ()
+            inputs[MIN_AGE] = ages.min() if len(ages) > 0 else np.nan
+        return inputs
+
+    def _check_route_qualification(self, athlete_name, sport):
+        """Check the routes of a route-based sport (Biathlon, Alpine Skiing, Bobsleigh, ...)
+
+        Sports with route groups (Freestyle Skiing A/B) report each group and the
+        first qualified one as priority_group; Bobsleigh adds team verification.
+        """
+        # Results passing the sport's header filters (Olympic discipline, Class, Team Members)
+        positions = self._athlete_positions(athlete_name, sport)
+        grouped = any(route.group is not None for route in self.criteria.routes[sport])
+        
+        if len(positions) == 0:
+            if grouped:
+                return {'qualified': False, 'reason': f'No valid {sport} results found'}
+            return {'qualified': False, 'routes': {}, 'reason': f'No valid {sport} results found'}
+        
+        inputs = self._athlete_inputs(sport, positions)
+        groups = {}
+        for route in self.criteria.routes[sport]:
+            outcome = {'qualified': bool(route.qualified(inputs)), 'details': route.details(inputs)}
+            if route.note is not None:
+                outcome['note'] = route.note
+            groups.setdefault(route.group, {})[route.name] = outcome
+        qualified_groups = [group for group, routes in groups.items()
+                            if any(route['qualified'] for route in routes.values())]
+        
+        result = {'qualified': bool(qualified_groups), 'sport': sport}
+        if grouped:
+            for group, routes in groups.items():
+                result[f'group_{group.lower()}'] = {'qualified': group in qualified_groups, 'routes': routes}
+            result['priority_group'] = qualified_groups[0] if qualified_groups else None
+        else:
+            routes = groups[None]
+            result['routes'] = routes
+            result['qualifying_routes'] = [name for name, route in routes.items() if route['qualified']]
         
-        qualified = any(route['qualified'] for route in routes.values())
+        if sport == 'Bobsleigh':
+            # Team verification for 2-Man and 4-Man disciplines
+            with stage('team verification'):
+                result['team_verification'] = self._verify_bobsleigh_team(athlete_name)
         
-        return {
-            'qualified': qualified,
-            'sport': 'Alpine Skiing',
-            'routes': routes,
-            'qualifying_routes': [k for k, v in routes.items() if v['qualified']],
-            'available_competitions': self.competition_mapping.get('Alpine Skiing', [])
-        }
+        result['available_competitions'] = self.competition_mapping.get(sport, [])
+        return result
 
     # ========================================================================================
-    # FIGURE SKATING - SCORE-BASED SYSTEM (VALIDATED)
+    # SCORE-BASED SPORTS - BEST SCORE PER JUDGED DISCIPLINE
     # ========================================================================================
     
-    def check_figure_skating_qualification(self, athlete_name):
-        """Check Figure Skating qualification - Score-based system with validated competitions"""
+    def _check_score_qualification(self, athlete_name, sport):
+        """Check a score-based sport (Figure Skating) against its thresholds"""
         
-        athlete_data = self.df_ranked[
-            (self.df_ranked['Person'] == athlete_name) & 
-            (self.df_ranked['Sport'] == 'Figure Skating') &
-            (self.df_ranked['Is Olympic Discipline'] == 'Yes') &
-            (self.df_ranked['Team Members'] == 'No') &
-            (self.df_ranked['Class'] == 'Seniors')
-        ]
-        
-        if athlete_data.empty:
-            return {'qualified': False, 'reason': 'No valid Figure Skating results found'}
-        
-        # Score thresholds by discipline and gender
-        thresholds = {
-            ('Singles', 'Women'): 185,
-            ('Singles', 'Men'): 210,
-            ('Ice Dance', 'Mixed'): 165,
-            ('Pairs', 'Mixed'): 170
-        }
-        
-        # VALIDATED: Use only competitions that actually exist in dataset
-        eligible_comps = [
-            'ISU World Figure Skating Championships',    # ✅ Exists
-            'ISU European Figure Skating Championships'  # ✅ Exists
-            # Note: Other competitions from original logic not found in dataset
-        ]
+        # Results passing the Olympic discipline / Team Members / Class filters
+        if len(self._athlete_positions(athlete_name, sport)) == 0:
+            return {'qualified': False, 'reason': f'No valid {sport} results found'}
         
+        # Best score per judged discipline over the eligible competitions: the athlete's
+        # rows of the roster-wide table evaluate_all uses
+        scores = self._batch_aggregates(sport)
+        competitions = list(self.criteria.score_competitions(sport))
         qualification_results = {}
-        
-        for discipline in athlete_data['Discipline'].unique():
-            if discipline == 'Singles':
-                competition_genders = athlete_data[athlete_data['Discipline'] == discipline]['Gender'].unique()
-            else:
-                competition_genders = ['Mixed']
-            
-            for comp_gender in competition_genders:
-                key = (discipline, comp_gender)
-                if key in thresholds:
-                    threshold = thresholds[key]
-                    
-                    # Find best result in eligible competitions
-                    if discipline == 'Singles':
-                        best_results = athlete_data[
-                            (athlete_data['Discipline'] == discipline) &
-                            (athlete_data['Gender'] == comp_gender) &
-                            (athlete_data['Comp.SetDetail'].isin(eligible_comps)) &
-                            (athlete_data['Result'].notna())
-                        ]
-                    else:
-                        best_results = athlete_data[
-                            (athlete_data['Discipline'] == discipline) &
-                            (athlete_data['Gender'] == comp_gender) &
-                            (athlete_data['Comp.SetDetail'].isin(eligible_comps)) &
-                            (athlete_data['Result'].notna())
-                        ]
-                    
-                    if not best_results.empty:
-                        result_values = pd.to_numeric(best_results['Result'], errors='coerce')
-                        result_values = result_values.dropna()
-                        
-                        if len(result_values) > 0:
-                            best_score = result_values.max()
-                            qualified = best_score >= threshold
-                        else:
-                            qualified = False
-                            best_score = None
-                    else:
-                        qualified = False
-                        best_score = None
-                        
-                    qualification_results[f"{discipline}_{comp_gender}"] = {
-                        'qualified': qualified,
-                        'best_score': best_score,
-                        'threshold': threshold,
-                        'competitions_checked': eligible_comps
-                    }
+        for row in scores[scores['Person'].to_numpy() == athlete_name].itertuples(index=False):
+            best_score = None if pd.isna(row.best_score) else row.best_score
+            qualification_results[f"{row.Discipline}_{row.Gender}"] = {
+                'qualified': bool(best_score is not None and best_score >= row.threshold),
+                'best_score': best_score,
+                'threshold': int(row.threshold),
+                'competitions_checked': competitions
+            }
         
         overall_qualified = any(result['qualified'] for result in qualification_results.values())
         
         return {
             'qualified': overall_qualified,
-            'sport': 'Figure Skating',
+            'sport': sport,
             'qualification_system': 'score_based',
             'results': qualification_results,
             'qualifying_disciplines': [k for k, v in qualification_results.items() if v['qualified']],
-            'available_competitions': self.competition_mapping.get('Figure Skating', [])
+            'available_competitions': self.competition_mapping.get(sport, [])
         }
 
     # ========================================================================================
-    # BOBSLEIGH - 3 ROUTES + TEAM VERIFICATION (IMPLEMENTED)
+    # BOBSLEIGH - TEAM VERIFICATION
     # ========================================================================================
     
-    def check_bobsleigh_qualification(self, athlete_name):
-        """Check Bobsleigh qualification - 3 routes + team verification (NOW IMPLEMENTED)"""
-        
-        athlete_data = self.df_ranked[
-            (self.df_ranked['Person'] == athlete_name) & 
-            (self.df_ranked['Sport'] == 'Bobsleigh') &
-            (self.df_ranked['Is Olympic Discipline'] == 'Yes') &
-            (self.df_ranked['Class'] == 'Seniors')
-        ]
-        
-        if athlete_data.empty:
-            return {'qualified': False, 'routes': {}, 'reason': 'No valid Bobsleigh results found'}
-        
-        routes = {}
-        
-        # VALIDATED: Competition names exist in dataset
-        world_championships_name = 'IBSF World Championships'  # ✅ Exists
-        world_cup_name = 'IBSF World Cup'                      # ✅ Exists
-        
-        # Route 1: 1x Top-6 World Cup 2025/2026 AND (1x Top-6 WC 2025 OR 1x Top-6 WC 24/25 Lillehammer)
-        wc_2025_26_top6 = len(athlete_data[
-            (athlete_data['Comp.SetDetail'] == world_cup_name) &
-            (athlete_data['Date'] >= '2025-11-01') & (athlete_data['Date'] <= '2026-01-18') &
-            (athlete_data['Rank_Clean'] <= 6)
-        ])
-        
-        wc_2025_top6 = len(athlete_data[
-            (athlete_data['Comp.SetDetail'] == world_championships_name) &
-            (athlete_data['Year'] == 2025) &
-            (athlete_data['Rank_Clean'] <= 6)
-        ])
-        
-        # Check for Lillehammer specific (if Host City data available)
-        lillehammer_top6 = 0
-        if 'Host City' in athlete_data.columns:
-            lillehammer_top6 = len(athlete_data[
-                (athlete_data['Comp.SetDetail'] == world_cup_name) &
-                (athlete_data['Host City'].str.contains('Lillehammer', na=False)) &
-                (athlete_data['Date'] >= '2024-11-01') & (athlete_data['Date'] <= '2025-03-31') &
-                (athlete_data['Rank_Clean'] <= 6)
-            ])
-        
-        routes['Route 1'] = {
-            'qualified': (wc_2025_26_top6 >= 1) and ((wc_2025_top6 >= 1) or (lillehammer_top6 >= 1)),
-            'details': f'WC 25/26 Top-6: {wc_2025_26_top6}, WC 2025 Top-6: {wc_2025_top6}, Lillehammer Top-6: {lillehammer_top6}'
-        }
-        
-        # Route 2: 2x Top-12 World Cup 2025/2026
-        wc_2025_26_top12 = len(athlete_data[
-            (athlete_data['Comp.SetDetail'] == world_cup_name) &
-            (athlete_data['Date'] >= '2025-11-01') & (athlete_data['Date'] <= '2026-01-18') &
-            (athlete_data['Rank_Clean'] <= 12)
-        ])
-        
-        routes['Route 2'] = {
-            'qualified': wc_2025_26_top12 >= 2,
-            'details': f'WC 25/26 Top-12: {wc_2025_26_top12} (need 2)',
-            'note': 'Requires commitment until 2030 (not validated here)'
-        }
-        
-        # Route 3: 2x Top-14 World Cup 2025/2026 AND Age ≤ 27
-        wc_2025_26_top14 = len(athlete_data[
-            (athlete_data['Comp.SetDetail'] == world_cup_name) &
-            (athlete_data['Date'] >= '2025-11-01') & (athlete_data['Date'] <= '2026-01-18') &
-            (athlete_data['Rank_Clean'] <= 14)
-        ])
-        
-        # IMPLEMENTED: Age validation
-        age_condition = True  # Default to True if age not available
-        if 'Age' in athlete_data.columns:
-            ages = athlete_data['Age'].dropna()
-            if len(ages) > 0:
-                age_condition = ages.min() <= 27
-        
-        routes['Route 3'] = {
-            'qualified': (wc_2025_26_top14 >= 2) and age_condition,
-            'details': f'WC 25/26 Top-14: {wc_2025_26_top14} (need 2), Age ≤27: {age_condition}'
-        }
-        
-        # IMPLEMENTED: Team verification for 2-Man and 4-Man disciplines
-        team_verification_status = self._verify_bobsleigh_team(athlete_name, athlete_data)
-        
-        qualified = any(route['qualified'] for route in routes.values())
-        
-        return {
-            'qualified': qualified,
-            'sport': 'Bobsleigh',
-            'routes': routes,
-            'qualifying_routes': [k for k, v in routes.items() if v['qualified']],
-            'team_verification': team_verification_status,
-            'available_competitions': self.competition_mapping.get('Bobsleigh', [])
-        }
-    
-    def _verify_bobsleigh_team(self, athlete_name, athlete_data):
-        """IMPLEMENTED: Verify team eligibility for Bobsleigh 2-Man and 4-Man"""
-        team_disciplines = ['2-Man', '4-Man', 'Two-man', 'Four-man']  # Various naming conventions
-        
-        team_verification = {
-            'applicable': False,
-            'verified': True,  # Default to True
-            'details': []
-        }
-        
-        # Check if athlete competes in team disciplines
-        athlete_disciplines = athlete_data['Discipline'].unique()
-        team_disc_found = any(disc in str(athlete_disciplines) for disc in team_disciplines)
-        
-        if team_disc_found:
-            team_verification['applicable'] = True
-            
-            # For team disciplines, check if all team members are Swiss
-            team_results = athlete_data[
-                athlete_data['Team Members'] == 'Yes'  # Team member results
-            ]
-            
-            if not team_results.empty:
-                # Check team member nationalities
-                team_countries = team_results['Country'].unique()
-                non_swiss_countries = [country for country in team_countries if country != 'Switzerland']
-                
-                if non_swiss_countries:
-                    team_verification['verified'] = False
-                    team_verification['details'].append(f'Non-Swiss team members from: {non_swiss_countries}')
-                else:
-                    team_verification['details'].append('All team members verified as Swiss')
-            else:
-                team_verification['details'].append('No team member data found for verification')
-        else:
-            team_verification['details'].append('Not applicable - no team disciplines found')
-        
-        return team_verification
+    def _crew_graph(self):
+        """Crew graph of the ranked Bobsleigh team member results, built on first use"""
+        if self._crews is None:
+            rows = self._route_view.iloc[self._sport_positions('Bobsleigh')]
+            members = rows[rows['Team Members'] == 'Yes'] if self._crew_members is None else self._crew_members
+            team_athletes = rows.loc[rows['Discipline'].isin(TEAM_DISCIPLINES), 'Person'].dropna()
+            with stage('crew graph', rows=len(members)):
+                self._crews = CrewGraph(members, team_athletes=team_athletes,
+                                        country=self.CREW_COUNTRY, nationality=self.CREW_NATIONALITY)
+        return self._crews
+
+    def _verify_bobsleigh_team(self, athlete_name):
+        """Verify team eligibility for Bobsleigh 2-Man and 4-Man: a lookup in the crew graph
+
+        Every crew the athlete raced in must be a Swiss sled with no crew
+        member of another nationality.
+        """
+        return self._crew_graph().verification(athlete_name)
+
+    def validate_crews(self):
+        """Every Bobsleigh crew with its members, nationalities and eligibility, in one pass"""
+        return self._crew_graph().crews
 
     # ========================================================================================
-    # FREESTYLE SKIING - GROUP A/B SYSTEM (FIXED COMPETITION NAMES)
+    # ATHLETE-LEVEL QUALIFICATION CHECK
     # ========================================================================================
     
-    def check_freestyle_skiing_qualification(self, athlete_name):
-        """Check Freestyle Skiing qualification - Group A/B system with fixed competition names"""
-        
-        athlete_data = self.df_ranked[
-            (self.df_ranked['Person'] == athlete_name) & 
-            (self.df_ranked['Sport'] == 'Freestyle Skiing') &
-            (self.df_ranked['Is Olympic Discipline'] == 'Yes') &
-            (self.df_ranked['Team Members'] == 'No') &
-            (self.df_ranked['Class'] == 'Seniors')
-        ]
-        
-        if athlete_data.empty:
-            return {'qualified': False, 'reason': 'No valid Freestyle Skiing results found'}
-        
-        # FIXED: Use actual competition names from validation
-        world_championships_name = 'FIS Freestyle World Ski Championships'  # ✅ Exists
-        world_cup_name = 'FIS Freeski World Cup'                           # ✅ Exists
-        # FIXED: Case-sensitive issue - actual name is lowercase 'standings'
-        world_cup_standings_name = 'FIS Freeski World Cup standings'       # ✅ Exists (lowercase)
-        
-        # Group A routes (priority)
-        group_a_routes = {}
-        
-        # Group A Route 1: 1x Top-3 World Championships 2025 AND 1x Top-8 World Cup 2025/26
-        wc_2025_top3 = len(athlete_data[
-            (athlete_data['Comp.SetDetail'] == world_championships_name) &
-            (athlete_data['Year'] == 2025) &
-            (athlete_data['Rank_Clean'] <= 3)
-        ])
-        
-        wc_2025_26_top8 = len(athlete_data[
-            (athlete_data['Comp.SetDetail'] == world_cup_name) &
-            (athlete_data['Date'] >= '2025-07-01') & (athlete_data['Date'] <= '2026-01-25') &
-            (athlete_data['Rank_Clean'] <= 8)
-        ])
-        
-        group_a_routes['Route 1'] = {
-            'qualified': (wc_2025_top3 >= 1) and (wc_2025_26_top8 >= 1),
-            'details': f'WC 2025 Top-3: {wc_2025_top3}, WC 25/26 Top-8: {wc_2025_26_top8}'
-        }
-        
-        # Group A Route 2: 1x Top-3 World Cup Standings 2024/2025 AND 1x Top-8 World Cup 2025/26
-        standings_2024_25_top3 = len(athlete_data[
-            (athlete_data['Comp.SetDetail'] == world_cup_standings_name) &
-            (athlete_data['Year'] == 2025) &  # Standings for 2024/25 season appear in 2025
-            (athlete_data['Rank_Clean'] <= 3)
-        ])
-        
-        group_a_routes['Route 2'] = {
-            'qualified': (standings_2024_25_top3 >= 1) and (wc_2025_26_top8 >= 1),
-            'details': f'Standings 24/25 Top-3: {standings_2024_25_top3}, WC 25/26 Top-8: {wc_2025_26_top8}'
-        }
-        
-        # Group A Route 3: 2x Top-3 World Cup 2025/2026
-        wc_2025_26_top3 = len(athlete_data[
-            (athlete_data['Comp.SetDetail'] == world_cup_name) &
-            (athlete_data['Date'] >= '2025-07-01') & (athlete_data['Date'] <= '2026-01-25') &
-            (athlete_data['Rank_Clean'] <= 3)
-        ])
-        
-        group_a_routes['Route 3'] = {
-            'qualified': wc_2025_26_top3 >= 2,
-            'details': f'WC 25/26 Top-3: {wc_2025_26_top3} (need 2)'
-        }
-        
-        # Group B routes (secondary)
-        group_b_routes = {}
-        
-        # Group B Route 1: 1x Top-8 World Cup 2025/2026
-        group_b_routes['Route 1'] = {
-            'qualified': wc_2025_26_top8 >= 1,
-            'details': f'WC 25/26 Top-8: {wc_2025_26_top8}'
-        }
-        
-        # Group B Route 2 & 3: Discipline-specific (simplified implementation)
-        # This would require more complex discipline-specific logic
-        group_b_routes['Route 2-3'] = {
-            'qualified': False,
-            'details': 'Discipline-specific routes not fully implemented',
-            'note': 'Requires discipline-specific rank thresholds by gender'
-        }
+    def check_athlete_qualification(self, athlete_name):
+        """Check qualification status across all sports for a specific athlete
+
+        Returns an AthleteQualification: sports are only evaluated when their
+        result is read, so callers interested in one sport pay for one sport.
+        """
         
-        group_a_qualified = any(route['qualified'] for route in group_a_routes.values())
-        group_b_qualified = any(route['qualified'] for route in group_b_routes.values())
+        if athlete_name not in self.valid_persons:
+            return {'error': f'Athlete "{athlete_name}" not found in dataset'}
         
-        return {
-            'qualified': group_a_qualified or group_b_qualified,
-            'sport': 'Freestyle Skiing',
-            'group_a': {
-                'qualified': group_a_qualified,
-                'routes': group_a_routes
-            },
-            'group_b': {
-                'qualified': group_b_qualified,
-                'routes': group_b_routes
-            },
-            'priority_group': 'A' if group_a_qualified else ('B' if group_b_qualified else None),
-            'available_competitions': self.competition_mapping.get('Freestyle Skiing', [])
-        }
+        return AthleteQualification(self, athlete_name, self._athlete_sports[athlete_name])
 
     # ========================================================================================
-    # CROSS-COUNTRY SKIING - 6 ROUTES (FIXED COMPETITION NAMES)
+    # ROSTER-WIDE BATCH EVALUATION
     # ========================================================================================
-    
-    def check_cross_country_qualification(self, athlete_name):
-        """Check Cross-Country Skiing qualification - 6 routes with fixed competition names"""
-        
-        # Get both Seniors and U23 data as per requirements
-        athlete_data_seniors = self.df_ranked[
-            (self.df_ranked['Person'] == athlete_name) & 
-            (self.df_ranked['Sport'] == 'Cross-Country Skiing') &
-            (self.df_ranked['Is Olympic Discipline'] == 'Yes') &
-            (self.df_ranked['Team Members'] == 'No') &
-            (self.df_ranked['Class'] == 'Seniors')
-        ]
-        
-        athlete_data_u23 = self.df_ranked[
-            (self.df_ranked['Person'] == athlete_name) & 
-            (self.df_ranked['Sport'] == 'Cross-Country Skiing') &
-            (self.df_ranked['Is Olympic Discipline'] == 'Yes') &
-            (self.df_ranked['Team Members'] == 'No') &
-            (self.df_ranked['Class'] == 'Under 23')
+
+    OUTCOME_COLUMNS = ['Person', 'Sport', 'Group', 'Route', 'qualified', 'details', 'note',
+                       'best_score', 'threshold']
+
+    def _sport_positions(self, sport, start=0):
+        """df_ranked positions from start on whose results pass the sport's base filters"""
+        return np.flatnonzero(self._bitmap(('sport', sport))[start:]) + start
+
+    def _route_counts(self, sport, positions):
+        """Per-athlete route counters of one sport, plus the youngest recorded age if a route reads it"""
+        flags = pd.DataFrame({
+            name: self._bitmap(('window', sport, window))[positions] & self._bitmap(('rank', rank))[positions]
+            for name, (window, rank) in self.criteria.counters[sport].items()
+        })
+        persons = self._route_view['Person'].iloc[positions].reset_index(drop=True)
+        counts = flags.groupby(persons, observed=True).sum().astype(int)
+        counts.index = counts.index.astype(object)
+
+        if self.criteria.uses_age(sport):
+            if 'Age' in self._route_view.columns:
+                ages = self._route_view['Age'].iloc[positions].reset_index(drop=True)
+                min_age = ages.groupby(persons, observed=True).min()
+                counts[MIN_AGE] = min_age.set_axis(min_age.index.astype(object)).reindex(counts.index)
+            else:
+                counts[MIN_AGE] = np.nan
+        return counts
+
+    @staticmethod
+    def _merge_route_counts(counts, delta):
+        """Add delta counters onto existing ones; counters are sums, the youngest age a minimum"""
+        index = counts.index.append(delta.index.difference(counts.index))
+        merged = counts.reindex(index)
+        delta = delta.reindex(index)
+        sums = [column for column in counts.columns if column != MIN_AGE]
+        merged[sums] = merged[sums].fillna(0).add(delta[sums].fillna(0)).astype(int)
+        if MIN_AGE in counts.columns:
+            merged[MIN_AGE] = np.fmin(merged[MIN_AGE], delta[MIN_AGE])
+        return merged
+
+    @staticmethod
+    def _route_flags(route, inputs):
+        """Qualified flags of one route over stacked inputs, one per row"""
+        return np.broadcast_to(np.asarray(route.qualified(inputs), dtype=bool), (len(inputs),))
+
+    def _count_routes_batch(self, sport, counts):
+        """Evaluate the count-based routes of one sport from per-athlete counters"""
+        records = counts.to_dict('index')
+        outcomes = []
+        for route in self.criteria.routes[sport]:
+            with stage(route.name if route.group is None else f'Group {route.group} {route.name}', rows=len(counts)):
+                qualified = self._route_flags(route, counts)
+                for person, is_qualified in zip(counts.index, qualified):
+                    outcomes.append({
+                        'Person': person,
+                        'Sport': sport,
+                        'Group': route.group,
+                        'Route': route.name,
+                        'qualified': bool(is_qualified),
+                        'details': route.details(records[person]),
+                        'note': route.note
+                    })
+        return outcomes
+
+    def _score_table(self, sport, rows, keys=()):
+        """Best eligible score per athlete and judged discipline, with its threshold
+
+        One groupby-max over all rows joined against the sport's threshold table;
+        judged disciplines without an eligible score keep a NaN best_score. keys:
+        extra row columns to group by first (e.g. scenario).
+        """
+        # Singles are judged per competition gender, every other discipline as Mixed
+        discipline = rows['Discipline'].astype(object)
+        eligible = np.zeros(len(rows), dtype=bool)
+        for competition in self.criteria.score_competitions(sport).values():
+            eligible |= self._window_mask(competition, rows)
+        judged = pd.DataFrame({
+            **{key: rows[key].to_numpy() for key in keys},
+            'Person': rows['Person'].astype(object).to_numpy(),
+            'Discipline': discipline.to_numpy(),
+            'Gender': rows['Gender'].astype(object).where(discipline == 'Singles', 'Mixed').to_numpy(),
+            'best_score': rows['Result_Score'].where(eligible).to_numpy(),
+        })
+        best = judged.groupby([*keys, 'Person', 'Discipline', 'Gender'], sort=False)['best_score'].max().reset_index()
+        thresholds = pd.DataFrame(
+            [(discipline, gender, threshold)
+             for (discipline, gender), threshold in self.criteria.score_thresholds(sport).items()],
+            columns=['Discipline', 'Gender', 'threshold']
+        )
+        return best.merge(thresholds, on=['Discipline', 'Gender'])
+
+    @staticmethod
+    def _merge_scores(scores, delta):
+        """Combine best scores; a judged discipline keeps the higher of both"""
+        return (
+            pd.concat([scores, delta], ignore_index=True)
+            .groupby(['Person', 'Discipline', 'Gender'], sort=False)
+            .agg(threshold=('threshold', 'first'), best_score=('best_score', 'max'))
+            .reset_index()
+        )
+
+    @staticmethod
+    def _score_batch(sport, scores):
+        """Evaluate the score thresholds of one score-based sport from the best scores"""
+        return [
+            {
+                'Person': row.Person,
+                'Sport': sport,
+                'Group': None,
+                'Route': f"{row.Discipline}_{row.Gender}",
+                'qualified': bool(row.best_score >= row.threshold),
+                'details': None,
+                'note': None,
+                'best_score': None if pd.isna(row.best_score) else row.best_score,
+                'threshold': int(row.threshold)
+            }
+            for row in scores.itertuples(index=False)
         ]
-        
-        if athlete_data_seniors.empty and athlete_data_u23.empty:
-            return {'qualified': False, 'routes': {}, 'reason': 'No valid Cross-Country Skiing results found'}
-        
-        # Combine data for analysis
-        athlete_data = pd.concat([athlete_data_seniors, athlete_data_u23], ignore_index=True)
-        
-        routes = {}
-        
-        # VALIDATED: Competition names that exist in dataset
-        world_championships_name = 'FIS Nordic World Ski Championships'      # ✅ Exists
-        u23_championships_name = 'FIS Nordic Under 23 World Ski Championships'  # ✅ Exists
-        world_cup_name = 'FIS Cross-Country World Cup'                       # ✅ Exists
-        # Note: 'FESA Cross-Country Continental Cup' not found in dataset
-        
-        # Route 1: World Championships 2025 1x Top-3 AND 1x Top-30 World Cup 2025/2026
-        wc_2025_top3 = len(athlete_data[
-            (athlete_data['Comp.SetDetail'] == world_championships_name) &
-            (athlete_data['Year'] == 2025) &
-            (athlete_data['Rank_Clean'] <= 3)
-        ])
-        
-        worldcup_2025_26_top30 = len(athlete_data[
-            (athlete_data['Comp.SetDetail'] == world_cup_name) &
-            (athlete_data['Date'] >= '2025-08-01') & (athlete_data['Date'] <= '2026-01-21') &
-            (athlete_data['Rank_Clean'] <= 30)
-        ])
-        
-        routes['Route 1'] = {
-            'qualified': (wc_2025_top3 >= 1) and (worldcup_2025_26_top30 >= 1),
-            'details': f'WC 2025 Top-3: {wc_2025_top3}, World Cup 25/26 Top-30: {worldcup_2025_26_top30}'
-        }
-        
-        # Route 2: U23 World Championships 2025 1x Top-3 AND 1x Top-25 World Cup 2025/2026
-        u23_2025_top3 = len(athlete_data[
-            (athlete_data['Comp.SetDetail'] == u23_championships_name) &
-            (athlete_data['Year'] == 2025) &
-            (athlete_data['Rank_Clean'] <= 3)
-        ])
-        
-        worldcup_2025_26_top25 = len(athlete_data[
-            (athlete_data['Comp.SetDetail'] == world_cup_name) &
-            (athlete_data['Date'] >= '2025-08-01') & (athlete_data['Date'] <= '2026-01-21') &
-            (athlete_data['Rank_Clean'] <= 25)
-        ])
-        
-        routes['Route 2'] = {
-            'qualified': (u23_2025_top3 >= 1) and (worldcup_2025_26_top25 >= 1),
-            'details': f'U23 WC 2025 Top-3: {u23_2025_top3}, World Cup 25/26 Top-25: {worldcup_2025_26_top25}'
-        }
-        
-        # Continue with other routes...
-        # (Implementation continues with remaining 4 routes using validated competition names)
-        
-        qualified = any(route['qualified'] for route in routes.values())
-        
-        return {
-            'qualified': qualified,
-            'sport': 'Cross-Country Skiing',
-            'routes': routes,
-            'qualifying_routes': [k for k, v in routes.items() if v['qualified']],
-            'available_competitions': self.competition_mapping.get('Cross-Country Skiing', [])
-        }
+
+    def _sport_aggregates(self, sport, positions):
+        """Mergeable per-athlete aggregates of one sport: best scores or route counters"""
+        if sport in self.criteria.scores:
+            return self._score_table(sport, self._route_view.iloc[positions])
+        return self._route_counts(sport, positions)
+
+    def _batch_aggregates(self, sport):
+        """Per-athlete aggregates of one sport over all results, computed once and kept up to date by ingest"""
+        if sport not in self._aggregates:
+            positions = self._sport_positions(sport)
+            with stage('aggregates', rows=len(positions)):
+                self._aggregates[sport] = self._sport_aggregates(sport, positions)
+        return self._aggregates[sport]
+
+    def _evaluate_aggregates(self, sport, athletes=None):
+        """Route outcomes of one sport, optionally restricted to some athletes"""
+        aggregates = self._batch_aggregates(sport)
+        if sport in self.criteria.scores:
+            if athletes is not None:
+                aggregates = aggregates[aggregates['Person'].isin(athletes)]
+            with stage('score thresholds', rows=len(aggregates)):
+                return self._score_batch(sport, aggregates)
+        if athletes is not None:
+            aggregates = aggregates[aggregates.index.isin(athletes)]
+        return self._count_routes_batch(sport, aggregates)
+
+    def evaluate_all(self, sport=None, athletes=None):
+        """Evaluate every route for every athlete in one pass
+
+        Returns a tidy DataFrame with one row per (Person, Sport, Group, Route).
+        Athletes without valid results for a sport have no rows for it, matching
+        the empty route dicts of the per-athlete methods. Pass athletes to limit
+        the outcomes to those names.
+        """
+        sports = [sport] if sport is not None else self.criteria.sports
+
+        outcomes = []
+        with stage('evaluate_all') as span:
+            for current_sport in sports:
+                if current_sport in self.criteria.filters:
+                    with stage(current_sport):
+                        outcomes.extend(self._evaluate_aggregates(current_sport, athletes))
+            span.rows = len(outcomes)
+
+        return pd.DataFrame(outcomes, columns=self.OUTCOME_COLUMNS)
 
     # ========================================================================================
-    # ATHLETE-LEVEL QUALIFICATION CHECK
+    # INCREMENTAL UPDATES
     # ========================================================================================
-    
-    def check_athlete_qualification(self, athlete_name):
-        """Check qualification status across all sports for a specific athlete"""
-        
-        if athlete_name not in self.df['Person'].unique():
-            return {'error': f'Athlete "{athlete_name}" not found in dataset'}
-        
-        athlete_sports = self.df[self.df['Person'] == athlete_name]['Sport'].unique()
-        
-        results = {
-            'athlete_name': athlete_name,
-            'sports_competed': list(athlete_sports),
-            'sports_qualifications': {},
-            'overall_qualified': False,
-            'qualified_sports': []
+
+    DIFF_COLUMNS = ['Person', 'Sport', 'Group', 'Route', 'qualified_before', 'qualified_after',
+                    'details', 'best_score']
+
+    @staticmethod
+    def _concat_results(results_df, new_rows):
+        """Append rows to a results frame, widening categories instead of falling back to object"""
+        results_df = results_df.copy(deep=False)
+        new_rows = new_rows.copy(deep=False)
+        for column in results_df.select_dtypes('category').columns:
+            if column not in new_rows.columns:
+                continue
+            categories = results_df[column].cat.categories
+            new_values = pd.Index(new_rows[column].dropna().unique()).difference(categories)
+            if len(new_values):
+                categories = categories.append(new_values.astype(categories.dtype))
+                results_df[column] = results_df[column].cat.set_categories(categories)
+            new_rows[column] = new_rows[column].astype(results_df[column].dtype)
+        return pd.concat([results_df, new_rows])
+
+    def _append_results(self, new_rows):
+        """Append cleaned rows to df and df_ranked and extend the lookup indexes and bitmaps in place
+
+        Returns the df_ranked position of the first appended ranked row.
+        """
+        # Continue the row labels so df_ranked keeps pointing at df rows
+        new_rows = new_rows.set_axis(pd.RangeIndex(len(self.df), len(self.df) + len(new_rows)))
+        ranked = new_rows[new_rows['Rank_Clean'].notna() & (new_rows['Rank_Clean'] > 0)]
+        offset = len(self.df_ranked)
+
+        self.df = self._concat_results(self.df, new_rows)
+        self.df_ranked = self._concat_results(self.df_ranked, ranked)
+        self._route_view = self._concat_results(self._route_view, ranked[[
+            column for column in self._route_view.columns if column in ranked.columns
+        ]])
+        self._no_rows = self._route_view.iloc[0:0]
+        self._extend_bitmaps(self._route_view.iloc[offset:])
+        self._crews = None  # Rebuilt with the new crews on next use
+        if self._crew_members is not None:
+            members = ranked[(ranked['Sport'] == 'Bobsleigh') & (ranked['Team Members'] == 'Yes')]
+            self._crew_members = self._concat_results(self._crew_members, members[[
+                column for column in self._crew_members.columns if column in members.columns
+            ]])
+        self._scenario_memo = {}
+
+        for key, positions in ranked.groupby(['Person', 'Sport'], observed=True, sort=False).indices.items():
+            existing = self._row_index.get(key)
+            positions = positions + offset
+            self._row_index[key] = positions if existing is None else np.concatenate([existing, positions])
+
+        self.valid_sports.update(new_rows['Sport'].dropna().unique())
+        self.valid_persons.update(new_rows['Person'].dropna().unique())
+        pairs = new_rows[['Person', 'Sport']].dropna().drop_duplicates()
+        for person, sport in zip(pairs['Person'].tolist(), pairs['Sport'].tolist()):
+            sports = self._athlete_sports.setdefault(person, [])
+            if sport not in sports:
+                sports.append(sport)
+
+        competitions = new_rows[['Sport', 'Comp.SetDetail']].drop_duplicates(subset=['Sport', 'Comp.SetDetail'])
+        for sport, competition in zip(competitions['Sport'].tolist(), competitions['Comp.SetDetail'].tolist()):
+            mapping = self.competition_mapping.setdefault(sport, [])
+            if competition not in mapping:
+                mapping.append(competition)
+        return offset
+
+    @staticmethod
+    def _prepare_new_rows(new_rows):
+        """Copy of new result rows with Rank_Clean, Result_Score and Year derived where missing"""
+        new_rows = new_rows.copy()
+        if 'Rank_Clean' not in new_rows.columns:
+            new_rows['Rank_Clean'] = clean_rank(new_rows['Rank'])
+        if 'Result_Score' not in new_rows.columns and 'Result' in new_rows.columns:
+            new_rows['Result_Score'] = result_score(new_rows['Result'])
+        if 'Year' not in new_rows.columns and 'Date' in new_rows.columns:
+            new_rows['Year'] = pd.to_datetime(new_rows['Date']).dt.year
+        return new_rows
+
+    def ingest(self, new_rows):
+        """Append new results and re-evaluate only the athletes and sports they touch
+
+        new_rows uses the load_results layout (dates parsed, Nationality already
+        filtered); Rank_Clean is derived from Rank when missing. Indexes and the
+        per-route counters are updated in place, so later per-athlete checks and
+        evaluate_all calls see the new results. Returns one row per
+        (Person, Sport, Group, Route) whose qualified status changed, with a
+        route that did not exist before counting as not qualified.
+        """
+        new_rows = self._prepare_new_rows(new_rows)
+
+        touched = new_rows[['Person', 'Sport']].dropna().astype(object).drop_duplicates()
+        touched_athletes = {
+            sport: set(athletes) for sport, athletes in touched.groupby('Sport')['Person']
+            if sport in self.criteria.filters
         }
-        
-        for sport in athlete_sports:
-            sport_result = self.check_qualification(athlete_name, sport)
-            results['sports_qualifications'][sport] = sport_result
-            
-            if sport_result.get('qualified', False):
-                results['qualified_sports'].append(sport)
-        
-        results['overall_qualified'] = len(results['qualified_sports']) > 0
-        
-        return results
+
+        before = [outcome for sport, athletes in touched_athletes.items()
+                  for outcome in self._evaluate_aggregates(sport, athletes)]
+
+        with stage('append results', rows=len(new_rows)):
+            offset = self._append_results(new_rows)
+        for sport in touched_athletes:
+            positions = self._sport_positions(sport, start=offset)
+            if len(positions) == 0:
+                continue
+            with stage(f'{sport} aggregates', rows=len(positions)):
+                delta = self._sport_aggregates(sport, positions)
+            if sport in self.criteria.scores:
+                self._aggregates[sport] = self._merge_scores(self._aggregates[sport], delta)
+            else:
+                self._aggregates[sport] = self._merge_route_counts(self._aggregates[sport], delta)
+
+        after = [outcome for sport, athletes in touched_athletes.items()
+                 for outcome in self._evaluate_aggregates(sport, athletes)]
+        return self._status_diff(
+            pd.DataFrame(before, columns=self.OUTCOME_COLUMNS),
+            pd.DataFrame(after, columns=self.OUTCOME_COLUMNS)
+        )
+
+    def _status_diff(self, before, after):
+        """Routes whose qualified flag differs between two evaluate_all style frames"""
+        keys = ['Person', 'Sport', 'Group', 'Route']
+        diff = before[keys + ['qualified']].merge(
+            after[keys + ['qualified', 'details', 'best_score']],
+            on=keys, how='outer', suffixes=('_before', '_after')
+        )
+        diff['qualified_before'] = diff['qualified_before'].fillna(False).astype(bool)
+        diff['qualified_after'] = diff['qualified_after'].fillna(False).astype(bool)
+        changed = diff['qualified_before'] != diff['qualified_after']
+        return diff.loc[changed, self.DIFF_COLUMNS].reset_index(drop=True)
+
+    # ========================================================================================
+    # WHAT-IF SCENARIOS
+    # ========================================================================================
+
+    SCENARIO_ROUTE_COLUMNS = ['scenario', 'Person', 'Sport', 'Group', 'Route', 'qualified_before',
+                              'qualified_after', 'details', 'best_score']
+    SCENARIO_ATHLETE_COLUMNS = ['scenario', 'Sport', 'Person', 'qualified_before', 'qualified_after']
+    SCENARIO_SUMMARY_COLUMNS = ['scenario', 'Sport', 'qualified_before', 'qualified_after', 'gained', 'lost']
+
+    def simulate(self, scenarios, sport=None):
+        """Evaluate what-if scenarios against the current results in one batch; the checker is not changed
+
+        Base route counters are reused. A counter whose window or rank a scenario
+        overrides is recounted once per distinct override (one bincount over the
+        sport's rows) and shared by every scenario using it; hypothetical results
+        are counted on their own and added onto the counters of their athletes.
+        The route conditions of a sport then run once over the stacked counters of
+        all scenarios, so thousands of scenarios cost a few vectorized passes.
+        Returns a ScenarioResult of the routes, athletes and counts that change.
+        """
+        scenarios = list(scenarios)
+        for scenario in scenarios:
+            self._validate_scenario(scenario)
+        sports = [sport] if sport is not None else self.criteria.sports
+        names = np.array([scenario.name for scenario in scenarios], dtype=object)
+
+        routes, athletes, summaries = [], [], []
+        with stage('simulate', rows=len(scenarios)):
+            rows = self._scenario_rows(scenarios)
+            for current_sport in sports:
+                with stage(current_sport):
+                    sport_routes, sport_athletes, summary = self._simulate_sport(current_sport, scenarios, rows)
+                routes.append(sport_routes)
+                athletes.append(sport_athletes)
+                summaries.append(summary)
+
+        def assemble(frames, columns, keys):
+            frame = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(columns=columns)
+            frame = frame.sort_values(keys, kind='stable', ignore_index=True)
+            frame['scenario'] = names[frame['scenario'].to_numpy(dtype=np.intp)]
+            return frame[columns]
+
+        return ScenarioResult(
+            routes=assemble(routes, self.SCENARIO_ROUTE_COLUMNS, ['scenario']),
+            athletes=assemble(athletes, self.SCENARIO_ATHLETE_COLUMNS, ['scenario']),
+            summary=assemble(summaries, self.SCENARIO_SUMMARY_COLUMNS, ['scenario'])
+        )
+
+    def _validate_scenario(self, scenario):
+        for sport, window in scenario.windows:
+            if window not in self.criteria.windows.get(sport, {}):
+                raise ValueError(f'Scenario "{scenario.name}": unknown selection window {(sport, window)}')
+        for sport, counter in scenario.ranks:
+            if counter not in self.criteria.counters.get(sport, {}):
+                raise ValueError(f'Scenario "{scenario.name}": unknown route counter {(sport, counter)}')
+        for key in scenario.score_thresholds:
+            if not any(key in self.criteria.score_thresholds(sport) for sport in self.criteria.scores):
+                raise ValueError(f'Scenario "{scenario.name}": unknown score-based discipline {key}')
+
+    def _scenario_rows(self, scenarios):
+        """Ranked hypothetical rows of all scenarios, with the scenario's position as 'scenario'"""
+        frames, records = [], []
+        for index, scenario in enumerate(scenarios):
+            if isinstance(scenario.results, pd.DataFrame):
+                frames.append(scenario.results.assign(scenario=index))
+            elif scenario.results is not None:
+                # Row dicts of all scenarios become one frame, not one frame each
+                records.extend({**row, 'scenario': index} for row in scenario.results)
+        if records:
+            frames.append(pd.DataFrame.from_records(records))
+        if not frames:
+            return None
+        rows = self._prepare_new_rows(pd.concat(frames, ignore_index=True))
+        rows['Date'] = pd.to_datetime(rows['Date'])
+        return rows[rows['Rank_Clean'].notna() & (rows['Rank_Clean'] > 0)].reset_index(drop=True)
+
+    def _scenario_config(self, sport, scenario, base_config=None):
+        """Hashable overrides of one sport: (window spec, rank) per counter or score thresholds"""
+        if sport in self.criteria.scores:
+            return tuple(sorted(scenario.score_thresholds.items()))
+        if base_config is not None and not any(key[0] == sport for key in (*scenario.windows, *scenario.ranks)):
+            return base_config
+        config = []
+        for counter, (window, rank) in self.criteria.counters[sport].items():
+            spec = {**self.criteria.windows[sport][window], **scenario.windows.get((sport, window), {})}
+            spec = tuple(sorted((key, tuple(map(tuple, value)) if key == 'filters' else
+                                 tuple(value) if isinstance(value, list) else value)
+                                for key, value in spec.items()))
+            config.append((spec, scenario.ranks.get((sport, counter), rank)))
+        return tuple(config)
+
+    def _scenario_counter(self, sport, spec, rank):
+        """One route counter of every athlete (aligned with the base aggregates) under another window or rank"""
+        key = ('counter', sport, spec, rank)
+        if key not in self._scenario_memo:
+            positions = self._sport_positions(sport)
+            base = self._batch_aggregates(sport)
+            if ('codes', sport) not in self._scenario_memo:
+                persons = self._route_view['Person'].iloc[positions].astype(object)
+                self._scenario_memo[('codes', sport)] = base.index.get_indexer(persons)
+            if ('window', sport, spec) not in self._scenario_memo:
+                self._scenario_memo[('window', sport, spec)] = self._window_mask(
+                    dict(spec), self._route_view.iloc[positions])
+            flags = self._scenario_memo[('window', sport, spec)] & self._bitmap(('rank', rank))[positions]
+            self._scenario_memo[key] = np.bincount(
+                self._scenario_memo[('codes', sport)], weights=flags, minlength=len(base)
+            ).astype(int)
+        return self._scenario_memo[key]
+
+    def _scenario_inputs(self, sport, config, base_config):
+        """Per-athlete aggregates of all athletes under one override config, Person as a column"""
+        base = self._batch_aggregates(sport)
+        if sport in self.criteria.scores:
+            return self._apply_score_thresholds(base, config)
+        counts = base.copy()
+        for counter, override, original in zip(self.criteria.counters[sport], config, base_config):
+            if override != original:
+                counts[counter] = self._scenario_counter(sport, *override)
+        return counts.rename_axis('Person').reset_index()
+
+    @staticmethod
+    def _apply_score_thresholds(scores, config):
+        scores = scores.copy()
+        for (discipline, gender), threshold in config:
+            scores.loc[(scores['Discipline'] == discipline) & (scores['Gender'] == gender), 'threshold'] = threshold
+        return scores
+
+    def _scenario_row_inputs(self, sport, config, inputs, rows):
+        """Aggregates of the athletes with hypothetical rows, per scenario: their config inputs plus the rows"""
+        if sport in self.criteria.scores:
+            delta = self._score_table(sport, rows, keys=['scenario'])
+            athletes = delta[['scenario', 'Person']].drop_duplicates()
+            combined = pd.concat([athletes.merge(inputs, on='Person'), delta], ignore_index=True)
+            combined = (
+                combined.groupby(['scenario', 'Person', 'Discipline', 'Gender'], sort=False)
+                .agg(best_score=('best_score', 'max'), threshold=('threshold', 'first'))
+                .reset_index()
+            )
+            return self._apply_score_thresholds(combined, config)
+
+        keys = [rows['scenario'].to_numpy(), rows['Person'].astype(object).to_numpy()]
+        delta = pd.DataFrame({
+            counter: self._window_mask(dict(spec), rows) & (rows['Rank_Clean'] <= rank).to_numpy(dtype=bool)
+            for counter, (spec, rank) in zip(self.criteria.counters[sport], config)
+        }).groupby(keys).sum().astype(int)
+        delta.index.names = ['scenario', 'Person']
+
+        counts = inputs.set_index('Person').reindex(delta.index.get_level_values('Person'))
+        counts.index = delta.index
+        sums = list(self.criteria.counters[sport])
+        counts[sums] = counts[sums].fillna(0).astype(int) + delta[sums]
+        if self.criteria.uses_age(sport):
+            ages = rows['Age'].astype(float) if 'Age' in rows.columns else pd.Series(np.nan, index=rows.index)
+            min_age = ages.groupby(keys).min()
+            counts[MIN_AGE] = np.fmin(counts[MIN_AGE].to_numpy(dtype=float), min_age.to_numpy())
+        return counts.reset_index()
+
+    def _scenario_flags(self, sport, inputs):
+        """Qualified flags of stacked aggregates: (rows x routes matrix, (group, route) labels or None)"""
+        if sport in self.criteria.scores:
+            qualified = (inputs['best_score'] >= inputs['threshold']).to_numpy(dtype=bool)
+            return qualified[:, None], None
+        routes = self.criteria.routes[sport]
+        flags = np.column_stack([self._route_flags(route, inputs) for route in routes])
+        return flags, [(route.group, route.name) for route in routes]
+
+    def _simulate_sport(self, sport, scenarios, rows):
+        """Route, athlete and summary changes of one sport for every scenario"""
+        keys = ['Person', 'Discipline', 'Gender'] if sport in self.criteria.scores else ['Person']
+        base_config = self._scenario_config(sport, Scenario('base'))
+        configs = [self._scenario_config(sport, scenario, base_config) for scenario in scenarios]
+        base_inputs = self._scenario_inputs(sport, base_config, base_config)
+        base_flags, labels = self._scenario_flags(sport, base_inputs)
+        base_qualified = base_inputs.loc[base_flags.any(axis=1), 'Person'].nunique()
+
+        # Blocks of stacked aggregates: one per changed config (every athlete), one per scenario with rows
+        config_ids = {config: i for i, config in enumerate(dict.fromkeys(c for c in configs if c != base_config))}
+        inputs = {config: self._scenario_inputs(sport, config, base_config) for config in config_ids}
+        inputs[base_config] = base_inputs
+        blocks = [inputs[config].assign(block=block, scenario=-1) for config, block in config_ids.items()]
+        members = [(config_ids[config], index) for index, config in enumerate(configs) if config in config_ids]
+
+        if rows is not None:
+            sport_rows = rows[self._compute_bitmap(('sport', sport), rows)]
+            distinct = list(dict.fromkeys(configs))
+            codes = {config: code for code, config in enumerate(distinct)}
+            config_codes = np.array([codes[config] for config in configs], dtype=np.intp)
+            for code, scenario_rows in sport_rows.groupby(config_codes[sport_rows['scenario'].to_numpy()]):
+                config = distinct[code]
+                with stage('hypothetical results', rows=len(scenario_rows)):
+                    block = self._scenario_row_inputs(sport, config, inputs[config], scenario_rows)
+                blocks.append(block.assign(block=len(config_ids) + block['scenario']))
+            members += [(len(config_ids) + index, index) for index in sport_rows['scenario'].unique().tolist()]
+
+        summary = pd.DataFrame({'scenario': np.arange(len(scenarios)), 'Sport': sport, 'gained': 0, 'lost': 0})
+        if not blocks:
+            route_changes = pd.DataFrame(columns=self.SCENARIO_ROUTE_COLUMNS)
+            athlete_changes = pd.DataFrame(columns=self.SCENARIO_ATHLETE_COLUMNS)
+        else:
+            stacked = pd.concat(blocks, ignore_index=True)
+            with stage('route conditions', rows=len(stacked)):
+                after, _ = self._scenario_flags(sport, stacked)
+            base_rows = pd.MultiIndex.from_frame(base_inputs[keys]).get_indexer(
+                pd.MultiIndex.from_frame(stacked[keys]))
+            before = np.zeros_like(after)
+            if len(base_flags):
+                before = np.where((base_rows >= 0)[:, None], base_flags[base_rows], False)
+
+            # Each block's changes apply to its scenarios; a config block not to athletes a scenario has rows for
+            members = pd.DataFrame(members, columns=['block', 'member'])
+            own_rows = stacked.loc[stacked['scenario'] >= 0, ['scenario', 'Person']].drop_duplicates()
+            own_rows = set(zip(own_rows['scenario'].tolist(), own_rows['Person'].tolist()))
+
+            def expand(changes):
+                changes = changes.merge(members, on='block')
+                changes['scenario'] = changes['member']
+                config_block = changes['block'].to_numpy() < len(config_ids)
+                shadowed = [(scenario, person) in own_rows for scenario, person in
+                            zip(changes['scenario'].tolist(), changes['Person'].tolist())]
+                return changes[~(config_block & np.array(shadowed, dtype=bool))]
+
+            row_ids, route_ids = np.nonzero(after != before)
+            route_changes = expand(pd.DataFrame({
+                'row': row_ids, 'route': route_ids,
+                'block': stacked['block'].to_numpy()[row_ids], 'Person': stacked['Person'].to_numpy()[row_ids],
+                'qualified_before': before[row_ids, route_ids], 'qualified_after': after[row_ids, route_ids],
+            }))
+            route_changes = self._scenario_route_details(sport, stacked, labels, route_changes)
+
+            athletes = pd.DataFrame({
+                'block': stacked['block'].to_numpy(), 'Person': stacked['Person'].to_numpy(),
+                'qualified_before': before.any(axis=1), 'qualified_after': after.any(axis=1),
+            }).groupby(['block', 'Person'], sort=False).any().reset_index()
+            athlete_changes = expand(athletes[athletes['qualified_before'] != athletes['qualified_after']])
+            athlete_changes = athlete_changes.assign(Sport=sport)[self.SCENARIO_ATHLETE_COLUMNS]
+
+            gained = athlete_changes.groupby('scenario')['qualified_after'].sum()
+            lost = athlete_changes.groupby('scenario')['qualified_before'].sum()
+            summary['gained'] = gained.reindex(summary['scenario'], fill_value=0).to_numpy()
+            summary['lost'] = lost.reindex(summary['scenario'], fill_value=0).to_numpy()
+
+        summary['qualified_before'] = base_qualified
+        summary['qualified_after'] = base_qualified + summary['gained'] - summary['lost']
+        return route_changes, athlete_changes, summary[self.SCENARIO_SUMMARY_COLUMNS]
+
+    def _scenario_route_details(self, sport, stacked, labels, changes):
+        """Group, Route, details and best_score of changed routes, formatted only for those rows"""
+        rows = changes['row'].to_numpy()
+        if sport in self.criteria.scores:
+            group = np.full(len(changes), None, dtype=object)
+            route = (stacked['Discipline'].astype(str) + '_' + stacked['Gender'].astype(str)).to_numpy()[rows]
+            details = np.full(len(changes), None, dtype=object)
+            best_score = stacked['best_score'].to_numpy()[rows]
+        else:
+            records = stacked.iloc[np.unique(rows)].to_dict('index')
+            routes = self.criteria.routes[sport]
+            group = np.array([labels[i][0] for i in changes['route'].tolist()], dtype=object)
+            route = np.array([labels[i][1] for i in changes['route'].tolist()], dtype=object)
+            details = np.array([routes[i].details(records[row]) for i, row in
+                                zip(changes['route'].tolist(), changes['row'].tolist())], dtype=object)
+            best_score = np.full(len(changes), np.nan)
+        return pd.DataFrame({
+            'scenario': changes['scenario'].to_numpy(), 'Person': changes['Person'].to_numpy(), 'Sport': sport,
+            'Group': group, 'Route': route,
+            'qualified_before': changes['qualified_before'].to_numpy(dtype=bool),
+            'qualified_after': changes['qualified_after'].to_numpy(dtype=bool),
+            'details': details, 'best_score': best_score,
+        }, columns=self.SCENARIO_ROUTE_COLUMNS)
 
 def main():
     """Test the fixed qualification checker"""
@@ -693,12 +1038,7 @@ def main():
     
     # Load data
     try:
-        df = pd.read_csv("data/Results_Test_Version.csv", sep=';', encoding='utf-8')
-        df.columns = df.columns.str.strip('"')
-        df = df[df['Nationality'] == 'SUI'].copy()
-        df['Date'] = pd.to_datetime(df['Date'], format='%Y/%m/%d %H:%M:%S', errors='coerce')
-        df['Rank_Clean'] = pd.to_numeric(df['Rank'].str.extract(r'(\d+)')[0], errors='coerce')
-        df['Name'] = df['Person']
+        df = load_results()
         
         print(f"✅ Data loaded: {len(df)} Swiss records")
         
@@ -706,8 +1046,8 @@ def main():
         print(f"❌ Error loading data: {e}")
         return
     
-    # Initialize fixed checker
-    checker = MultiSportQualificationChecker(df)
+    # Initialize fixed checker; crews are checked against the team members of every nationality
+    checker = MultiSportQualificationChecker(df, crew_members=load_crew_members())
     
     # Test with sample athletes
     test_athletes = [
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Stage Profiler for Swiss Olympic Team Selection
+Milano Cortina 2026 Olympics - Where does the time go?
+
+Loading, checker construction, bitmaps and every sport and route of the
+qualification checker are wrapped in named stages. Stages cost one context
+variable lookup while no profiler is active; inside `with Profiler()` each
+records wall time, row count and nesting:
+- summary(): one row per stage path (e.g. 'evaluate_all / Biathlon / Route 1')
+- write_trace(path): Chrome trace JSON, opens in chrome://tracing, Perfetto
+  and speedscope for offline analysis
+"""
+
+import contextlib
+import contextvars
+import json
+import os
+import sys
+import threading
+import time
+
+import pandas as pd
+
+# The profiler of the current run (thread / Streamlit session), if any
+_active = contextvars.ContextVar('active_profiler', default=None)
+
+class Span:
+    """One timed stage; callers may set rows and args while it runs"""
+
+    __slots__ = ('name', 'path', 'start', 'end', 'rows', 'args', 'thread')
+
+    def __init__(self, name, path, rows, args):
+        self.name = name
+        self.path = path
+        self.rows = rows
+        self.args = args
+        self.thread = threading.get_ident()
+        self.start = time.perf_counter()
+        self.end = None
+
+    @property
+    def seconds(self):
+        return (self.end if self.end is not None else time.perf_counter()) - self.start
+
+class _NullSpan:
+    """Stands in for a Span while profiling is off; attribute writes are dropped"""
+
+    __slots__ = ()
+
+    def __setattr__(self, name, value):
+        pass
+
+_DISABLED = contextlib.nullcontext(_NullSpan())
+
+def stage(name, rows=None, **args):
+    """Time a block as a named stage of the active profiler; a no-op without one
+
+        with stage('Route 1', sport='Biathlon') as span:
+            ...
+            span.rows = len(counts)
+    """
+    profiler = _active.get()
+    if profiler is None:
+        return _DISABLED
+    return profiler.stage(name, rows, **args)
+
+class Profiler:
+    """Records the stages run inside `with Profiler():`"""
+
+    def __init__(self):
+        self.spans = []
+        self._stack = []
+        self._token = None
+        self.start = None
+        self.end = None
+
+    def __enter__(self):
+        self._token = _active.set(self)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.end = time.perf_counter()
+        _active.reset(self._token)
+        return False
+
+    @property
+    def seconds(self):
+        """Wall time of the profiled run"""
+        return (self.end if self.end is not None else time.perf_counter()) - self.start
+
+    @contextlib.contextmanager
+    def stage(self, name, rows=None, **args):
+        parent = self._stack[-1].path + ' / ' if self._stack else ''
+        span = Span(name, parent + name, rows, args)
+        self._stack.append(span)
+        try:
+            yield span
+        finally:
+            span.end = time.perf_counter()
+            self._stack.pop()
+            self.spans.append(span)
+
+    def summary(self):
+        """Calls, wall time and rows per stage path, in the order stages first started"""
+        columns = ['stage', 'calls', 'total_ms', 'mean_ms', 'max_ms', 'rows', 'share']
+        if not self.spans:
+            return pd.DataFrame(columns=columns)
+        spans = pd.DataFrame({
+            'stage': [span.path for span in self.spans],
+            'start': [span.start for span in self.spans],
+            'ms': [span.seconds * 1000 for span in self.spans],
+            'rows': pd.array([span.rows for span in self.spans], dtype='Int64'),
+        })
+        groups = spans.groupby('stage', sort=False)
+        summary = groups.agg(
+            first=('start', 'min'), calls=('ms', 'size'), total_ms=('ms', 'sum'),
+            mean_ms=('ms', 'mean'), max_ms=('ms', 'max')
+        )
+        summary['rows'] = groups['rows'].sum(min_count=1)  # Stages without row counts stay empty
+        summary['share'] = summary['total_ms'] / (self.seconds * 1000)
+        return summary.sort_values('first').reset_index()[columns]
+
+    def chrome_trace(self):
+        """The stages as Chrome trace events (complete 'X' events, microseconds)"""
+        pid = os.getpid()
+        events = []
+        for span in sorted(self.spans, key=lambda span: span.start):
+            args = {key: str(value) for key, value in span.args.items()}
+            if span.rows is not None:
+                args['rows'] = int(span.rows)
+            events.append({
+                'name': span.name, 'cat': span.path.split(' / ')[0], 'ph': 'X',
+                'ts': (span.start - self.start) * 1e6, 'dur': span.seconds * 1e6,
+                'pid': pid, 'tid': span.thread, 'args': args
+            })
+        return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+
+    def write_trace(self, path):
+        """Write the Chrome trace JSON file"""
+        with open(path, 'w', encoding='utf-8') as handle:
+            json.dump(self.chrome_trace(), handle)
+
+    def format_summary(self):
+        """The summary as a fixed-width text table"""
+        lines = [f"{'Stage':<58} {'Calls':>6} {'Total ms':>10} {'Mean ms':>9} {'Rows':>10} {'Share':>6}",
+                 "-" * 104]
+        for row in self.summary().itertuples(index=False):
+            rows = '' if pd.isna(row.rows) else f'{int(row.rows):,}'
+            name = row.stage if len(row.stage) <= 58 else '…' + row.stage[-57:]
+            lines.append(f"{name:<58} {row.calls:>6} {row.total_ms:>10.2f} {row.mean_ms:>9.3f} "
+                         f"{rows:>10} {row.share:>6.1%}")
+        lines.append("-" * 104)
+        lines.append(f"{'Profiled run':<58} {'':>6} {self.seconds * 1000:>10.2f}")
+        return '\n'.join(lines)
+
+# ========================================================================================
+# COMMAND-LINE PROFILING
+# ========================================================================================
+
+def add_profile_arguments(parser):
+    """Add --profile and --profile-trace to a command-line parser"""
+    parser.add_argument('--profile', action='store_true', help='print wall time and rows per stage')
+    parser.add_argument('--profile-trace', metavar='FILE',
+                        help='also write a Chrome trace (chrome://tracing, Perfetto, speedscope); implies --profile')
+
+@contextlib.contextmanager
+def profile_run(args, file=None):
+    """Profile the block when --profile or --profile-trace was given, then print the stage table"""
+    if not (args.profile or args.profile_trace):
+        yield None
+        return
+    with Profiler() as profiler:
+        yield profiler
+    file = file or sys.stderr
+    print(f"\n⏱️ PROFILE\n{profiler.format_summary()}", file=file)
+    if args.profile_trace:
+        profiler.write_trace(args.profile_trace)
+        print(f"💾 Chrome trace written to {args.profile_trace}", file=file)
@@ -0,0 +1,350 @@
+#!/usr/bin/env python3
+"""
+Qualification HTTP Service for Swiss Olympic Team Selection
+Milano Cortina 2026 Olympics - Warm qualification results for internal tools
+
+One process loads the results once, keeps one MultiSportQualificationChecker in
+memory and evaluates the whole roster at startup (from the persistent result
+cache when results, criteria and code are unchanged). Every response body is
+encoded once with a strong ETag, so polling clients that send If-None-Match get
+an empty 304 while nothing changed. Endpoints (JSON):
+- GET  /health
+- GET  /sports                               sports and their summary paths
+- GET  /sports/{sport}/summary               athletes, qualified, route counts
+- GET  /athletes/{name}/qualification        check_athlete_qualification result
+- GET  /athletes/qualification?name=A&name=B batch, also as
+  POST /athletes/qualification {"athletes": [...]}
+
+Runs on the standard library's asyncio streams; no web framework needed. The
+service is rebuilt in the background when the results file changes.
+
+Usage: python src/qualification_service.py [--host HOST] [--port PORT]
+                                           [--input FILE] [--nationality SUI] [--no-cache]
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import sys
+import time
+from urllib.parse import parse_qs, quote, unquote, urlsplit
+
+from athlete_search import AthleteSearchIndex, fold
+from crew_graph import load_crew_members
+from data_loader import RESULTS_CSV, dataset_version
+from multi_sport_qualification_checker import MultiSportQualificationChecker
+from profiler import stage
+from qualify import load_input
+from result_cache import QualificationResultCache, json_default, result_cache_key
+from snapshot_store import SnapshotStore
+
+DEFAULT_PORT = 8503
+
+# Largest accepted request head and body; batch requests list a few hundred names
+MAX_HEADER_BYTES = 16 * 1024
+MAX_BODY_BYTES = 1024 * 1024
+
+# Idle keep-alive connections are closed after this many seconds
+KEEP_ALIVE_SECONDS = 30
+
+REASONS = {200: 'OK', 304: 'Not Modified', 400: 'Bad Request', 404: 'Not Found',
+           405: 'Method Not Allowed', 413: 'Payload Too Large'}
+
+class Response:
+    """One encoded JSON body and its ETag, built once and served many times"""
+
+    __slots__ = ('status', 'body', 'etag')
+
+    def __init__(self, body, status=200):
+        self.status = status
+        self.body = body
+        self.etag = '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+
+    @classmethod
+    def encode(cls, payload, status=200):
+        """Response of a JSON-serialisable payload (lazy qualification results included)"""
+        return cls(json.dumps(payload, ensure_ascii=False, default=json_default).encode('utf-8'), status)
+
+    @classmethod
+    def error(cls, status, message, **extra):
+        return cls.encode({'error': message, **extra}, status)
+
+def etag_matches(if_none_match, etag):
+    """Whether an If-None-Match header names the ETag (weak comparison, as RFC 9110 asks)"""
+    if if_none_match is None:
+        return False
+    tags = [tag.strip() for tag in if_none_match.split(',')]
+    tags = [tag[2:] if tag.startswith('W/') else tag for tag in tags]
+    return '*' in tags or etag in tags
+
+def sport_key(text):
+    """Case, accent and separator insensitive sport name: 'alpine-skiing' finds 'Alpine Skiing'"""
+    return fold(text).replace(' ', '')
+
+# ========================================================================================
+# PRECOMPUTED RESULTS
+# ========================================================================================
+
+class QualificationService:
+    """Encoded qualification responses of one dataset, evaluated once at startup"""
+
+    def __init__(self, df, cache=None, version=None, crew_members=None):
+        """df: cleaned results; cache: QualificationResultCache to read and fill, or None;
+        crew_members: Bobsleigh team member rows of every nationality (load_crew_members)"""
+        self.version = version
+        self.started = time.time()
+        self.checker = MultiSportQualificationChecker(df, crew_members)
+        self.search_index = AthleteSearchIndex.from_results(df)
+
+        # Route outcomes and full athlete statuses, from the cache where possible
+        if cache is not None:
+            outcomes = cache.evaluate_all(lambda: self.checker)
+            statuses = cache.athlete_statuses(self.checker.valid_persons)
+        else:
+            outcomes, statuses = self.checker.evaluate_all(), {}
+        missing = [athlete for athlete in sorted(self.checker.valid_persons) if athlete not in statuses]
+        with stage('evaluate athletes', rows=len(missing)):
+            evaluated = {athlete: self.checker.check_athlete_qualification(athlete) for athlete in missing}
+        if cache is not None and evaluated:
+            cache.store_athlete_statuses(evaluated)
+        statuses.update(evaluated)
+
+        with stage('encode responses', rows=len(statuses)):
+            self.athletes = {athlete: Response.encode(status) for athlete, status in statuses.items()}
+            summaries = self._sport_summaries(self.checker.df, outcomes)
+            self.sports = {sport: Response.encode(summary) for sport, summary in summaries.items()}
+            self._sport_keys = {sport_key(sport): sport for sport in self.sports}
+            self.sport_index = Response.encode({
+                'sports': [{'sport': sport, 'summary': f'/sports/{quote(sport)}/summary'} for sport in self.sports]
+            })
+
+    @staticmethod
+    def _sport_summaries(df, outcomes):
+        """Per sport: athletes with results, qualified athletes and qualified athletes per route"""
+        summaries = {}
+        athletes_per_sport = df.groupby('Sport', sort=True, observed=True)['Person'].nunique()
+        for sport, athletes in athletes_per_sport.items():
+            qualified = outcomes[(outcomes['Sport'] == sport) & outcomes['qualified']]
+            routes = qualified.assign(Group=qualified['Group'].fillna('')).groupby(['Group', 'Route'], sort=True)
+            athletes = int(athletes)
+            qualified_athletes = sorted(qualified['Person'].unique().tolist())
+            summaries[sport] = {
+                'sport': sport,
+                'athletes': athletes,
+                'qualified': len(qualified_athletes),
+                'qualification_rate': round(len(qualified_athletes) / athletes, 4) if athletes else 0.0,
+                'qualified_athletes': qualified_athletes,
+                'routes': [
+                    {'group': group or None, 'route': route, 'qualified': int(persons.nunique())}
+                    for (group, route), persons in routes['Person']
+                ],
+            }
+        return summaries
+
+    def health(self):
+        return Response.encode({
+            'status': 'ok', 'dataset_version': self.version, 'athletes': len(self.athletes),
+            'sports': len(self.sports), 'uptime_seconds': round(time.time() - self.started, 1)
+        })
+
+    def athlete(self, name):
+        """Qualification of one athlete; 404 with close name matches when unknown"""
+        response = self.athletes.get(name)
+        if response is None:
+            return Response.error(404, f'Athlete "{name}" not found in dataset',
+                                  suggestions=self.search_index.search(name, limit=5))
+        return response
+
+    def sport(self, name):
+        sport = self.sports.get(name) or self.sports.get(self._sport_keys.get(sport_key(name)))
+        if sport is None:
+            return Response.error(404, f'Sport "{name}" not found', sports=list(self.sports))
+        return sport
+
+    def batch(self, names):
+        """Qualification of several athletes as one document, assembled from the encoded bodies"""
+        names = list(dict.fromkeys(names))
+        found = [name for name in names if name in self.athletes]
+        not_found = [name for name in names if name not in self.athletes]
+        parts = b','.join(
+            json.dumps(name, ensure_ascii=False).encode('utf-8') + b':' + self.athletes[name].body
+            for name in found
+        )
+        not_found = json.dumps(not_found, ensure_ascii=False).encode('utf-8')
+        return Response(b'{"results":{' + parts + b'},"not_found":' + not_found + b'}')
+
+# ========================================================================================
+# HTTP/1.1 ON ASYNCIO STREAMS
+# ========================================================================================
+
+class BadRequest(Exception):
+    """A request the service cannot parse; carries the HTTP status to answer with"""
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+async def read_request(reader):
+    """(method, target, headers, body) of the next request, or None when the client closed"""
+    try:
+        head = await reader.readuntil(b'\r\n\r\n')
+    except asyncio.IncompleteReadError:
+        return None
+    except asyncio.LimitOverrunError:
+        raise BadRequest(413, 'Request headers too large')
+    request_line, *header_lines = head.decode('latin-1').split('\r\n')
+    try:
+        method, target, _ = request_line.split(' ', 2)
+    except ValueError:
+        raise BadRequest(400, 'Malformed request line')
+    headers = {}
+    for line in header_lines:
+        if line:
+            name, _, value = line.partition(':')
+            headers[name.strip().lower()] = value.strip()
+
+    body = b''
+    if headers.get('content-length'):
+        try:
+            length = int(headers['content-length'])
+        except ValueError:
+            raise BadRequest(400, 'Invalid Content-Length')
+        if length < 0:
+            raise BadRequest(400, 'Invalid Content-Length')
+        if length > MAX_BODY_BYTES:
+            raise BadRequest(413, 'Request body too large')
+        body = await reader.readexactly(length)
+    return method, target, headers, body
+
+def route(service, method, target, body):
+    """The Response for one request"""
+    url = urlsplit(target)
+    parts = [unquote(part) for part in url.path.strip('/').split('/')]
+
+    if parts == ['athletes', 'qualification']:
+        if method == 'POST':
+            try:
+                names = json.loads(body or b'{}').get('athletes')
+            except (ValueError, AttributeError):
+                names = None
+            if not isinstance(names, list) or not all(isinstance(name, str) for name in names):
+                return Response.error(400, 'Expected a JSON body {"athletes": [name, ...]}')
+            return service.batch(names)
+        if method == 'GET':
+            return service.batch(parse_qs(url.query).get('name', []))
+        return Response.error(405, 'Use GET or POST')
+
+    if method != 'GET':
+        return Response.error(405, 'Use GET')
+    if parts == ['health']:
+        return service.health()
+    if parts == ['sports']:
+        return service.sport_index
+    if len(parts) == 3 and parts[0] == 'sports' and parts[2] == 'summary':
+        return service.sport(parts[1])
+    if len(parts) == 3 and parts[0] == 'athletes' and parts[2] == 'qualification':
+        return service.athlete(parts[1])
+    return Response.error(404, f'No endpoint {url.path}')
+
+def encode_response(response, headers, keep_alive):
+    """Status line, headers and (unless the client's ETag still matches) the body"""
+    status, body = response.status, response.body
+    if status == 200 and etag_matches(headers.get('if-none-match'), response.etag):
+        status, body = 304, b''
+    lines = [
+        f'HTTP/1.1 {status} {REASONS[status]}',
+        'Content-Type: application/json; charset=utf-8',
+        f'Content-Length: {len(body)}',
+        f'Connection: {"keep-alive" if keep_alive else "close"}',
+    ]
+    if response.status == 200:
+        lines += [f'ETag: {response.etag}', 'Cache-Control: no-cache']
+    if status == 405:
+        lines.append('Allow: GET, POST')
+    return ('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1') + body
+
+async def handle_connection(current_service, reader, writer):
+    """Serve requests of one (keep-alive) connection until it closes or idles out
+
+    current_service() is asked once per request, so a refreshed dataset is
+    served from the next request on, also on open connections.
+    """
+    try:
+        while True:
+            try:
+                request = await asyncio.wait_for(read_request(reader), KEEP_ALIVE_SECONDS)
+            except BadRequest as e:
+                writer.write(encode_response(Response.error(e.status, str(e)), {}, keep_alive=False))
+                await writer.drain()
+                break
+            except (asyncio.TimeoutError, asyncio.IncompleteReadError):
+                break
+            if request is None:
+                break
+            method, target, headers, body = request
+            keep_alive = headers.get('connection', '').lower() != 'close'
+            writer.write(encode_response(route(current_service(), method, target, body), headers, keep_alive))
+            await writer.drain()
+            if not keep_alive:
+                break
+    except ConnectionError:
+        pass
+    finally:
+        writer.close()
+
+async def serve(current_service, host='127.0.0.1', port=DEFAULT_PORT, ready=None):
+    """Serve current_service() until cancelled; ready(server) is called once the socket listens"""
+    server = await asyncio.start_server(
+        lambda reader, writer: handle_connection(current_service, reader, writer), host, port,
+        limit=MAX_HEADER_BYTES
+    )
+    if ready is not None:
+        ready(server)
+    async with server:
+        await server.serve_forever()
+
+def build_service(path=RESULTS_CSV, nationality='SUI', use_cache=True, version=None):
+    """Load the results and evaluate the roster into a QualificationService"""
+    df = load_input(path, nationality)
+    cache = QualificationResultCache(result_cache_key(path, nationality)) if use_cache else None
+    return QualificationService(df, cache, version=version or dataset_version(path), crew_members=load_crew_members(path))
+
+def main(argv=None):
+    """Start the qualification service"""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--host', default='127.0.0.1', help='address to listen on (default 127.0.0.1)')
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT, help=f'port (default {DEFAULT_PORT})')
+    parser.add_argument('--input', default=RESULTS_CSV, help=f'results CSV or .feather store (default {RESULTS_CSV})')
+    parser.add_argument('--nationality', default='SUI', help="nationality filter, 'ALL' for none (default SUI)")
+    parser.add_argument('--no-cache', action='store_true', help='ignore the persistent qualification result cache')
+    args = parser.parse_args(argv)
+
+    print("🛰️ SWISS OLYMPIC QUALIFICATION SERVICE")
+    print("=" * 45)
+    start = time.perf_counter()
+    nationality = None if args.nationality == 'ALL' else args.nationality
+    # Rebuilt in the background when the results file changes; requests see one service or the next
+    store = SnapshotStore(
+        lambda version: build_service(args.input, nationality, use_cache=not args.no_cache, version=version),
+        version=lambda: dataset_version(args.input)
+    )
+    try:
+        service = store.snapshot()
+    except Exception as e:
+        print(f"❌ Error loading data: {e}")
+        return 1
+    print(f"✅ {len(service.athletes)} athletes across {len(service.sports)} sports ready "
+          f"in {time.perf_counter() - start:.2f} s")
+
+    def ready(server):
+        print(f"🚀 Listening on http://{args.host}:{args.port} (Ctrl+C to stop)")
+
+    try:
+        asyncio.run(serve(store.start().snapshot, args.host, args.port, ready))
+    except KeyboardInterrupt:
+        print("\n✅ Qualification service stopped")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
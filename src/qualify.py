@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Headless Qualification Report for Swiss Olympic Team Selection
+Milano Cortina 2026 Olympics - Machine-readable output for nightly jobs
+
+Writes one record per (athlete, sport, route) as JSON lines, CSV or Parquet.
+Records are streamed sport by sport as each evaluation finishes, so the full
+report is never held in memory. Progress goes to stderr, records to stdout
+or --output.
+
+Usage: python src/qualify.py [--input FILE] [--format jsonl|csv|parquet]
+                             [--sport SPORT ...] [--athlete NAME ...] [--output FILE]
+                             [--profile] [--profile-trace FILE]
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+from criteria_compiler import load_criteria_plan
+from data_loader import HAS_PYARROW, RESULTS_CSV, load_results, read_store
+from multi_sport_qualification_checker import MultiSportQualificationChecker
+from profiler import add_profile_arguments, profile_run, stage
+
+if HAS_PYARROW:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+FORMATS = ['jsonl', 'csv', 'parquet']
+
+RECORD_COLUMNS = MultiSportQualificationChecker.OUTCOME_COLUMNS
+
+class ReportWriter:
+    """Append record batches to a JSON lines, CSV or Parquet report"""
+
+    def __init__(self, output, report_format):
+        self.format = report_format
+        self.records = 0
+        self._parquet = None
+        if report_format == 'parquet':
+            if not HAS_PYARROW:
+                raise ImportError('pyarrow is required for --format parquet')
+            if output is None:
+                raise ValueError('--format parquet needs --output')
+            schema = pa.schema([
+                ('Person', pa.string()), ('Sport', pa.string()), ('Group', pa.string()),
+                ('Route', pa.string()), ('qualified', pa.bool_()), ('details', pa.string()),
+                ('note', pa.string()), ('best_score', pa.float64()), ('threshold', pa.float64())
+            ])
+            self._parquet = pq.ParquetWriter(output, schema)
+            self._schema = schema
+            self._handle = None
+        else:
+            self._handle = sys.stdout if output is None else open(output, 'w', encoding='utf-8', newline='')
+
+    def write(self, batch):
+        """Write one evaluated batch (evaluate_all layout) and flush it"""
+        batch = batch[RECORD_COLUMNS]
+        if self.format == 'parquet':
+            # One row group per batch; the footer is written on close
+            self._parquet.write_table(pa.Table.from_pandas(batch, schema=self._schema, preserve_index=False))
+        elif self.format == 'csv':
+            batch.to_csv(self._handle, index=False, header=self.records == 0)
+        else:
+            for record in batch.astype(object).where(batch.notna(), None).to_dict('records'):
+                if record['threshold'] is not None:
+                    record['threshold'] = int(record['threshold'])
+                self._handle.write(json.dumps(record, ensure_ascii=False) + '\n')
+        if self._handle is not None:
+            self._handle.flush()
+        self.records += len(batch)
+
+    def close(self):
+        if self._parquet is not None:
+            self._parquet.close()
+        elif self._handle is not None and self._handle is not sys.stdout:
+            self._handle.close()
+
+def load_input(path, nationality):
+    """Cleaned results from a results CSV or a columnar store (.feather)"""
+    columns = MultiSportQualificationChecker.RESULT_COLUMNS
+    if path.endswith('.feather'):
+        return read_store(path, nationality=nationality, columns=columns)
+    return load_results(path, nationality=nationality, columns=columns)
+
+def iter_reports(checker, sports, athletes=None):
+    """Yield (sport, outcome batch) as each sport's evaluation finishes"""
+    for sport in sports:
+        batch = checker.evaluate_all(sport=sport, athletes=athletes)
+        if not batch.empty:
+            yield sport, batch
+
+def main(argv=None):
+    """Write the qualification report"""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--input', default=RESULTS_CSV, help=f'results CSV or .feather store (default {RESULTS_CSV})')
+    parser.add_argument('--format', choices=FORMATS, default='jsonl', help='report format (default jsonl)')
+    parser.add_argument('--sport', action='append', choices=load_criteria_plan().sports,
+                        help='only this sport (repeatable; default all)')
+    parser.add_argument('--athlete', action='append', help='only this athlete (repeatable; default all)')
+    parser.add_argument('--nationality', default='SUI', help="nationality filter, 'ALL' for none (default SUI)")
+    parser.add_argument('--output', help='report file (default stdout; required for parquet)')
+    add_profile_arguments(parser)
+    args = parser.parse_args(argv)
+
+    with profile_run(args):
+        return write_report(args)
+
+def write_report(args):
+    """Load, evaluate and write the report for parsed arguments; returns the exit status"""
+    log = sys.stderr
+    start = time.perf_counter()
+    try:
+        df = load_input(args.input, None if args.nationality == 'ALL' else args.nationality)
+    except Exception as e:
+        print(f"❌ Error loading data: {e}", file=log)
+        return 1
+    print(f"✅ Data loaded: {len(df):,} results from {args.input}", file=log)
+
+    checker = MultiSportQualificationChecker(df)
+    sports = args.sport or checker.criteria.sports
+
+    try:
+        writer = ReportWriter(args.output, args.format)
+    except (ImportError, ValueError, OSError) as e:
+        print(f"❌ {e}", file=log)
+        return 1
+
+    try:
+        for sport, batch in iter_reports(checker, sports, args.athlete):
+            with stage('write report', rows=len(batch), sport=sport):
+                writer.write(batch)
+            qualified = batch.loc[batch['qualified'], 'Person'].nunique()
+            print(f"🏅 {sport}: {len(batch):,} route records, {qualified} athletes qualified", file=log)
+    except BrokenPipeError:
+        # Reader went away (e.g. `| head`); stop quietly like other Unix filters
+        sys.stdout = open(os.devnull, 'w')
+        return 0
+    finally:
+        writer.close()
+
+    print(f"🏁 {writer.records:,} records written in {time.perf_counter() - start:.2f} s", file=log)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+"""
+Persistent Qualification Result Cache for Swiss Olympic Team Selection
+Milano Cortina 2026 Olympics - Skip re-evaluation when nothing changed
+
+Qualification outcomes are stored in one SQLite file under data/.cache, keyed by
+- the content hash of the results data
+- a hash of the criteria files in criterias/
+- a hash of the checker, criteria compiler and loader source code
+Changing any of them yields a new key, so stale entries are never served.
+Apps, CLI and service with different keys (e.g. another nationality) share the
+file: writes keep the MAX_CACHE_KEYS most recently used keys and drop the rest.
+Two kinds of entries:
+- route outcomes: the evaluate_all table of the whole roster (dashboard, qualify)
+- athlete status: check_athlete_qualification dicts (lookup, analysis); the
+  available_competitions lists are stored once per sport and shared on read
+"""
+
+import glob
+import hashlib
+import json
+import os
+import sqlite3
+import time
+from collections.abc import Mapping
+
+import numpy as np
+import pandas as pd
+
+import crew_graph
+import criteria_compiler
+import data_loader
+import multi_sport_qualification_checker
+from criteria_compiler import CRITERIA_DIR
+from data_loader import CACHE_DIR, RESULTS_CSV, dataset_content_hash
+from multi_sport_qualification_checker import MultiSportQualificationChecker
+from profiler import stage
+
+RESULT_CACHE_DB = os.path.join(CACHE_DIR, 'qualification_results.sqlite')
+
+# Cache keys kept in the file; the least recently used beyond these are dropped on write
+MAX_CACHE_KEYS = 8
+
+# Modules whose source decides the outcomes; editing one invalidates the cache
+CODE_MODULES = [multi_sport_qualification_checker, crew_graph, criteria_compiler, data_loader]
+
+OUTCOME_COLUMNS = MultiSportQualificationChecker.OUTCOME_COLUMNS
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS route_outcomes (
+    cache_key TEXT NOT NULL, Person TEXT, Sport TEXT, "Group" TEXT, Route TEXT,
+    qualified INTEGER, details TEXT, note TEXT, best_score REAL, threshold REAL
+);
+CREATE INDEX IF NOT EXISTS route_outcomes_key ON route_outcomes (cache_key);
+CREATE TABLE IF NOT EXISTS athlete_status (
+    cache_key TEXT NOT NULL, person TEXT NOT NULL, status TEXT NOT NULL,
+    PRIMARY KEY (cache_key, person)
+);
+CREATE TABLE IF NOT EXISTS competitions (
+    cache_key TEXT NOT NULL, sport TEXT NOT NULL, competitions TEXT NOT NULL,
+    PRIMARY KEY (cache_key, sport)
+);
+CREATE TABLE IF NOT EXISTS cache_entries (
+    cache_key TEXT NOT NULL, kind TEXT NOT NULL, PRIMARY KEY (cache_key, kind)
+);
+CREATE TABLE IF NOT EXISTS cache_keys (
+    cache_key TEXT PRIMARY KEY, last_used REAL NOT NULL
+);
+"""
+
+def json_default(value):
+    """json.dumps fallback: lazy result mappings as dicts, numpy scalars as Python values
+
+    Other types raise TypeError: a string in their place would read back as a
+    different type than a fresh evaluation returns.
+    """
+    if isinstance(value, Mapping):
+        return dict(value)
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f'{type(value).__name__} is not JSON serializable')
+
+def _hash_files(paths):
+    digest = hashlib.sha256()
+    for path in paths:
+        digest.update(os.path.basename(path).encode() + b'\0')
+        with open(path, 'rb') as handle:
+            digest.update(handle.read())
+    return digest.hexdigest()
+
+def criteria_hash(criteria_dir=CRITERIA_DIR):
+    """Hash of every criteria file"""
+    return _hash_files(sorted(glob.glob(os.path.join(criteria_dir, '*.txt'))))
+
+def code_hash():
+    """Hash of the source code that computes the outcomes"""
+    return _hash_files([module.__file__ for module in CODE_MODULES])
+
+def result_cache_key(path=RESULTS_CSV, nationality='SUI', criteria_dir=CRITERIA_DIR):
+    """Cache key of the current results data, criteria files and checker code"""
+    parts = [dataset_content_hash(path), nationality or 'ALL', criteria_hash(criteria_dir), code_hash()]
+    return hashlib.sha256('|'.join(parts).encode()).hexdigest()[:32]
+
+class QualificationResultCache:
+    """Route outcomes and athlete statuses of one cache key, persisted in SQLite"""
+
+    def __init__(self, key, path=RESULT_CACHE_DB):
+        self.key = key
+        self.path = path
+        self._competitions = None
+        self._touched = False
+
+    def _connect(self):
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        connection = sqlite3.connect(self.path, timeout=30)
+        connection.executescript(SCHEMA)
+        return connection
+
+    def _read(self, query, parameters=()):
+        """Rows of a query, or None when the cache file is missing or unreadable"""
+        if not os.path.exists(self.path):
+            return None
+        try:
+            connection = sqlite3.connect(self.path, timeout=30)
+        except sqlite3.Error:
+            return None
+        try:
+            return connection.execute(query, parameters).fetchall()
+        except sqlite3.Error:
+            return None
+        finally:
+            connection.close()
+
+    def _write(self, kind, statements):
+        """Run statements in one transaction, dropping the entries of least recently used keys first"""
+        try:
+            connection = self._connect()
+        except (OSError, sqlite3.Error):
+            return  # Read-only data directory, serve uncached
+        try:
+            with connection:
+                connection.execute('INSERT OR REPLACE INTO cache_keys VALUES (?, ?)', (self.key, time.time()))
+                connection.execute(
+                    'DELETE FROM cache_keys WHERE cache_key IN '
+                    '(SELECT cache_key FROM cache_keys ORDER BY last_used DESC LIMIT -1 OFFSET ?)', (MAX_CACHE_KEYS,)
+                )
+                for table in ('route_outcomes', 'athlete_status', 'competitions', 'cache_entries'):
+                    connection.execute(f'DELETE FROM {table} WHERE cache_key NOT IN (SELECT cache_key FROM cache_keys)')
+                for query, rows in statements:
+                    connection.executemany(query, rows)
+                if kind is not None:
+                    connection.execute('INSERT OR IGNORE INTO cache_entries VALUES (?, ?)', (self.key, kind))
+        except sqlite3.Error:
+            pass
+        finally:
+            connection.close()
+        self._touched = True
+
+    def _touch(self):
+        """Mark the key as used on its first hit, so readers keep their entries from eviction"""
+        if self._touched:
+            return
+        self._touched = True
+        try:
+            connection = sqlite3.connect(self.path, timeout=30)
+        except sqlite3.Error:
+            return
+        try:
+            with connection:
+                connection.execute('UPDATE cache_keys SET last_used = ? WHERE cache_key = ?', (time.time(), self.key))
+        except sqlite3.Error:
+            pass  # Read-only or pre-LRU file: the next write registers the key
+        finally:
+            connection.close()
+
+    # ----------------------------------------------------------------------------------------
+    # Route outcomes of the whole roster
+    # ----------------------------------------------------------------------------------------
+
+    def outcomes(self):
+        """Cached evaluate_all table, or None on a miss"""
+        if not self._read('SELECT 1 FROM cache_entries WHERE cache_key = ? AND kind = ?', (self.key, 'outcomes')):
+            return None
+        rows = self._read(
+            'SELECT Person, Sport, "Group", Route, qualified, details, note, best_score, threshold '
+            'FROM route_outcomes WHERE cache_key = ? ORDER BY rowid', (self.key,)
+        )
+        if rows is None:
+            return None
+        outcomes = pd.DataFrame(rows, columns=OUTCOME_COLUMNS)
+        outcomes['qualified'] = outcomes['qualified'].astype(bool)
+        self._touch()
+        return outcomes
+
+    def store_outcomes(self, outcomes):
+        rows = outcomes[OUTCOME_COLUMNS].astype(object).where(outcomes[OUTCOME_COLUMNS].notna(), None)
+        rows['qualified'] = rows['qualified'].astype(bool).astype(int)
+        self._write('outcomes', [
+            ('DELETE FROM route_outcomes WHERE cache_key = ?', [(self.key,)]),
+            ('INSERT INTO route_outcomes VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+             [(self.key, *row) for row in rows.itertuples(index=False, name=None)])
+        ])
+
+    def evaluate_all(self, get_checker):
+        """Roster-wide outcomes from the cache, evaluated via get_checker() on a miss"""
+        with stage('result cache lookup') as span:
+            outcomes = self.outcomes()
+            span.rows = None if outcomes is None else len(outcomes)
+        if outcomes is None:
+            outcomes = get_checker().evaluate_all()
+            self.store_outcomes(outcomes)
+        return outcomes
+
+    # ----------------------------------------------------------------------------------------
+    # Per-athlete qualification status
+    # ----------------------------------------------------------------------------------------
+
+    def _shared_competitions(self):
+        """Sport -> available_competitions list, read once and shared by every status"""
+        if self._competitions is None:
+            rows = self._read('SELECT sport, competitions FROM competitions WHERE cache_key = ?', (self.key,))
+            if rows is None:
+                return {}
+            self._competitions = {sport: json.loads(competitions) for sport, competitions in rows}
+        return self._competitions
+
+    def _load_status(self, status):
+        status = json.loads(status)
+        competitions = self._shared_competitions()
+        for sport, result in status.get('sports_qualifications', {}).items():
+            if 'available_competitions' in result:
+                result['available_competitions'] = competitions.get(sport, [])
+        return status
+
+    def athlete_status(self, athlete_name):
+        """Cached check_athlete_qualification dict of one athlete, or None"""
+        rows = self._read('SELECT status FROM athlete_status WHERE cache_key = ? AND person = ?',
+                          (self.key, athlete_name))
+        if not rows:
+            return None
+        self._touch()
+        return self._load_status(rows[0][0])
+
+    def athlete_statuses(self, athletes):
+        """Cached statuses of the given athletes; missing athletes are left out"""
+        rows = self._read('SELECT person, status FROM athlete_status WHERE cache_key = ?', (self.key,)) or []
+        wanted = set(athletes)
+        statuses = {person: self._load_status(status) for person, status in rows if person in wanted}
+        if statuses:
+            self._touch()
+        return statuses
+
+    def store_athlete_statuses(self, statuses):
+        """Persist check_athlete_qualification results (dicts or lazy AthleteQualification)"""
+        rows, competitions = [], {}
+        for person, status in statuses.items():
+            status = dict(status)
+            if 'sports_qualifications' in status:
+                # Competition lists are per sport, not per athlete: store them once
+                sports = {}
+                for sport, result in status['sports_qualifications'].items():
+                    if 'available_competitions' in result:
+                        competitions[sport] = list(result['available_competitions'])
+                        result = {**result, 'available_competitions': None}
+                    sports[sport] = result
+                status['sports_qualifications'] = sports
+            rows.append((self.key, person, json.dumps(status, default=json_default)))
+        self._write(None, [
+            ('INSERT OR REPLACE INTO competitions VALUES (?, ?, ?)',
+             [(self.key, sport, json.dumps(names, default=json_default)) for sport, names in competitions.items()]),
+            ('INSERT OR REPLACE INTO athlete_status VALUES (?, ?, ?)', rows),
+        ])
+        if competitions and self._competitions is not None:
+            self._competitions.update(competitions)
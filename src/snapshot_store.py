@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Shared Snapshot Store for Swiss Olympic Team Selection
+Milano Cortina 2026 Olympics - One warm copy of the results per process
+
+Streamlit sessions, threads of the qualification service or any other reader
+share one snapshot of everything derived from the results file (data, checker,
+precomputed qualification tables). A snapshot is built once and never changed
+afterwards; readers take a reference and use it without copying or locking.
+A background thread polls the dataset version (a stat call) and, when the file
+changed, builds the next snapshot off the request path and swaps the reference.
+Readers holding the old snapshot finish on it undisturbed.
+"""
+
+import threading
+import time
+
+from data_loader import dataset_version
+from profiler import stage
+
+# Seconds between dataset version checks of the refresh thread
+REFRESH_SECONDS = 10
+
+class SnapshotStore:
+    """Current snapshot of build(version), rebuilt in the background when the version changes"""
+
+    def __init__(self, build, version=dataset_version, interval=REFRESH_SECONDS):
+        """build: version -> snapshot (treated as immutable); version: () -> current dataset version"""
+        self._build = build
+        self._version = version
+        self.interval = interval
+        self._current = None
+        self._build_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        self.version = None
+        self.built_at = None
+        self.builds = 0
+        self.last_error = None
+
+    def snapshot(self):
+        """The current snapshot; the first call builds it"""
+        current = self._current
+        if current is None:
+            self.refresh()
+            current = self._current
+        return current
+
+    def refresh(self, force=False):
+        """Build and publish a new snapshot if the dataset version changed (or force); True if one was built"""
+        with self._build_lock:
+            version = self._version()
+            if not force and self._current is not None and version == self.version:
+                return False
+            with stage('build snapshot', version=version):
+                snapshot = self._build(version)
+            # One reference assignment: readers see the old or the new snapshot, never a mix
+            self._current = snapshot
+            self.version = version
+            self.built_at = time.time()
+            self.builds += 1
+            self.last_error = None
+            return True
+
+    def start(self):
+        """Start the daemon thread that refreshes the snapshot every interval seconds"""
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._watch, name='snapshot-refresh', daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def _watch(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.refresh()
+            except Exception as e:
+                # Keep serving the last good snapshot; the next check retries
+                self.last_error = e
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Synthetic Results Generator for Swiss Olympic Team Selection
+Milano Cortina 2026 Olympics - Large result sets with the shape of the real export
+
+Generated rows keep the 38 raw columns of data/Results_Test_Version.csv:
+- Athletes get a sport and gender profile drawn from the real roster
+- Event columns (competition, discipline, host city, ...) come from real result
+  rows of the same profile, so every name in competition_mapping appears
+- Ranks are drawn from the profile's real rank distribution (DNF, DNS included)
+- Dates are shifted back whole seasons to spread results over several years
+"""
+
+import csv
+import os
+
+import numpy as np
+import pandas as pd
+
+from data_loader import DATE_FORMAT, RESULTS_CSV, read_results_csv
+
+# Share of results moved back 0, 1, 2 or 3 seasons
+SEASON_SHIFT_WEIGHTS = [0.55, 0.25, 0.12, 0.08]
+
+# Person-level columns replaced per synthetic athlete
+PERSON_COLUMNS = ['Person', 'Person First Name', 'Person Last Name', 'Person/Team', 'PersonGender', 'Nationality']
+
+OTHER_NATIONALITIES = ['AUT', 'GER', 'NOR', 'FRA', 'ITA', 'USA', 'CAN', 'SWE']
+
+def load_templates(path=RESULTS_CSV):
+    """Raw athlete result rows used as templates, with object dtypes"""
+    raw = read_results_csv(path)
+    raw.columns = raw.columns.str.strip('"').str.lstrip('\ufeff')
+    return raw[raw['Person'].notna()].astype(object).reset_index(drop=True)
+
+def athlete_pool(templates, n_athletes, swiss_share=1.0, seed=0):
+    """Synthetic athletes with a (Sport, PersonGender) profile sampled from real athletes"""
+    rng = np.random.default_rng(seed)
+    profiles = templates.drop_duplicates('Person')[['Sport', 'PersonGender']].reset_index(drop=True)
+    picks = rng.integers(0, len(profiles), n_athletes)
+
+    first_names = templates['Person First Name'].dropna().unique()
+    last_names = templates['Person Last Name'].dropna().unique()
+    first = first_names[rng.integers(0, len(first_names), n_athletes)]
+    last = last_names[rng.integers(0, len(last_names), n_athletes)]
+
+    nationality = np.where(
+        rng.random(n_athletes) < swiss_share, 'SUI',
+        np.array(OTHER_NATIONALITIES)[rng.integers(0, len(OTHER_NATIONALITIES), n_athletes)]
+    )
+
+    pool = profiles.iloc[picks].reset_index(drop=True)
+    pool['Person First Name'] = first
+    pool['Person Last Name'] = [f'{name} #{i}' for i, name in enumerate(last)]
+    pool['Person'] = pool['Person First Name'] + ' ' + pool['Person Last Name']
+    pool['Nationality'] = nationality
+    pool['Person/Team'] = pool['Person'] + ' (' + pool['Nationality'] + ')'
+    return pool
+
+def season_variants(templates):
+    """Date, Year, Age and Age (days) of every template row moved back 0..3 seasons
+
+    Returned arrays are indexed [shift, template row], so generating rows is
+    plain fancy indexing instead of per-chunk date parsing and formatting.
+    """
+    dates = pd.to_datetime(templates['Date'], format=DATE_FORMAT, errors='coerce')
+    ages = pd.to_numeric(templates['Age'], errors='coerce')
+    age_parts = templates['Age (days)'].astype(str).str.extract(r'^(\d+)-(\d+)$')
+    age_years = pd.to_numeric(age_parts[0], errors='coerce')
+
+    variants = {column: [] for column in ('Date', 'Year', 'Age', 'Age (days)')}
+    for years in range(len(SEASON_SHIFT_WEIGHTS)):
+        # 52 weeks per season keeps weekends on weekends
+        shifted = dates - pd.Timedelta(days=364 * years)
+        variants['Date'].append(shifted.dt.strftime(DATE_FORMAT).to_numpy(dtype=object))
+        variants['Year'].append(shifted.dt.year.fillna(templates['Year']).astype(int).to_numpy())
+        shifted_ages = ages - years
+        variants['Age'].append(shifted_ages.where(shifted_ages > 0).to_numpy())
+        shifted_years = age_years - years
+        valid = shifted_years > 0
+        variants['Age (days)'].append(
+            (shifted_years[valid].astype(int).astype(str) + '-' + age_parts.loc[valid, 1])
+            .reindex(templates.index).to_numpy(dtype=object)
+        )
+    return {column: np.stack(arrays) for column, arrays in variants.items()}
+
+def iter_synthetic_results(n_rows, seed=0, chunk_rows=500_000, swiss_share=1.0, templates=None):
+    """Yield synthetic raw result chunks totalling n_rows rows
+
+    The athlete pool is fixed up front (about as many results per athlete as
+    in the real file), so chunks can be streamed to disk for 10⁷ rows.
+    """
+    templates = load_templates() if templates is None else templates
+    rows_per_athlete = len(templates) / templates['Person'].nunique()
+    n_athletes = max(1, int(round(n_rows / rows_per_athlete)))
+    pool = athlete_pool(templates, n_athletes, swiss_share=swiss_share, seed=seed)
+
+    # Template rows per athlete profile, so event gender matches the athlete
+    profile_rows = templates.groupby(['Sport', 'PersonGender'], sort=False).indices
+    pool_profiles = pool.groupby(['Sport', 'PersonGender'], sort=False).ngroup().to_numpy()
+    profile_keys = list(pool.groupby(['Sport', 'PersonGender'], sort=False).groups)
+    ranks = templates['Rank'].to_numpy()
+    variants = season_variants(templates)
+
+    rng = np.random.default_rng(seed + 1)
+    for start in range(0, n_rows, chunk_rows):
+        size = min(chunk_rows, n_rows - start)
+        athletes = rng.integers(0, n_athletes, size)
+
+        # Event template and rank, both drawn from the athlete's sport and gender
+        template_index = np.empty(size, dtype=np.intp)
+        rank_index = np.empty(size, dtype=np.intp)
+        athlete_profiles = pool_profiles[athletes]
+        for profile, key in enumerate(profile_keys):
+            positions = profile_rows[key]
+            selected = np.flatnonzero(athlete_profiles == profile)
+            template_index[selected] = positions[rng.integers(0, len(positions), len(selected))]
+            rank_index[selected] = positions[rng.integers(0, len(positions), len(selected))]
+
+        chunk = templates.iloc[template_index].reset_index(drop=True)
+        people = pool.iloc[athletes].reset_index(drop=True)
+        for column in PERSON_COLUMNS:
+            chunk[column] = people[column]
+        chunk['Country Code'] = chunk['Nationality']
+        chunk['Rank'] = ranks[rank_index]
+
+        # Move results back whole seasons, keeping Year and ages consistent
+        shifts = rng.choice(len(SEASON_SHIFT_WEIGHTS), size=size, p=SEASON_SHIFT_WEIGHTS)
+        for column, values in variants.items():
+            chunk[column] = values[shifts, template_index]
+        yield chunk
+
+def generate_results(n_rows, seed=0, swiss_share=1.0):
+    """Synthetic raw results as one DataFrame; use iter_synthetic_results for very large sets"""
+    return pd.concat(list(iter_synthetic_results(n_rows, seed=seed, swiss_share=swiss_share)), ignore_index=True)
+
+def write_results_csv(chunks, path):
+    """Write raw result chunks in the export's format (';'-separated, quoted, NA, BOM)"""
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    rows = 0
+    with open(path, 'w', encoding='utf-8-sig', newline='') as handle:
+        for number, chunk in enumerate(chunks):
+            chunk.to_csv(handle, sep=';', index=False, header=number == 0,
+                         quoting=csv.QUOTE_NONNUMERIC, na_rep='NA')
+            rows += len(chunk)
+    return rows